@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""Sweep of containers not used by any level."""
+import bisect
+import collections
+import logging
+import os
+
+import unreal  # noqa
+
+from .pipeline import AYON_ROOT_DIR, LEVEL_CLASS_NAMES, ReferencerCache
+
+logger = logging.getLogger("ayon_core.hosts.unreal")
+
+
+def _format_size(size):
+    size = float(size)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} GB"
+
+
+def get_directory_size(directory):
+    """Get size of content directory on disk.
+
+    Args:
+        directory (str): Content directory, like `/Game/Ayon/Foo`.
+
+    Returns:
+        int: Size of all files in the directory in bytes.
+
+    """
+    if not directory.startswith("/Game/"):
+        return 0
+    content_dir = unreal.Paths.convert_relative_path_to_full(
+        unreal.Paths.project_content_dir())
+    root = os.path.join(content_dir, directory[len("/Game/"):])
+    size = 0
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                size += os.path.getsize(os.path.join(dirpath, filename))
+            except OSError:
+                continue
+    return size
+
+
+class SweepReport:
+    """Result of unused container sweep.
+
+    Attributes:
+        unused (list[dict]): Containers not referenced by any level.
+        used (list[dict]): Containers referenced by a level.
+        sizes (dict[str, int]): Size on disk of unused containers by
+            their namespace.
+
+    """
+
+    def __init__(self):
+        self.unused = []
+        self.used = []
+        self.sizes = {}
+
+    @property
+    def reclaimable_size(self):
+        """int: Size on disk of all unused containers in bytes."""
+        return sum(self.sizes.values())
+
+    def format(self, max_items=20):
+        """Format report for user.
+
+        Args:
+            max_items (int): Maximum number of listed containers.
+
+        Returns:
+            str: Human readable report.
+
+        """
+        lines = [
+            f"{len(self.unused)} of {len(self.unused) + len(self.used)} "
+            f"containers are not used in any level, "
+            f"{_format_size(self.reclaimable_size)} can be reclaimed."
+        ]
+        for container in self.unused[:max_items]:
+            namespace = container["namespace"]
+            lines.append(
+                f"  {namespace} ({_format_size(self.sizes[namespace])})")
+        if len(self.unused) > max_items:
+            lines.append(f"  ... and {len(self.unused) - max_items} more")
+        return "\n".join(lines)
+
+
+class UnusedContainerSweep:
+    """Find containers not referenced by any level.
+
+    Only packages of checked containers are listed, with one Asset
+    Registry query per sweep. Their referencers are then followed
+    transitively, so assets used by a level through other assets, like
+    a material of a mesh placed in the level, are used too.
+
+    Referencer map is built once per sweep: every package is queried for
+    its referencers at most once and levels are resolved from the map in
+    memory, also for containers checked later by `is_used`. Classes of
+    referencers are resolved in one query per depth of the walk.
+
+    Args:
+        root (str): Root directory of swept containers.
+        referencer_cache (Optional[ReferencerCache]): Cache of referencers.
+
+    """
+
+    def __init__(self, root=AYON_ROOT_DIR, referencer_cache=None):
+        self.root = root
+        self._cache = referencer_cache or ReferencerCache()
+        self._packages = []
+        self._namespaces = set()
+        self._used_packages = set()
+        # referencer map of walked packages, inverted for walk from levels
+        self._references_by_referencer = collections.defaultdict(set)
+        self._levels = set()
+        self._visited = set()
+
+    def _walk(self, packages):
+        """Add referencers of packages to map until levels are reached."""
+        pending = set(packages) - self._visited
+        self._visited.update(pending)
+        while pending:
+            referencers_by_package = self._cache.get_referencer_map(pending)
+            class_names = self._cache.get_class_names(
+                set().union(*referencers_by_package.values()))
+            pending = set()
+            for package_name, refs in referencers_by_package.items():
+                for ref in refs:
+                    self._references_by_referencer[ref].add(package_name)
+                    if class_names[ref] & LEVEL_CLASS_NAMES:
+                        self._levels.add(ref)
+                    elif ref not in self._visited:
+                        self._visited.add(ref)
+                        pending.add(ref)
+
+    def _build(self, containers):
+        namespaces = {
+            container["namespace"] for container in containers
+            if container["namespace"].startswith(f"{self.root}/")
+        } - self._namespaces
+        if not namespaces:
+            return
+        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        assets = ar.get_assets(unreal.ARFilter(
+            package_paths=sorted(namespaces), recursive_paths=True))
+        self._cache.add_assets(assets)
+        packages = {str(asset.package_name) for asset in assets}
+        self._walk(packages)
+
+        # everything a level references directly or through other
+        # packages is used
+        used = set()
+        stack = list(self._levels)
+        while stack:
+            for package_name in self._references_by_referencer[stack.pop()]:
+                if package_name not in used:
+                    used.add(package_name)
+                    stack.append(package_name)
+
+        self._used_packages.update(used & packages)
+        self._packages = sorted(packages.union(self._packages))
+        self._namespaces.update(namespaces)
+        logger.debug(
+            f"Swept {len(packages)} packages of {len(namespaces)} "
+            f"containers, {len(used & packages)} used by levels.")
+
+    def _packages_in(self, directory):
+        prefix = f"{directory.rstrip('/')}/"
+        start = bisect.bisect_left(self._packages, prefix)
+        for package_name in self._packages[start:]:
+            if not package_name.startswith(prefix):
+                break
+            yield package_name
+
+    def is_used(self, container):
+        """Check if any asset of container is referenced by a level.
+
+        Args:
+            container (dict): Container data.
+
+        Returns:
+            bool: Container is used, containers outside of the root are
+                always considered used.
+
+        """
+        if not container["namespace"].startswith(f"{self.root}/"):
+            # not covered by the sweep, never delete it
+            return True
+        self._build([container])
+        return any(
+            package_name in self._used_packages
+            for package_name in self._packages_in(container["namespace"])
+        )
+
+    def sweep(self, containers):
+        """Sort containers to used and unused ones.
+
+        Args:
+            containers (Iterable[dict]): Containers to check.
+
+        Returns:
+            SweepReport: Dry-run report, nothing is deleted.
+
+        """
+        containers = list(containers)
+        self._build(containers)
+        report = SweepReport()
+        for container in containers:
+            if self.is_used(container):
+                report.used.append(container)
+                continue
+            report.unused.append(container)
+            namespace = container["namespace"]
+            report.sizes[namespace] = get_directory_size(namespace)
+        return report
+
+    def delete(self, report):
+        """Delete unused containers of report.
+
+        Args:
+            report (SweepReport): Report of the sweep.
+
+        """
+        for container in report.unused:
+            namespace = container["namespace"]
+            unreal.log(f"Deleting unused container {namespace}...")
+            unreal.EditorAssetLibrary.delete_directory(namespace)
+        # graph doesn't reflect deleted assets anymore
+        self._packages = []
+        self._namespaces = set()
+        self._used_packages = set()
+        self._references_by_referencer = collections.defaultdict(set)
+        self._levels = set()
+        self._visited = set()
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Cached dependency analysis of Unreal packages.
+
+`ValidateNoDependencies` is the only publish plugin querying package
+dependencies, other plugins which come to need them should get them from
+:func:`get_dependency_analyzer` to share its cache.
+"""
+import unreal  # noqa
+
+DEPENDENCY_ANALYZER_KEY = "unrealDependencyAnalyzer"
+
+
+def _get_dependency_options(hard=True, soft=False):
+    return unreal.AssetRegistryDependencyOptions(
+        include_soft_package_references=soft,
+        include_hard_package_references=hard,
+        include_searchable_names=False,
+        include_soft_management_references=False,
+        include_hard_management_references=False
+    )
+
+
+def to_package_name(path):
+    """Get package name from object path or package name.
+
+    Args:
+        path (str): Object path, like `/Game/Foo/Bar.Bar`, or package name.
+
+    Returns:
+        str: Package name, like `/Game/Foo/Bar`.
+
+    """
+    return str(path).split(".")[0]
+
+
+class DependencyResult:
+    """Result of dependency analysis.
+
+    Attributes:
+        direct (dict[str, list[str]]): Direct dependencies by analyzed
+            package name.
+        transitive (dict[str, list[str]]): All dependencies reachable from
+            analyzed package name, empty if transitive closure was not
+            requested.
+        cycles (list[list[str]]): Dependency cycles found during
+            transitive analysis, each cycle starts and ends with the same
+            package.
+
+    """
+
+    def __init__(self):
+        self.direct = {}
+        self.transitive = {}
+        self.cycles = []
+
+    @property
+    def dependencies(self):
+        """list[str]: All found dependencies, sorted."""
+        source = self.transitive or self.direct
+        output = set()
+        for dependencies in source.values():
+            output.update(dependencies)
+        return sorted(output)
+
+    def __bool__(self):
+        return bool(self.dependencies)
+
+
+class DependencyAnalyzer:
+    """Memoized analysis of package dependencies.
+
+    Dependencies of every package are queried from Asset Registry only
+    once for the lifetime of the analyzer, which is meant to be one
+    publish session (see :func:`get_dependency_analyzer`).
+
+    Args:
+        hard (bool): Include hard package references.
+        soft (bool): Include soft package references.
+
+    """
+
+    def __init__(self, hard=True, soft=False):
+        self._ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        self._options = _get_dependency_options(hard=hard, soft=soft)
+        self._dependencies = {}
+
+    def get_dependencies(self, package_name):
+        """Get direct dependencies of package.
+
+        Args:
+            package_name (str): Package name or object path.
+
+        Returns:
+            list[str]: Package names of dependencies.
+
+        """
+        package_name = to_package_name(package_name)
+        dependencies = self._dependencies.get(package_name)
+        if dependencies is None:
+            dependencies = [
+                str(dep)
+                for dep in self._ar.get_dependencies(
+                    package_name, self._options) or []
+            ]
+            self._dependencies[package_name] = dependencies
+        return list(dependencies)
+
+    def analyze(self, paths, transitive=False, root="/Game/"):
+        """Analyze dependencies of packages.
+
+        Args:
+            paths (Iterable[str]): Package names or object paths.
+            transitive (bool): Resolve dependencies of dependencies.
+            root (Optional[str]): Only dependencies starting with root are
+                reported and followed. All dependencies if None.
+
+        Returns:
+            DependencyResult: Result of analysis.
+
+        """
+        result = DependencyResult()
+        package_names = list(dict.fromkeys(
+            to_package_name(path) for path in paths))
+
+        def _filtered(package_name):
+            return [
+                dep for dep in self.get_dependencies(package_name)
+                if root is None or dep.startswith(root)
+            ]
+
+        for package_name in package_names:
+            result.direct[package_name] = _filtered(package_name)
+
+        if not transitive:
+            return result
+
+        cycles = set()
+        for package_name in package_names:
+            result.transitive[package_name] = self._walk(
+                package_name, _filtered, result.cycles, cycles)
+        return result
+
+    @staticmethod
+    def _walk(package_name, get_dependencies, cycles, found_cycles):
+        """Iterative depth-first walk collecting reachable packages."""
+        reachable = []
+        visited = {package_name}
+        # stack of (package, iterator of its dependencies)
+        path = [package_name]
+        stack = [iter(get_dependencies(package_name))]
+        while stack:
+            dependency = next(stack[-1], None)
+            if dependency is None:
+                stack.pop()
+                path.pop()
+                continue
+            if dependency in path:
+                cycle = path[path.index(dependency):] + [dependency]
+                key = frozenset(cycle)
+                if key not in found_cycles:
+                    found_cycles.add(key)
+                    cycles.append(cycle)
+                continue
+            if dependency in visited:
+                continue
+            visited.add(dependency)
+            reachable.append(dependency)
+            path.append(dependency)
+            stack.append(iter(get_dependencies(dependency)))
+        return reachable
+
+
+def get_dependency_analyzer(context):
+    """Get dependency analyzer shared by plugins of publish session.
+
+    Analyzer is stored in the context, so all plugins of the session
+    reuse dependencies already queried by earlier plugins.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        DependencyAnalyzer: Dependency analyzer.
+
+    """
+    analyzer = context.data.get(DEPENDENCY_ANALYZER_KEY)
+    if analyzer is None:
+        analyzer = DependencyAnalyzer()
+        context.data[DEPENDENCY_ANALYZER_KEY] = analyzer
+    return analyzer
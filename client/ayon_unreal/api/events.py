@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""Asset Registry events used to keep AYON caches coherent."""
+import logging
+import time
+
+import unreal  # noqa
+
+logger = logging.getLogger("ayon_core.hosts.unreal")
+
+
+def get_asset_class_name(asset_data):
+    """Get class name of asset from its asset data.
+
+    Args:
+        asset_data (unreal.AssetData): Asset data.
+
+    Returns:
+        str: Class name, like `StaticMesh`.
+
+    """
+    # UE 5.1 replaced `asset_class` with `asset_class_path`
+    class_path = getattr(asset_data, "asset_class_path", None)
+    if class_path is not None:
+        return str(class_path.asset_name)
+    return str(asset_data.asset_class)
+
+
+class AssetRegistryChanges:
+    """Batch of Asset Registry changes.
+
+    Attributes:
+        added (dict[str, str]): Class names of added assets by package name.
+        removed (dict[str, str]): Class names of removed assets by package
+            name.
+        updated (dict[str, str]): Class names of updated assets by package
+            name.
+        renamed (dict[str, str]): New package names by old package names.
+
+    """
+
+    def __init__(self):
+        self.added = {}
+        self.removed = {}
+        self.updated = {}
+        self.renamed = {}
+        self._class_names = set()
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.updated or self.renamed)
+
+    def __repr__(self):
+        return (
+            f"<AssetRegistryChanges added={len(self.added)} "
+            f"removed={len(self.removed)} updated={len(self.updated)} "
+            f"renamed={len(self.renamed)}>"
+        )
+
+    @property
+    def class_names(self):
+        """set[str]: Class names of all changed assets."""
+        return set(self._class_names)
+
+    @property
+    def package_names(self):
+        """set[str]: Package names of all changed assets."""
+        package_names = set(self.added)
+        package_names.update(self.removed)
+        package_names.update(self.updated)
+        package_names.update(self.renamed)
+        package_names.update(self.renamed.values())
+        return package_names
+
+    def add(self, kind, asset_data, old_path=None):
+        path = str(asset_data.package_name)
+        class_name = get_asset_class_name(asset_data)
+        self._class_names.add(class_name)
+        if kind == "added":
+            self.removed.pop(path, None)
+            self.added[path] = class_name
+        elif kind == "removed":
+            # asset added and removed in the same batch never existed
+            if self.added.pop(path, None) is None:
+                self.removed[path] = class_name
+            self.updated.pop(path, None)
+        elif kind == "updated":
+            if path not in self.added:
+                self.updated[path] = class_name
+        elif kind == "renamed":
+            old_package_name = str(old_path).split(".")[0]
+            self.renamed[old_package_name] = path
+
+
+class AssetRegistryEventBus:
+    """Invalidation bus fed by Asset Registry delegates.
+
+    Changes reported by Asset Registry are collected and passed to
+    subscribers in batches once no new change arrived for `debounce`
+    seconds (but at least every `max_delay` seconds), so bulk import
+    produces one batch instead of thousands of events.
+
+    Subscribers are called with :class:`AssetRegistryChanges`. Bus is
+    fed only when :meth:`register_delegates` could connect to the engine,
+    otherwise :attr:`is_active` is False and caches must not rely on it.
+
+    Args:
+        debounce (float): Quiet period in seconds before batch is sent.
+        max_delay (float): Maximum delay of batch in seconds.
+
+    """
+
+    def __init__(self, debounce=0.5, max_delay=5.0):
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self._subscribers = []
+        self._pending = AssetRegistryChanges()
+        self._first_event_time = None
+        self._last_event_time = None
+        self._delegates = []
+        self._tick_handle = None
+
+    @property
+    def is_active(self):
+        """bool: Asset Registry delegates are connected."""
+        return bool(self._delegates)
+
+    def subscribe(self, callback):
+        """Subscribe callback to batches of changes.
+
+        Args:
+            callback (Callable[[AssetRegistryChanges], None]): Callback.
+
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _push(self, kind, asset_data, old_path=None):
+        now = time.monotonic()
+        if self._first_event_time is None:
+            self._first_event_time = now
+        self._last_event_time = now
+        self._pending.add(kind, asset_data, old_path)
+
+    def _on_asset_added(self, asset_data):
+        self._push("added", asset_data)
+
+    def _on_asset_removed(self, asset_data):
+        self._push("removed", asset_data)
+
+    def _on_asset_updated(self, asset_data):
+        self._push("updated", asset_data)
+
+    def _on_asset_renamed(self, asset_data, old_object_path):
+        self._push("renamed", asset_data, old_object_path)
+
+    def flush(self):
+        """Send pending changes to subscribers right away."""
+        changes = self._pending
+        self._pending = AssetRegistryChanges()
+        self._first_event_time = None
+        self._last_event_time = None
+        if not changes:
+            return
+        for callback in list(self._subscribers):
+            try:
+                callback(changes)
+            except Exception:  # noqa
+                logger.warning(
+                    f"Failed to process {changes} in {callback}.",
+                    exc_info=True)
+
+    def _on_tick(self, _delta_seconds):
+        if self._last_event_time is None:
+            return
+        now = time.monotonic()
+        if (
+            now - self._last_event_time >= self.debounce
+            or now - self._first_event_time >= self.max_delay
+        ):
+            self.flush()
+
+    def register_delegates(self):
+        """Connect to Asset Registry delegates.
+
+        Editor builds expose `on_asset_added`, `on_asset_removed`,
+        `on_asset_renamed` and `on_asset_updated` to Python only in some
+        engine versions and configurations, so each of them is looked up
+        on the Asset Registry before anything is connected. Missing any of
+        them would leave caches stale, so then none is connected and
+        :attr:`is_active` stays False.
+
+        Without delegates caches are not event driven: the container index
+        is rebuilt by one Asset Registry query on every use and the asset
+        name index once per load session.
+
+        Returns:
+            bool: True if delegates are available in this engine version.
+
+        """
+        if self._delegates:
+            return True
+        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        delegates = (
+            ("on_asset_added", self._on_asset_added),
+            ("on_asset_removed", self._on_asset_removed),
+            ("on_asset_renamed", self._on_asset_renamed),
+            ("on_asset_updated", self._on_asset_updated),
+        )
+        missing = [name for name, _ in delegates if not hasattr(ar, name)]
+        if missing:
+            logger.warning(
+                f"Asset Registry delegates {', '.join(missing)} are not "
+                "available, AYON container index will be rebuilt on every "
+                "use and asset name index once per load.")
+            return False
+        connected = []
+        for name, callback in delegates:
+            delegate = getattr(ar, name)
+            delegate.add_callable(callback)
+            connected.append((delegate, callback))
+        self._delegates = connected
+        return True
+
+    def unregister_delegates(self):
+        for delegate, callback in self._delegates:
+            delegate.remove_callable(callback)
+        self._delegates = []
+
+    def register_tick(self):
+        """Register tick callback sending debounced batches."""
+        if self._tick_handle is None:
+            self._tick_handle = unreal.register_slate_post_tick_callback(
+                self._on_tick)
+
+    def unregister_tick(self):
+        if self._tick_handle is not None:
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+
+
+_event_bus = None
+
+
+def get_event_bus():
+    """Get Asset Registry event bus.
+
+    Returns:
+        AssetRegistryEventBus: Event bus.
+
+    """
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = AssetRegistryEventBus()
+    return _event_bus
@@ -0,0 +1,350 @@
+# -*- coding: utf-8 -*-
+"""Batched import of asset import tasks.
+
+Loaders hand their `AssetImportTask` objects to :func:`import_tasks`
+instead of calling `import_asset_tasks()` themselves. Outside of
+:func:`batch_import` tasks are imported right away. Inside of it tasks
+are queued and imported at the end of the outermost batch with one
+`import_asset_tasks()` call per importer type, then the callbacks given
+with the tasks run in order the tasks were queued, so loaders can
+containerise and imprint what was imported. Loads deferred this way
+return list with their container only and their full result is given
+by the batch once it is executed.
+
+Containers keep hash of the imported source file in `source_hash` key,
+so an update to representation with the same file content, like a
+republished hero version, can retarget the container to the new
+representation instead of importing the file again.
+"""
+import collections
+import logging
+import os
+from contextlib import contextmanager
+
+import unreal  # noqa
+
+from ayon_unreal.api.prefetch import get_source_path, hash_file
+from ayon_unreal.api.session import get_active_session
+
+logger = logging.getLogger("ayon_core.hosts.unreal")
+
+_import_batch = None
+_import_callbacks = []
+
+
+class ImportJob:
+    """Tasks imported together and callback run after their import.
+
+    Attributes:
+        tasks (list[unreal.AssetImportTask]): Import tasks.
+        done (bool): Tasks were imported and callback finished.
+        result (Any): Value returned by callback.
+
+    """
+
+    def __init__(self, tasks, on_imported=None):
+        self.tasks = tasks
+        self.done = False
+        self.result = None
+        self._on_imported = on_imported
+
+    def complete(self):
+        """Run callback of the job."""
+        if self._on_imported is not None:
+            self.result = self._on_imported()
+        self.done = True
+
+
+def get_importer_key(task):
+    """Get key of importer used for import task.
+
+    Tasks with the same key are imported by the same factory with options
+    of the same type, so they can be imported in one call.
+
+    Args:
+        task (unreal.AssetImportTask): Import task.
+
+    Returns:
+        tuple[str, str]: File extension and type of import options.
+
+    """
+    filename = str(task.get_editor_property("filename"))
+    options = task.get_editor_property("options")
+    return (
+        os.path.splitext(filename)[-1].lower(),
+        type(options).__name__ if options is not None else ""
+    )
+
+
+def _get_destination(task):
+    return (
+        str(task.get_editor_property("destination_path")).rstrip("/"),
+        str(task.get_editor_property("destination_name"))
+    )
+
+
+def _restore_source_paths(tasks):
+    """Record publish paths as sources of assets imported from local copies.
+
+    Reimport and source path checks must not depend on prefetch cache,
+    whose entries can be evicted.
+
+    Args:
+        tasks (list[unreal.AssetImportTask]): Imported tasks.
+
+    """
+    for task in tasks:
+        filename = str(task.get_editor_property("filename"))
+        source_path = get_source_path(filename)
+        if source_path == filename:
+            continue
+        for object_path in task.get_editor_property("imported_object_paths"):
+            asset = unreal.EditorAssetLibrary.load_asset(object_path)
+            try:
+                import_data = asset.get_editor_property("asset_import_data")
+            except Exception:
+                # asset class without import data
+                continue
+            if import_data is not None:
+                import_data.scripted_add_filename(source_path, 0, "")
+
+
+def register_import_callback(callback):
+    """Register callback called after each import.
+
+    Callback gets package names of imported assets, so caches built from
+    Asset Registry can stay current when its delegates are not available.
+
+    Args:
+        callback (Callable[[list[str]], None]): Callback.
+
+    """
+    if callback not in _import_callbacks:
+        _import_callbacks.append(callback)
+
+
+def deregister_import_callback(callback):
+    if callback in _import_callbacks:
+        _import_callbacks.remove(callback)
+
+
+def _get_imported_package_names(tasks):
+    return [
+        str(object_path).split(".")[0]
+        for task in tasks
+        for object_path in task.get_editor_property("imported_object_paths")
+    ]
+
+
+def _import(tasks):
+    if not tasks:
+        return
+    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks(tasks)
+    _restore_source_paths(tasks)
+    if _import_callbacks:
+        package_names = _get_imported_package_names(tasks)
+        for callback in list(_import_callbacks):
+            callback(package_names)
+
+
+class ImportBatch:
+    """Queue of import jobs executed together."""
+
+    def __init__(self):
+        self._jobs = []
+        self._destinations = set()
+        self._jobs_by_container = {}
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def add(self, job):
+        """Queue job.
+
+        Queue is executed first when one of job's tasks imports to the
+        same destination as a queued task, so later import sees the result
+        of the earlier one like it would without batching.
+
+        Args:
+            job (ImportJob): Job to queue.
+
+        """
+        destinations = {_get_destination(task) for task in job.tasks}
+        if destinations & self._destinations:
+            self.execute()
+        self._destinations |= destinations
+        self._jobs.append(job)
+
+    def execute(self):
+        """Import queued tasks grouped by importer and complete the jobs."""
+        jobs, self._jobs = self._jobs, []
+        self._destinations = set()
+        if not jobs:
+            return
+
+        tasks_by_importer = collections.OrderedDict()
+        for job in jobs:
+            for task in job.tasks:
+                tasks_by_importer.setdefault(
+                    get_importer_key(task), []).append(task)
+        for (ext, options_type), tasks in tasks_by_importer.items():
+            logger.debug(
+                f"Importing {len(tasks)} {ext} files "
+                f"({options_type or 'default options'}).")
+            _import(tasks)
+
+        for job in jobs:
+            job.complete()
+
+    def add_load(self, container_path, job):
+        """Register job finishing load of container.
+
+        Args:
+            container_path (str): Object path of the container.
+            job (ImportJob): Queued job.
+
+        """
+        self._jobs_by_container[container_path] = job
+
+    def get_result(self, value):
+        """Get full result of load run in the batch.
+
+        Args:
+            value (Any): Value returned by loader.
+
+        Returns:
+            Any: Result of the job finishing the load or the value.
+
+        """
+        if isinstance(value, list) and len(value) == 1:
+            job = self._jobs_by_container.get(value[0])
+            if job is not None and job.done:
+                return job.result
+        return value
+
+
+def import_tasks(tasks, on_imported=None):
+    """Import tasks, deferred to the end of the batch inside of one.
+
+    Tasks without callback are always imported right away, because their
+    caller expects imported assets once the function returns.
+
+    Args:
+        tasks (Iterable[Optional[unreal.AssetImportTask]]): Tasks to
+            import, None values are skipped.
+        on_imported (Optional[Callable[[], Any]]): Called after the tasks
+            are imported, its return value is stored as result of the job.
+
+    Returns:
+        ImportJob: Import job, done unless it was queued in a batch.
+
+    """
+    job = ImportJob([task for task in tasks if task is not None], on_imported)
+    if _import_batch is not None and on_imported is not None and job.tasks:
+        _import_batch.add(job)
+        return job
+
+    _import(job.tasks)
+    job.complete()
+    return job
+
+
+def get_load_result(job, container_path):
+    """Get value to return from loader for import job.
+
+    Deferred job cannot provide assets yet, so loader returns list with
+    the container only and the full result is available by
+    :meth:`ImportBatch.get_result` once the batch is executed.
+
+    Args:
+        job (ImportJob): Import job finishing the load.
+        container_path (str): Object path of the container.
+
+    Returns:
+        list[str]: Paths of loaded assets.
+
+    """
+    if job.done:
+        return job.result
+    _import_batch.add_load(container_path, job)
+    return [container_path]
+
+
+@contextmanager
+def batch_import():
+    """Import all tasks queued in the context in grouped calls.
+
+    Example:
+        >>> with batch_import() as batch:
+        ...     loaded = [load_container(loader, repre_id) for ...]
+        >>> results = [batch.get_result(value) for value in loaded]
+
+    Yields:
+        ImportBatch: Active import batch.
+
+    """
+    global _import_batch
+    if _import_batch is not None:
+        # nested batch, outermost one will import the tasks
+        yield _import_batch
+        return
+
+    batch = ImportBatch()
+    _import_batch = batch
+    try:
+        yield batch
+    finally:
+        _import_batch = None
+    batch.execute()
+
+
+def get_source_hash(path):
+    """Get hash of source file content.
+
+    File is read in chunks, so big caches are never held in memory. The
+    hash is memoized in active load session by publish path of the file,
+    its size and modification time, also when the path is a prefetched
+    local copy, which is read instead of the publish path.
+
+    Args:
+        path (str): Path to source file or its local copy.
+
+    Returns:
+        Optional[str]: SHA-256 hex digest, None when file can't be read.
+
+    """
+    source_path = get_source_path(path)
+    try:
+        stat = os.stat(source_path)
+    except OSError:
+        return None
+    return get_active_session().memoize(
+        ("source_hash", os.path.normpath(source_path), stat.st_size,
+         stat.st_mtime_ns),
+        lambda: hash_file(path)
+    )
+
+
+def is_source_imported(container, source_hash):
+    """Check whether container holds import of source with given hash.
+
+    Containers imprinted before hashes were recorded never match. Neither
+    do containers whose imported assets were deleted.
+
+    Args:
+        container (dict): Container data.
+        source_hash (Optional[str]): Hash from :func:`get_source_hash`.
+
+    Returns:
+        bool: Source is already imported in the container.
+
+    """
+    if not source_hash or container.get("source_hash") != source_hash:
+        return False
+    asset_dir = container["namespace"]
+    container_path = f"{asset_dir}/{container['objectName']}"
+    return any(
+        path.split(".")[0] != container_path
+        for path in unreal.EditorAssetLibrary.list_assets(
+            asset_dir, recursive=True, include_folder=False)
+    )
@@ -3,11 +3,12 @@ from ayon_core.pipeline import (
     get_current_project_name,
     get_representation_path
 )
+from ayon_unreal.api.importing import import_tasks
 from ayon_unreal.api.pipeline import (
     get_camera_tracks,
-    ls
+    get_container_index
 )
-from ayon_core.pipeline.context_tools import get_current_folder_entity
+from ayon_unreal.api.session import defer_save, get_active_session
 import ayon_api
 from pathlib import Path
 
@@ -151,16 +152,13 @@ def import_camera_to_level_sequence(sequence, parent_id, version_id,
 def remove_loaded_asset(container):
     # Check if the assets have been loaded by other layouts, and deletes
     # them if they haven't.
-    containers = ls()
-    layout_containers = [
-        c for c in containers
-        if (c.get('asset_name') != container.get('asset_name') and
-            c.get('family') == "layout")]
+    index = get_container_index()
 
-    for asset in eval(container.get('loaded_assets')):
+    for asset in container.get('loaded_assets', []):
         layouts = [
-            lc for lc in layout_containers
-            if asset in lc.get('loaded_assets')]
+            lc for lc in index.referencing_asset(asset)
+            if (lc.get('asset_name') != container.get('asset_name') and
+                lc.get('family') == "layout")]
 
         if not layouts:
             unreal.EditorAssetLibrary.delete_directory(str(Path(asset).parent))
@@ -186,7 +184,7 @@ def import_animation(
 
     anim_path = f"{asset_dir}/Animations/{anim_file_name}"
 
-    folder_entity = get_current_folder_entity()
+    folder_entity = get_active_session().get_current_folder_entity()
     # Import animation
     task = unreal.AssetImportTask()
     task.options = unreal.FbxImportUI()
@@ -231,7 +229,8 @@ def import_animation(
     task.options.anim_sequence_import_data.set_editor_property(
         'convert_scene', True)
 
-    unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+    import_tasks([task])
+    defer_save(anim_path)
 
     asset_content = unreal.EditorAssetLibrary.list_assets(
         anim_path, recursive=False, include_folder=False
@@ -240,7 +239,6 @@ def import_animation(
     animation = None
 
     for a in asset_content:
-        unreal.EditorAssetLibrary.save_asset(a)
         imported_asset_data = unreal.EditorAssetLibrary.find_asset_data(a)
         imported_asset = unreal.AssetRegistryHelpers.get_asset(
             imported_asset_data)
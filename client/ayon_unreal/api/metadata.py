@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+"""Codec for AYON metadata stored on Unreal assets.
+
+Unreal metadata tags can hold only strings. Strings are stored as they are
+so they stay readable in the editor and usable in Asset Registry queries.
+Other values are stored as JSON prefixed with schema version and type, for
+example `ayon:1:list:["/Game/Ayon/Foo"]`.
+
+Values imprinted by older versions with `str()` are still decoded for keys
+which held other values than strings, like `members` or `frameStart`. Values
+of other keys are left as strings, so a legacy name like `True` or `[v1]`
+is not mistaken for a literal.
+"""
+import ast
+import json
+from collections.abc import MutableMapping
+
+METADATA_SCHEMA_VERSION = 1
+METADATA_PREFIX = "ayon:"
+_VERSION_PREFIX = f"{METADATA_PREFIX}{METADATA_SCHEMA_VERSION}:"
+
+_TYPES_BY_NAME = {
+    "str": str,
+    "bool": bool,
+    "int": int,
+    "float": float,
+    "list": list,
+    "dict": dict,
+}
+_LEGACY_LITERAL_KEYS = {
+    "loaded_assets",
+    "creator_attributes",
+    "publish_attributes",
+    "members",
+    "families",
+    "active",
+}
+_LEGACY_INT_KEYS = {"frameStart", "frameEnd", "frame_start", "frame_end"}
+
+
+def encode_value(value):
+    """Encode value to metadata string.
+
+    Args:
+        value (Any): Value to encode.
+
+    Returns:
+        str: Encoded value.
+
+    """
+    # Unreal doesn't support NoneType in metadata values
+    if value is None:
+        return ""
+
+    if isinstance(value, str):
+        if value.startswith(METADATA_PREFIX):
+            # Escape strings that would be mistaken for encoded values
+            return f"{_VERSION_PREFIX}str:{json.dumps(value)}"
+        return value
+
+    if isinstance(value, tuple):
+        value = list(value)
+
+    type_name = type(value).__name__
+    if type_name not in _TYPES_BY_NAME:
+        return str(value)
+
+    try:
+        encoded = json.dumps(value, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return str(value)
+    return f"{_VERSION_PREFIX}{type_name}:{encoded}"
+
+
+def decode_value(value, key=None):
+    """Decode metadata string to value.
+
+    Args:
+        value (str): Metadata string.
+        key (Optional[str]): Metadata key, used to decode values imprinted
+            by older versions.
+
+    Returns:
+        Any: Decoded value.
+
+    """
+    value = str(value)
+    if not value.startswith(METADATA_PREFIX):
+        return _decode_legacy(value, key)
+
+    _, version, type_name, encoded = value.split(":", 3)
+    if int(version) > METADATA_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported metadata schema version {version}.")
+    decoded = json.loads(encoded)
+    value_type = _TYPES_BY_NAME.get(type_name)
+    if value_type is not None and not isinstance(decoded, value_type):
+        decoded = value_type(decoded)
+    return decoded
+
+
+def _decode_legacy(value, key):
+    """Decode value imprinted with `str()`."""
+    if key in _LEGACY_INT_KEYS:
+        try:
+            return int(value)
+        except ValueError:
+            return value
+
+    if key not in _LEGACY_LITERAL_KEYS:
+        return value
+
+    try:
+        decoded = ast.literal_eval(value)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return value
+    if isinstance(decoded, tuple):
+        decoded = list(decoded)
+    return decoded
+
+
+def encode_data(data):
+    """Encode all values of data.
+
+    Callable values are called first to support values evaluated
+    at imprint.
+
+    Args:
+        data (dict): Data to encode.
+
+    Returns:
+        dict[str, str]: Encoded data.
+
+    """
+    output = {}
+    for key, value in data.items():
+        if callable(value):
+            value = value()
+        output[str(key)] = encode_value(value)
+    return output
+
+
+def decode_data(data):
+    """Decode all values of metadata.
+
+    Args:
+        data (Mapping): Metadata, keys and values can be Unreal types.
+
+    Returns:
+        dict: Decoded data.
+
+    """
+    return {
+        str(key): decode_value(value, str(key))
+        for key, value in data.items()
+    }
+
+
+class LazyMetadata(MutableMapping):
+    """Mapping decoding metadata values on first access.
+
+    Values are decoded only when accessed and memoized, so callers that
+    need only few keys don't pay for decoding large values like
+    `loaded_assets` or `members`. Encoded data are never modified,
+    changes are kept on the mapping itself.
+
+    Args:
+        encoded (Mapping[str, str]): Encoded metadata.
+        values (Optional[dict]): Already decoded values, they take
+            precedence over encoded data.
+
+    """
+
+    __slots__ = ("_encoded", "_values", "_removed")
+
+    def __init__(self, encoded, values=None):
+        self._encoded = encoded
+        self._values = dict(values) if values else {}
+        self._removed = set()
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        if key in self._removed:
+            raise KeyError(key)
+        value = decode_value(self._encoded[key], key)
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+        self._removed.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._removed.add(key)
+
+    def __contains__(self, key):
+        return key in self._values or (
+            key in self._encoded and key not in self._removed)
+
+    def __iter__(self):
+        yield from self._values
+        for key in self._encoded:
+            if key not in self._values and key not in self._removed:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def copy(self):
+        """Get decoded copy of data.
+
+        Returns:
+            dict: Decoded data.
+
+        """
+        return dict(self)
@@ -3,6 +3,7 @@ import os
 import re
 import json
 import clique
+import collections
 import copy
 import logging
 from typing import List, Any
@@ -23,13 +24,33 @@ from ayon_core.pipeline import (
     AYON_CONTAINER_ID,
     get_current_project_name,
 )
-from ayon_core.lib import StringTemplate
 from ayon_core.pipeline.context_tools import (
     get_current_folder_entity
 )
 from ayon_core.tools.utils import host_tools
 from ayon_core.host import HostBase, ILoadHost, IPublishHost
 from ayon_unreal import UNREAL_ADDON_ROOT
+from ayon_unreal.lib import AYON_METADATA_KEYS_TAG
+
+from .events import get_asset_class_name, get_event_bus
+from .importing import (
+    deregister_import_callback,
+    register_import_callback,
+)
+from .session import get_active_session, get_load_session
+from .tracing import (
+    install_tracing,
+    uninstall_tracing,
+    register_publish_callbacks,
+    deregister_publish_callbacks,
+)
+from .metadata import (
+    LazyMetadata,
+    decode_data,
+    decode_value,
+    encode_data,
+    encode_value,
+)
 
 import unreal  # noqa
 
@@ -40,6 +61,8 @@ AYON_CONTAINERS = "AyonContainers"
 AYON_ROOT_DIR = "/Game/Ayon"
 AYON_ASSET_DIR = "/Game/Ayon/Assets"
 CONTEXT_CONTAINER = "Ayon/context.json"
+CONTAINER_CACHE_FILE = "Ayon/containers.json"
+AYON_CLASS_NAMES = {"AyonAssetContainer", "AyonPublishInstance"}
 UNREAL_VERSION = semver.VersionInfo(
     *os.getenv("AYON_UNREAL_VERSION").split(".")
 )
@@ -66,6 +89,103 @@ class UnrealHost(HostBase, ILoadHost, IPublishHost):
     def get_containers(self):
         return ls()
 
+    def get_containers_latest_state(self, use_cache=True):
+        """Get whether containers are loaded from the latest version.
+
+        All representation and version ids of containers are resolved with
+        one query per entity type. Result is cached until containers
+        change, which is tracked by generation of containers bumped by
+        Asset Registry events (see :func:`get_container_index`).
+
+        Hero versions are considered latest.
+
+        Args:
+            use_cache (bool): Use result cached for current containers.
+                Disable to see versions published since the last call.
+
+        Returns:
+            dict[str, bool]: Whether container is latest by container
+                path (`namespace/objectName`).
+
+        """
+        global _containers_latest_state
+        container_index = get_container_index()
+        project_name = get_current_project_name()
+        cache_key = (project_name, _container_generation)
+        if (
+            use_cache
+            and get_event_bus().is_active
+            and _containers_latest_state is not None
+            and _containers_latest_state[0] == cache_key
+        ):
+            return dict(_containers_latest_state[1])
+
+        containers = list(container_index)
+        version_id_by_repre_id = {}
+        missing_repre_ids = {
+            str(container.get("representation"))
+            for container in containers
+            if not container.get("parent") and container.get("representation")
+        }
+        if missing_repre_ids:
+            version_id_by_repre_id = {
+                repre_entity["id"]: repre_entity["versionId"]
+                for repre_entity in ayon_api.get_representations(
+                    project_name,
+                    representation_ids=missing_repre_ids,
+                    fields={"id", "versionId"}
+                )
+            }
+
+        version_id_by_path = {}
+        for container in containers:
+            version_id = container.get("parent")
+            if not version_id:
+                version_id = version_id_by_repre_id.get(
+                    str(container.get("representation")))
+            path = f"{container.get('namespace')}/{container['objectName']}"
+            version_id_by_path[path] = (
+                str(version_id) if version_id else None)
+
+        version_ids = set(version_id_by_path.values())
+        version_ids.discard(None)
+        version_entities = {}
+        if version_ids:
+            version_entities = {
+                version_entity["id"]: version_entity
+                for version_entity in ayon_api.get_versions(
+                    project_name,
+                    version_ids=version_ids,
+                    fields={"id", "productId", "version"}
+                )
+            }
+
+        product_ids = {
+            version_entity["productId"]
+            for version_entity in version_entities.values()
+        }
+        last_versions = {}
+        if product_ids:
+            last_versions = ayon_api.get_last_versions(
+                project_name, product_ids, fields={"id", "productId"}
+            )
+
+        output = {}
+        for path, version_id in version_id_by_path.items():
+            version_entity = version_entities.get(version_id)
+            if version_entity is None:
+                output[path] = False
+                continue
+            if version_entity["version"] < 0:
+                output[path] = True
+                continue
+            last_version = last_versions.get(version_entity["productId"])
+            output[path] = bool(
+                last_version and last_version["id"] == version_id)
+
+        _containers_latest_state = (cache_key, output)
+        return dict(output)
+
     @staticmethod
     def show_tools_popup():
         """Show tools popup with actions leading to show other tools."""
@@ -133,6 +253,7 @@ def install():
     print("installing Ayon for Unreal ...")
     print("-=" * 40)
     logger.info("installing Ayon for Unreal")
+    install_tracing()
     pyblish.api.register_host("unreal")
     pyblish.api.register_plugin_path(str(PUBLISH_PATH))
     register_loader_plugin_path(str(LOAD_PATH))
@@ -140,6 +261,7 @@ def install():
     register_inventory_action_path(str(INVENTORY_PATH))
     _register_callbacks()
     _register_events()
+    register_publish_callbacks()
 
 
 def uninstall():
@@ -148,66 +270,680 @@ def uninstall():
     deregister_loader_plugin_path(str(LOAD_PATH))
     deregister_creator_plugin_path(str(CREATE_PATH))
     deregister_inventory_action_path(str(INVENTORY_PATH))
+    event_bus = get_event_bus()
+    event_bus.unregister_tick()
+    event_bus.unregister_delegates()
+    event_bus.unsubscribe(_on_asset_registry_changes)
+    deregister_import_callback(_on_assets_imported)
+    deregister_publish_callbacks()
+    uninstall_tracing()
 
 
 def _register_callbacks():
+    """Connect Asset Registry delegates to AYON event bus."""
+    event_bus = get_event_bus()
+    event_bus.subscribe(_on_asset_registry_changes)
+    event_bus.register_delegates()
+    register_import_callback(_on_assets_imported)
+
+
+def _register_events():
+    """Register tick sending debounced Asset Registry changes."""
+    get_event_bus().register_tick()
+
+
+def _on_asset_registry_changes(changes):
+    """Keep container and asset name indexes current.
+
+    Args:
+        changes (AssetRegistryChanges): Batch of changes.
+
     """
-    TODO: Implement callbacks if supported by UE
+    global _container_generation
+    if changes.class_names & AYON_CLASS_NAMES:
+        _container_generation += 1
+    if _asset_name_index is not None:
+        _asset_name_index.apply_changes(changes)
+
+
+def _on_assets_imported(package_names):
+    """Add imported assets to asset name index.
+
+    Args:
+        package_names (list[str]): Package names of imported assets.
+
     """
-    pass
+    if _asset_name_index is not None:
+        _asset_name_index.add_packages(package_names)
 
 
-def _register_events():
+def _get_ayon_class_name(name):
+    """Get class name of Ayon asset usable in Asset Registry queries."""
+    # UE 5.1 changed how class name is specified
+    if UNREAL_VERSION.major == 5 and UNREAL_VERSION.minor > 0:
+        return ["/Script/Ayon", name]
+    return name
+
+
+def _get_metadata_from_tags(asset_data):
+    """Read AYON metadata from Asset Registry tags of asset data.
+
+    Metadata are available as tags only if their keys are registered
+    in Asset Registry settings (see `ayon_unreal.lib.register_metadata_tags`)
+    and the asset has been saved since. Keys imprinted on the asset are
+    listed in `AYON_METADATA_KEYS_TAG`, metadata are returned only when
+    tags of all of them are available.
+
+    Args:
+        asset_data (unreal.AssetData): Asset data of Ayon asset.
+
+    Returns:
+        Optional[dict[str, str]]: Encoded metadata or None if AYON tags
+            are not available.
+
     """
-    TODO: Implement callbacks if supported by UE
+    get_tag_value = unreal.AssetRegistryHelpers.get_tag_value
+    keys = get_tag_value(asset_data, AYON_METADATA_KEYS_TAG)
+    if keys is None:
+        # imprinted by older version or the tag is not registered
+        return None
+    data = {}
+    for key in decode_value(keys) or []:
+        value = get_tag_value(asset_data, key)
+        if value is None:
+            # key is not registered as Asset Registry tag
+            return None
+        data[key] = str(value)
+    # `id` is imprinted on every container and instance
+    if "id" not in data:
+        return None
+    return data
+
+
+def _get_loaded_metadata(asset):
+    """Read AYON metadata of loaded asset.
+
+    Args:
+        asset (unreal.Object): Ayon asset.
+
+    Returns:
+        dict[str, str]: Encoded metadata.
+
+    """
+    data = cast_map_to_str_dict(
+        unreal.EditorAssetLibrary.get_metadata_tag_values(asset))
+    data.pop(AYON_METADATA_KEYS_TAG, None)
+    return data
+
+
+def _get_asset_metadata(asset_data, from_tags=True):
+    """Get AYON metadata of asset.
+
+    Args:
+        asset_data (unreal.AssetData): Asset data of Ayon asset.
+        from_tags (bool): Try to read metadata from Asset Registry tags
+            before loading the asset.
+
+    Returns:
+        tuple[dict[str, str], bool]: Encoded metadata and whether they
+            were resolved from tags.
+
+    """
+    data = _get_metadata_from_tags(asset_data) if from_tags else None
+    if data is not None:
+        return data, True
+    # get_tag_values() work only on metadata registered in
+    # Asset Registry Project settings, so we need to load
+    # the asset to get all metadata.
+    return _get_loaded_metadata(asset_data.get_asset()), False
+
+
+def _get_dirty_package_names():
+    """Get names of content packages with unsaved changes.
+
+    Returns:
+        set[str]: Package names, like `/Game/Ayon/Foo_CON`.
+
+    """
+    return {
+        package.get_name() for package in
+        unreal.EditorLoadingAndSavingUtils.get_dirty_content_packages()
+    }
+
+
+def _get_package_file(package_name):
+    """Get path to package file on disk.
+
+    Args:
+        package_name (str): Package name, like `/Game/Ayon/Foo_CON`.
+
+    Returns:
+        Optional[str]: Path to `.uasset` file, None for packages outside
+            of project content.
+
     """
-    pass
+    if not package_name.startswith("/Game/"):
+        return None
+    content_dir = unreal.Paths.convert_relative_path_to_full(
+        unreal.Paths.project_content_dir())
+    return os.path.join(
+        content_dir, f"{package_name[len('/Game/'):]}.uasset")
+
+
+class ContainerCache:
+    """Persistent cache of Ayon assets metadata.
+
+    Metadata are stored in compact JSON in project `Saved/Ayon` directory,
+    keyed by package name together with modification time and size of
+    the package file. On refresh only packages that changed since
+    the last refresh are resolved again, so listing cost scales with
+    number of changed containers, not the total.
 
+    Packages with unsaved changes are always resolved again by loading
+    the asset and never cached, neither their file on disk nor Asset
+    Registry tags match metadata in memory.
 
-def ls():
+    Args:
+        path (Optional[str]): Path to cache file. Defaults to
+            `CONTAINER_CACHE_FILE` in project `Saved` directory.
+
+    """
+    version = 3
+
+    def __init__(self, path=None):
+        if path is None:
+            saved_dir = unreal.Paths.convert_relative_path_to_full(
+                unreal.Paths.project_saved_dir())
+            path = os.path.join(saved_dir, CONTAINER_CACHE_FILE)
+        self.path = path
+        self._entries = None
+        self._dirty = False
+
+    def _load(self):
+        self._entries = {}
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r") as fp:
+                cache_data = json.load(fp)
+        except (IOError, ValueError):
+            logger.warning(
+                f"Failed to read container cache {self.path}. Rebuilding.")
+            return
+        if cache_data.get("version") != self.version:
+            return
+        self._entries = cache_data.get("entries", {})
+
+    def save(self):
+        """Write cache to disk if it changed."""
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as fp:
+            json.dump(
+                {"version": self.version, "entries": self._entries},
+                fp, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def clear(self):
+        """Drop all cached entries."""
+        self._entries = {}
+        self._dirty = True
+
+    def invalidate(self, package_name):
+        """Drop cached entry of package.
+
+        Args:
+            package_name (str): Package name, like `/Game/Ayon/Foo_CON`.
+
+        """
+        if self._entries is None:
+            self._load()
+        if self._entries.pop(package_name, None) is not None:
+            self._dirty = True
+
+    def refresh(self, class_name, from_tags=True):
+        """Refresh cached metadata of Ayon assets of given class.
+
+        Args:
+            class_name (str): Name of Ayon class.
+            from_tags (bool): Resolve changed assets from Asset Registry
+                tags when possible.
+
+        Returns:
+            list[tuple[dict[str, str], str]]: Encoded metadata and object
+                name of all assets of given class.
+
+        """
+        if self._entries is None:
+            self._load()
+
+        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        assets = ar.get_assets_by_class(
+            _get_ayon_class_name(class_name), True)
+
+        dirty_packages = _get_dirty_package_names()
+
+        result = []
+        seen = set()
+        stats = collections.Counter()
+        for asset_data in assets:
+            package_name = str(asset_data.package_name)
+            seen.add(package_name)
+
+            stat = None
+            package_file = _get_package_file(package_name)
+            if (
+                package_name not in dirty_packages
+                and package_file
+                and os.path.isfile(package_file)
+            ):
+                stat = os.stat(package_file)
+
+            entry = self._entries.get(package_name)
+            if (
+                entry is not None
+                and stat is not None
+                and entry["class"] == class_name
+                and entry["mtime"] == stat.st_mtime
+                and entry["size"] == stat.st_size
+            ):
+                stats["cached"] += 1
+                result.append((entry["data"], entry["name"]))
+                continue
+
+            data, resolved_from_tags = _get_asset_metadata(
+                asset_data,
+                from_tags=from_tags and package_name not in dirty_packages)
+            object_name = str(asset_data.asset_name)
+            stats["tags" if resolved_from_tags else "loaded"] += 1
+            result.append((data, object_name))
+
+            if stat is None:
+                # Unsaved or modified package, its file is not up to date
+                if self._entries.pop(package_name, None) is not None:
+                    self._dirty = True
+                continue
+            self._entries[package_name] = {
+                "class": class_name,
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "name": object_name,
+                "data": data,
+            }
+            self._dirty = True
+
+        removed = [
+            package_name
+            for package_name, entry in self._entries.items()
+            if entry["class"] == class_name and package_name not in seen
+        ]
+        for package_name in removed:
+            del self._entries[package_name]
+            self._dirty = True
+
+        self.save()
+
+        logger.debug(
+            f"Listed {class_name}: {stats['cached']} from cache, "
+            f"{stats['tags']} resolved from Asset Registry tags, "
+            f"{stats['loaded']} by loading the asset.")
+        return result
+
+
+_container_cache = None
+_container_index = None
+_container_generation = 0
+_containers_latest_state = None
+_asset_name_index = None
+
+
+def get_container_cache():
+    """Get persistent container cache of current project.
+
+    Returns:
+        ContainerCache: Container cache.
+
+    """
+    global _container_cache
+    if _container_cache is None:
+        _container_cache = ContainerCache()
+    return _container_cache
+
+
+def _ls_ayon_assets(
+    class_name, from_tags=True, use_cache=True, lazy=False
+):
+    """List metadata of all Ayon assets of given class.
+
+    Metadata are read from Asset Registry tags if possible, only assets
+    with missing tags are loaded to get their metadata.
+
+    Args:
+        class_name (str): Name of Ayon class.
+        from_tags (bool): Read metadata from Asset Registry tags. When
+            disabled, every changed asset is loaded.
+        use_cache (bool): Serve unchanged assets from persistent
+            container cache.
+        lazy (bool): Yield :class:`LazyMetadata` decoding values on first
+            access instead of dictionaries.
+
+    Yields:
+        Union[dict, LazyMetadata]: Metadata of the asset.
+
+    """
+    if use_cache:
+        items = get_container_cache().refresh(
+            class_name, from_tags=from_tags)
+    else:
+        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        assets = ar.get_assets_by_class(
+            _get_ayon_class_name(class_name), True)
+        dirty_packages = _get_dirty_package_names()
+        items = (
+            (
+                _get_asset_metadata(
+                    asset_data,
+                    from_tags=(
+                        from_tags
+                        and str(asset_data.package_name) not in dirty_packages
+                    )
+                )[0],
+                str(asset_data.asset_name)
+            )
+            for asset_data in assets
+        )
+
+    for raw_data, object_name in items:
+        if lazy:
+            # encoded data are shared with the cache, but never modified
+            yield LazyMetadata(raw_data, {"objectName": object_name})
+            continue
+        data = decode_data(raw_data)
+        data["objectName"] = object_name
+        yield data
+
+
+def ls(from_tags=True, use_cache=True, lazy=False):
     """List all containers.
 
     List all found in *Content Manager* of Unreal and return
     metadata from them. Adding `objectName` to set.
 
+    Args:
+        from_tags (bool): Read metadata from Asset Registry tags and load
+            only containers without them. If disabled, all containers
+            are loaded.
+        use_cache (bool): Serve containers that didn't change from
+            persistent container cache.
+        lazy (bool): Return mappings reading and decoding values only
+            when they are accessed.
+
     """
-    ar = unreal.AssetRegistryHelpers.get_asset_registry()
-    # UE 5.1 changed how class name is specified
-    class_name = ["/Script/Ayon", "AyonAssetContainer"] if UNREAL_VERSION.major == 5 and UNREAL_VERSION.minor > 0 else "AyonAssetContainer"  # noqa
-    ayon_containers = ar.get_assets_by_class(class_name, True)
+    yield from _ls_ayon_assets(
+        "AyonAssetContainer",
+        from_tags=from_tags,
+        use_cache=use_cache,
+        lazy=lazy
+    )
 
-    # get_asset_by_class returns AssetData. To get all metadata we need to
-    # load asset. get_tag_values() work only on metadata registered in
-    # Asset Registry Project settings (and there is no way to set it with
-    # python short of editing ini configuration file).
-    for asset_data in ayon_containers:
-        asset = asset_data.get_asset()
-        data = unreal.EditorAssetLibrary.get_metadata_tag_values(asset)
-        data["objectName"] = asset_data.asset_name
-        yield cast_map_to_str_dict(data)
 
+def ls_inst(from_tags=True, use_cache=True, lazy=False):
+    """List all publish instances.
 
-def ls_inst():
-    ar = unreal.AssetRegistryHelpers.get_asset_registry()
-    # UE 5.1 changed how class name is specified
-    class_name = [
-        "/Script/Ayon",
-        "AyonPublishInstance"
-    ] if (
-            UNREAL_VERSION.major == 5
-            and UNREAL_VERSION.minor > 0
-    ) else "AyonPublishInstance"  # noqa
-    instances = ar.get_assets_by_class(class_name, True)
-
-    # get_asset_by_class returns AssetData. To get all metadata we need to
-    # load asset. get_tag_values() work only on metadata registered in
-    # Asset Registry Project settings (and there is no way to set it with
-    # python short of editing ini configuration file).
-    for asset_data in instances:
-        asset = asset_data.get_asset()
-        data = unreal.EditorAssetLibrary.get_metadata_tag_values(asset)
-        data["objectName"] = asset_data.asset_name
-        yield cast_map_to_str_dict(data)
+    Args:
+        from_tags (bool): Read metadata from Asset Registry tags and load
+            only instances without them. If disabled, all instances
+            are loaded.
+        use_cache (bool): Serve instances that didn't change from
+            persistent container cache.
+        lazy (bool): Return mappings reading and decoding values only
+            when they are accessed.
+
+    """
+    yield from _ls_ayon_assets(
+        "AyonPublishInstance",
+        from_tags=from_tags,
+        use_cache=use_cache,
+        lazy=lazy
+    )
+
+
+class ContainerIndex:
+    """In-memory index of containers with secondary indexes.
+
+    Lookups by representation, product type (family), loader, version
+    (parent) and folder path take O(1), lookup of containers referencing
+    loaded asset takes O(k) where k is number of matching containers.
+
+    Args:
+        containers (Optional[Iterable[dict]]): Containers to index.
+            Defaults to all containers in the project listed by `ls()`.
+        generation (Optional[int]): Generation of containers the index
+            was built from.
+
+    """
+
+    def __init__(self, containers=None, generation=None):
+        if containers is None:
+            containers = ls()
+        self.generation = generation
+        self._containers = list(containers)
+        self._by_representation = collections.defaultdict(list)
+        self._by_family = collections.defaultdict(list)
+        self._by_loader = collections.defaultdict(list)
+        self._by_parent = collections.defaultdict(list)
+        self._by_folder = collections.defaultdict(list)
+        self._by_loaded_asset = collections.defaultdict(list)
+
+        for container in self._containers:
+            self._index(container)
+
+    def _index(self, container):
+        self._by_representation[
+            str(container.get("representation"))].append(container)
+        family = container.get("family") or container.get("product_type")
+        self._by_family[str(family)].append(container)
+        self._by_loader[str(container.get("loader"))].append(container)
+        self._by_parent[str(container.get("parent"))].append(container)
+        self._by_folder[str(container.get("folder_path"))].append(container)
+        for asset in container.get("loaded_assets") or []:
+            self._by_loaded_asset[str(asset)].append(container)
+
+    def add(self, container):
+        """Add container created after the index was built.
+
+        Args:
+            container (dict): Container data.
+
+        """
+        self._containers.append(container)
+        self._index(container)
+
+    def __iter__(self):
+        return iter(self._containers)
+
+    def __len__(self):
+        return len(self._containers)
+
+    def by_representation(self, representation_id):
+        """Get containers of given representation id."""
+        return list(self._by_representation.get(str(representation_id), []))
+
+    def by_family(self, family):
+        """Get containers of given product type."""
+        return list(self._by_family.get(family, []))
+
+    def by_loader(self, loader):
+        """Get containers loaded by loader of given name."""
+        return list(self._by_loader.get(loader, []))
+
+    def by_parent(self, version_id):
+        """Get containers of given version id."""
+        return list(self._by_parent.get(str(version_id), []))
+
+    def by_folder(self, folder_path):
+        """Get containers of given folder path."""
+        return list(self._by_folder.get(folder_path, []))
+
+    def referencing_asset(self, path):
+        """Get containers that have asset in their `loaded_assets`."""
+        return list(self._by_loaded_asset.get(str(path), []))
+
+
+def get_container_index():
+    """Get index of all containers in the project.
+
+    Index is cached until Asset Registry reports change of any container.
+    If Asset Registry delegates are not available, index is rebuilt
+    on every call.
+
+    Returns:
+        ContainerIndex: Container index.
+
+    """
+    global _container_index
+    event_bus = get_event_bus()
+    # Process changes made since last tick right away
+    event_bus.flush()
+    if (
+        not event_bus.is_active
+        or _container_index is None
+        or _container_index.generation != _container_generation
+    ):
+        _container_index = ContainerIndex(generation=_container_generation)
+    return _container_index
+
+
+class AssetNameIndex:
+    """Index of package names of assets by asset name.
+
+    Index is built from Asset Registry data without loading any asset
+    and is kept current by applying batches of Asset Registry changes.
+    Assets added later are indexed by short name of their package, which
+    is the asset name for all assets created by the editor.
+
+    Args:
+        root (str): Root path of indexed assets.
+
+    """
+
+    def __init__(self, root="/Game"):
+        self.root = root
+        self.session_id = None
+        self._packages_by_name = None
+
+    @property
+    def is_built(self):
+        return self._packages_by_name is not None
+
+    def build(self):
+        """Build index of all assets under the root."""
+        ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        packages_by_name = collections.defaultdict(dict)
+        for asset_data in ar.get_assets_by_path(self.root, recursive=True):
+            packages_by_name[str(asset_data.asset_name)][
+                str(asset_data.package_name)] = None
+        self._packages_by_name = packages_by_name
+
+    def invalidate(self):
+        """Drop index, it is built again on next use."""
+        self._packages_by_name = None
+
+    def _is_indexed(self, package_name):
+        return package_name.startswith(f"{self.root}/")
+
+    def _add(self, package_name):
+        if self._is_indexed(package_name):
+            name = package_name.rsplit("/", 1)[-1]
+            self._packages_by_name[name][package_name] = None
+
+    def _remove(self, package_name):
+        name = package_name.rsplit("/", 1)[-1]
+        packages = self._packages_by_name.get(name)
+        if packages is None:
+            # asset name differs from package name, find it the slow way
+            packages = next(
+                (
+                    packages
+                    for packages in self._packages_by_name.values()
+                    if package_name in packages
+                ),
+                {}
+            )
+        packages.pop(package_name, None)
+
+    def apply_changes(self, changes):
+        """Update index by batch of Asset Registry changes.
+
+        Args:
+            changes (AssetRegistryChanges): Batch of changes.
+
+        """
+        if not self.is_built:
+            return
+        for package_name in changes.removed:
+            self._remove(package_name)
+        for old_package_name, package_name in changes.renamed.items():
+            self._remove(old_package_name)
+            self._add(package_name)
+        for package_name in changes.added:
+            self._add(package_name)
+
+    def add_packages(self, package_names):
+        """Add created or imported packages to built index.
+
+        Args:
+            package_names (Iterable[str]): Package names.
+
+        """
+        if not self.is_built:
+            return
+        for package_name in package_names:
+            self._add(package_name)
+
+    def get_package_names(self, asset_name):
+        """Get package names of assets of given name.
+
+        Args:
+            asset_name (str): Asset name.
+
+        Returns:
+            list[str]: Package names.
+
+        """
+        if not self.is_built:
+            self.build()
+        return list(self._packages_by_name.get(str(asset_name), ()))
+
+
+def get_asset_name_index():
+    """Get index of assets in project by their name.
+
+    Index is updated from Asset Registry changes. If Asset Registry
+    delegates are not available, index is a snapshot rebuilt once per
+    load session, or on every call outside of loads, to which assets
+    imported in the session are added.
+
+    Returns:
+        AssetNameIndex: Asset name index.
+
+    """
+    global _asset_name_index
+    if _asset_name_index is None:
+        _asset_name_index = AssetNameIndex()
+    event_bus = get_event_bus()
+    # Process changes made since last tick right away
+    event_bus.flush()
+    if not event_bus.is_active:
+        session = get_load_session()
+        session_id = session.id if session is not None else None
+        if session_id is None or _asset_name_index.session_id != session_id:
+            _asset_name_index.invalidate()
+            _asset_name_index.session_id = session_id
+    return _asset_name_index
 
 
 def parse_container(container):
@@ -220,9 +956,8 @@ def parse_container(container):
         dict: metadata stored on container
     """
     asset = unreal.EditorAssetLibrary.load_asset(container)
-    data = unreal.EditorAssetLibrary.get_metadata_tag_values(asset)
+    data = decode_data(_get_loaded_metadata(asset))
     data["objectName"] = asset.get_name()
-    data = cast_map_to_str_dict(data)
 
     return data
 
@@ -309,23 +1044,89 @@ def instantiate(root, name, data, assets=None, suffix="_INS"):
     imprint(f"{path}/{container_name}", data)
 
 
+_imprinted_assets = None
+
+
+def _set_metadata(loaded_asset, data):
+    eal = unreal.EditorAssetLibrary
+    encoded = encode_data(data)
+    keys = decode_value(
+        eal.get_metadata_tag(loaded_asset, AYON_METADATA_KEYS_TAG)) or []
+    encoded[AYON_METADATA_KEYS_TAG] = encode_value(
+        sorted(set(keys).union(encoded)))
+    for key, value in encoded.items():
+        eal.set_metadata_tag(loaded_asset, key, value)
+
+
 def imprint(node, data):
+    """Imprint data as metadata on asset.
+
+    Inside of :func:`imprint_session` the asset is not saved right away,
+    but together with all other imprinted assets at the end of the session.
+
+    Args:
+        node (str): Path to asset.
+        data (dict): Data to imprint.
+
+    """
     loaded_asset = unreal.EditorAssetLibrary.load_asset(node)
-    for key, value in data.items():
-        # Support values evaluated at imprint
-        if callable(value):
-            value = value()
-        # Unreal doesn't support NoneType in metadata values
-        if value is None:
-            value = ""
-        unreal.EditorAssetLibrary.set_metadata_tag(
-            loaded_asset, key, str(value)
-        )
+    _set_metadata(loaded_asset, data)
+    if _container_cache is not None:
+        _container_cache.invalidate(node.partition(".")[0])
+
+    if _imprinted_assets is not None:
+        _imprinted_assets[node] = loaded_asset
+        return
 
     with unreal.ScopedEditorTransaction("Ayon containerising"):
         unreal.EditorAssetLibrary.save_asset(node)
 
 
+@contextmanager
+def imprint_session():
+    """Coalesce saving of all assets imprinted in the context.
+
+    Metadata are set immediately, but dirty packages are saved only once
+    at the end of the outermost session, in one transaction. Nothing is
+    saved when the context raises, so half-applied imprints are not
+    persisted.
+
+    Example:
+        >>> with imprint_session():
+        ...     for node, data in changes.items():
+        ...         imprint(node, data)
+
+    """
+    global _imprinted_assets
+    if _imprinted_assets is not None:
+        # nested session, outermost one will save the assets
+        yield
+        return
+
+    imprinted_assets = _imprinted_assets = {}
+    try:
+        yield
+    finally:
+        _imprinted_assets = None
+    assets = list(imprinted_assets.values())
+    if assets:
+        with unreal.ScopedEditorTransaction("Ayon containerising"):
+            unreal.EditorAssetLibrary.save_loaded_assets(
+                assets, only_if_is_dirty=True)
+
+
+def imprint_many(data_by_node):
+    """Imprint data on multiple assets and save them at once.
+
+    Args:
+        data_by_node (dict[str, dict]): Data to imprint by asset path.
+
+    """
+    with imprint_session():
+        for node, data in data_by_node.items():
+            imprint(node, data)
+
+
 def show_tools_popup():
     """Show popup with tools.
 
@@ -485,6 +1286,75 @@ def create_publish_instance(instance: str, path: str) -> unreal.Object:
     return tools.create_asset(instance, path, None, factory)
 
 
+def get_assets_by_object_paths(object_paths):
+    """Get Asset Registry data of assets in one query.
+
+    Args:
+        object_paths (Iterable[str]): Object paths of assets, like
+            `/Game/Foo/Bar.Bar`.
+
+    Returns:
+        dict[str, unreal.AssetData]: Asset data by object path in order of
+            `object_paths`, paths not found in Asset Registry are skipped.
+
+    """
+    object_paths = list(dict.fromkeys(str(path) for path in object_paths))
+    package_names = sorted({path.split(".")[0] for path in object_paths})
+    if not package_names:
+        return {}
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    found = {
+        f"{asset_data.package_name}.{asset_data.asset_name}": asset_data
+        for asset_data in ar.get_assets(
+            unreal.ARFilter(package_names=package_names))
+    }
+    return {path: found[path] for path in object_paths if path in found}
+
+
+def set_instance_members(pub_instance, members):
+    """Set external assets of publish instance.
+
+    Members are resolved in one Asset Registry query and written to the
+    instance in one property write.
+
+    Args:
+        pub_instance (unreal.AyonPublishInstance): Publish instance.
+        members (Iterable[str]): Object paths of member assets.
+
+    Returns:
+        list[str]: Object paths of members not found in Asset Registry.
+
+    """
+    members = [str(member) for member in members]
+    asset_data_by_path = get_assets_by_object_paths(members)
+    assets = unreal.Set(unreal.Object)
+    for asset_data in asset_data_by_path.values():
+        assets.add(asset_data.get_asset())
+    pub_instance.set_editor_property("asset_data_external", assets)
+    return [
+        member for member in members if member not in asset_data_by_path
+    ]
+
+
+def get_instance_members(pub_instance):
+    """Get object paths of external assets of publish instance.
+
+    Args:
+        pub_instance (unreal.AyonPublishInstance): Publish instance.
+
+    Returns:
+        Optional[list[str]]: Object paths of members, None if instance
+            doesn't include external assets.
+
+    """
+    if not pub_instance.get_editor_property("add_external_assets"):
+        return None
+    return [
+        asset.get_path_name()
+        for asset in pub_instance.get_editor_property("asset_data_external")
+    ]
+
+
 def cast_map_to_str_dict(umap) -> dict:
     """Cast Unreal Map to dict.
 
@@ -610,7 +1480,7 @@ def generate_sequence(h, h_dir):
     project_name = get_current_project_name()
     filtered_dir = "/Game/Ayon/"
     folder_path = h_dir.replace(filtered_dir, "")
-    folder_entity = ayon_api.get_folder_by_path(
+    folder_entity = get_active_session().get_folder_entity(
         project_name,
         folder_path,
         fields={
@@ -657,159 +1527,334 @@ def generate_sequence(h, h_dir):
     return sequence, (min_frame, max_frame)
 
 
+_COMMON_NAME_REGEX = re.compile(r"^(.*?)(\d+)(.*?)$")
+
+
 def find_common_name(asset_name):
     # Find the common prefix
-    prefix_match = re.match(r"^(.*?)(\d+)(.*?)$", asset_name)
+    prefix_match = _COMMON_NAME_REGEX.match(asset_name)
     if not prefix_match:
         return
     name, _, ext = prefix_match.groups()
     return f"{name}_{ext}"
 
 
-def _get_comps_and_assets(
-    component_class, asset_class, old_assets, new_assets, selected
-):
-    eas = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-
-    components = []
-    if selected:
-        sel_actors = eas.get_selected_level_actors()
-        for actor in sel_actors:
-            comps = actor.get_components_by_class(component_class)
-            components.extend(comps)
-    else:
-        comps = eas.get_all_level_actors_components()
-        components = [
-            c for c in comps if isinstance(c, component_class)
-        ]
+def _get_skeletal_mesh(component):
+    return component.get_skeletal_mesh_asset()
 
-    # Get all the static meshes among the old assets in a dictionary with
-    # the name as key
-    selected_old_assets = {}
-    for a in old_assets:
-        asset = unreal.EditorAssetLibrary.load_asset(a)
-        if isinstance(asset, asset_class):
-            asset_name = find_common_name(asset.get_name())
-            selected_old_assets[asset_name] = asset
 
-    # Get all the static meshes among the new assets in a dictionary with
-    # the name as key
-    selected_new_assets = {}
-    for a in new_assets:
-        asset = unreal.EditorAssetLibrary.load_asset(a)
-        if isinstance(asset, asset_class):
-            asset_name = find_common_name(asset.get_name())
-            selected_new_assets[asset_name] = asset
+def _get_static_mesh(component):
+    return component.get_editor_property("static_mesh")
 
-    return components, selected_old_assets, selected_new_assets
 
+def _get_geometry_cache(component):
+    return component.get_editor_property("geometry_cache")
 
-def replace_static_mesh_actors(old_assets, new_assets, selected):
-    smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
 
-    static_mesh_comps, old_meshes, new_meshes = _get_comps_and_assets(
-        unreal.StaticMeshComponent,
-        unreal.StaticMesh,
-        old_assets,
-        new_assets,
-        selected
-    )
-    unreal.log("static_mesh_comps")
-    unreal.log(static_mesh_comps)
+class LevelComponentIndex:
+    """Index of components in current level by path of their asset.
 
-    unreal.log("old_meshes")
-    unreal.log(old_meshes)
+    Index is built once from level components, so replacing assets of
+    many containers is a dictionary lookup per asset instead of a loop
+    over all components. Static mesh, skeletal mesh and geometry cache
+    components are indexed together, so one index serves all families.
 
-    unreal.log("new_meshes")
-    unreal.log(old_meshes)
+    Args:
+        selected (bool): Index only components of selected actors.
 
+    """
 
-    for old_name, old_mesh in old_meshes.items():
-        new_mesh = new_meshes.get(old_name)
+    # component class name, asset class name, asset getter
+    component_types = (
+        ("StaticMeshComponent", "StaticMesh", _get_static_mesh),
+        ("SkeletalMeshComponent", "SkeletalMesh", _get_skeletal_mesh),
+        ("GeometryCacheComponent", "GeometryCache", _get_geometry_cache),
+    )
 
-        if not new_mesh:
-            continue
+    def __init__(self, selected=False):
+        self.selected = selected
+        self._components = collections.defaultdict(list)
+
+        eas = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        if selected:
+            components = []
+            for actor in eas.get_selected_level_actors():
+                components.extend(
+                    actor.get_components_by_class(unreal.ActorComponent))
+        else:
+            components = eas.get_all_level_actors_components()
 
-        smes.replace_mesh_components_meshes(
-            static_mesh_comps, old_mesh, new_mesh)
+        component_types = [
+            (getattr(unreal, component_class), getter)
+            for component_class, _, getter in self.component_types
+        ]
+        for component in components:
+            for component_class, getter in component_types:
+                if not isinstance(component, component_class):
+                    continue
+                asset = getter(component)
+                if asset is not None:
+                    self._components[asset.get_path_name()].append(
+                        component)
+                break
 
+    def get_components(self, asset_path, component_class=None):
+        """Get components using asset.
 
-def replace_skeletal_mesh_actors(old_assets, new_assets, selected):
-    skeletal_mesh_comps, old_meshes, new_meshes = _get_comps_and_assets(
-        unreal.SkeletalMeshComponent,
-        unreal.SkeletalMesh,
-        old_assets,
-        new_assets,
-        selected
-    )
+        Args:
+            asset_path (str): Object path of the asset.
+            component_class (Optional[type]): Return only components of
+                this class.
 
-    for old_name, old_mesh in old_meshes.items():
-        new_mesh = new_meshes.get(old_name)
+        Returns:
+            list[unreal.ActorComponent]: Components.
 
-        if not new_mesh:
-            continue
+        """
+        components = self._components.get(str(asset_path), [])
+        if component_class is None:
+            return list(components)
+        return [c for c in components if isinstance(c, component_class)]
 
-        for comp in skeletal_mesh_comps:
-            if comp.get_skeletal_mesh_asset() == old_mesh:
-                comp.set_skeletal_mesh_asset(new_mesh)
+    def move(self, components, old_path, new_path):
+        """Update index after components switched to another asset.
 
+        Args:
+            components (list[unreal.ActorComponent]): Switched components.
+            old_path (str): Object path of previous asset.
+            new_path (str): Object path of new asset.
 
-def replace_geometry_cache_actors(old_assets, new_assets, selected):
-    geometry_cache_comps, old_caches, new_caches = _get_comps_and_assets(
-        unreal.GeometryCacheComponent,
-        unreal.GeometryCache,
-        old_assets,
-        new_assets,
-        selected
-    )
+        """
+        remaining = [
+            c for c in self._components.get(old_path, [])
+            if c not in components
+        ]
+        if remaining:
+            self._components[old_path] = remaining
+        else:
+            self._components.pop(old_path, None)
+        self._components[new_path].extend(components)
 
-    for old_name, old_mesh in old_caches.items():
-        new_mesh = new_caches.get(old_name)
 
-        if not new_mesh:
-            continue
+def _get_assets_by_common_name(asset_paths, class_name):
+    """Get object paths of assets of class by their version-less name.
+
+    Assets are resolved from Asset Registry in one query, nothing is
+    loaded.
 
-        for comp in geometry_cache_comps:
-            if comp.get_editor_property("geometry_cache") == old_mesh:
-                comp.set_geometry_cache(new_mesh)
+    Args:
+        asset_paths (Iterable[str]): Object paths of assets.
+        class_name (str): Asset class name.
 
+    Returns:
+        dict[str, str]: Object paths by common name.
 
-def delete_asset_if_unused(container, asset_content):
+    """
+    package_names = sorted({str(path).split(".")[0] for path in asset_paths})
+    if not package_names:
+        return {}
     ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    output = {}
+    for asset_data in ar.get_assets(
+            unreal.ARFilter(package_names=package_names)):
+        if get_asset_class_name(asset_data) != class_name:
+            continue
+        asset_name = str(asset_data.asset_name)
+        output[find_common_name(asset_name)] = (
+            f"{asset_data.package_name}.{asset_name}")
+    return output
+
 
-    references = set()
-
-    for asset_path in asset_content:
-        asset = ar.get_asset_by_object_path(asset_path)
-        refs = ar.get_referencers(
-            asset.package_name,
-            unreal.AssetRegistryDependencyOptions(
-                include_soft_package_references=False,
-                include_hard_package_references=True,
-                include_searchable_names=False,
-                include_soft_management_references=False,
-                include_hard_management_references=False
-            ))
-        if not refs:
+def _replace_actors(
+    component_class_name, old_assets, new_assets, selected,
+    component_index=None
+):
+    if component_index is None:
+        component_index = LevelComponentIndex(selected)
+
+    asset_class_name = next(
+        asset_class_name
+        for class_name, asset_class_name, _ in (
+            LevelComponentIndex.component_types)
+        if class_name == component_class_name
+    )
+    component_class = getattr(unreal, component_class_name)
+    old_paths = _get_assets_by_common_name(old_assets, asset_class_name)
+    new_paths = _get_assets_by_common_name(new_assets, asset_class_name)
+
+    replaced = []
+    for common_name, old_path in old_paths.items():
+        new_path = new_paths.get(common_name)
+        if not new_path or new_path == old_path:
             continue
-        references = references.union(set(refs))
-
-    # Filter out references that are in the Temp folder
-    cleaned_references = {
-        ref for ref in references if not str(ref).startswith("/Temp/")}
-
-    # Check which of the references are Levels
-    for ref in cleaned_references:
-        loaded_asset = unreal.EditorAssetLibrary.load_asset(ref)
-        if isinstance(loaded_asset, unreal.World):
-            # If there is at least a level, we can stop, we don't want to
-            # delete the container
-            return
+        components = component_index.get_components(
+            old_path, component_class)
+        if not components:
+            continue
+        new_asset = unreal.EditorAssetLibrary.load_asset(new_path)
+        replaced.append((components, old_path, new_asset))
+        component_index.move(components, old_path, new_path)
+    return replaced
+
+
+def replace_static_mesh_actors(
+    old_assets, new_assets, selected, component_index=None
+):
+    smes = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+
+    for components, _, new_mesh in _replace_actors(
+        "StaticMeshComponent", old_assets, new_assets, selected,
+        component_index
+    ):
+        old_mesh = _get_static_mesh(components[0])
+        smes.replace_mesh_components_meshes(components, old_mesh, new_mesh)
+
+
+def replace_skeletal_mesh_actors(
+    old_assets, new_assets, selected, component_index=None
+):
+    for components, _, new_mesh in _replace_actors(
+        "SkeletalMeshComponent", old_assets, new_assets, selected,
+        component_index
+    ):
+        for comp in components:
+            comp.set_skeletal_mesh_asset(new_mesh)
+
 
-    unreal.log("Previous version unused, deleting...")
+def replace_geometry_cache_actors(
+    old_assets, new_assets, selected, component_index=None
+):
+    for components, _, new_cache in _replace_actors(
+        "GeometryCacheComponent", old_assets, new_assets, selected,
+        component_index
+    ):
+        for comp in components:
+            comp.set_geometry_cache(new_cache)
+
+
+LEVEL_CLASS_NAMES = {"World"}
+
+
+class ReferencerCache:
+    """Cache of hard referencers of packages and classes of their assets.
+
+    Referencers are resolved from Asset Registry only, no referencing
+    asset is loaded. Cache is meant to live for one cleanup run over
+    multiple containers; assets deleted during the run are never levels,
+    so cached answers stay valid for level checks.
+
+    """
+
+    def __init__(self):
+        self._ar = unreal.AssetRegistryHelpers.get_asset_registry()
+        self._options = unreal.AssetRegistryDependencyOptions(
+            include_soft_package_references=False,
+            include_hard_package_references=True,
+            include_searchable_names=False,
+            include_soft_management_references=False,
+            include_hard_management_references=False
+        )
+        self._referencers = {}
+        self._class_names = {}
+
+    def get_referencers(self, package_names):
+        """Get hard referencers of packages.
+
+        Args:
+            package_names (Iterable[str]): Package names.
+
+        Returns:
+            set[str]: Package names of referencers.
+
+        """
+        referencers = set()
+        for package_name in package_names:
+            refs = self._referencers.get(package_name)
+            if refs is None:
+                refs = {
+                    str(ref)
+                    for ref in self._ar.get_referencers(
+                        package_name, self._options) or []
+                }
+                self._referencers[package_name] = refs
+            referencers.update(refs)
+        return referencers
+
+    def get_referencer_map(self, package_names):
+        """Get hard referencers of each package.
+
+        Args:
+            package_names (Iterable[str]): Package names.
+
+        Returns:
+            dict[str, set[str]]: Package names of referencers by package
+                name, referencers in the Temp folder are left out.
+
+        """
+        return {
+            package_name: {
+                ref for ref in self.get_referencers([package_name])
+                if not ref.startswith("/Temp/")
+            }
+            for package_name in package_names
+        }
+
+    def add_assets(self, assets):
+        """Remember classes of already listed assets.
+
+        Args:
+            assets (Iterable[unreal.AssetData]): Asset data.
+
+        """
+        for asset_data in assets:
+            self._class_names.setdefault(
+                str(asset_data.package_name), set()).add(
+                    get_asset_class_name(asset_data))
+
+    def get_class_names(self, package_names):
+        """Get class names of assets in packages.
+
+        Packages not resolved yet are queried in one Asset Registry call.
+
+        Args:
+            package_names (Iterable[str]): Package names.
+
+        Returns:
+            dict[str, set[str]]: Class names of assets by package name.
+
+        """
+        package_names = set(package_names)
+        missing = package_names - set(self._class_names)
+        if missing:
+            for package_name in missing:
+                self._class_names[package_name] = set()
+            ar_filter = unreal.ARFilter(package_names=sorted(missing))
+            for asset_data in self._ar.get_assets(ar_filter):
+                self._class_names[str(asset_data.package_name)].add(
+                    get_asset_class_name(asset_data))
+        return {
+            package_name: self._class_names[package_name]
+            for package_name in package_names
+        }
+
+    def is_referenced_by_level(self, package_names):
+        """Check if any of packages is referenced by a level.
 
-    # No levels, delete the asset
-    unreal.EditorAssetLibrary.delete_directory(container["namespace"])
+        Args:
+            package_names (Iterable[str]): Package names.
+
+        Returns:
+            bool: Any package is referenced by a level.
+
+        """
+        # Filter out references that are in the Temp folder
+        referencers = {
+            ref for ref in self.get_referencers(package_names)
+            if not ref.startswith("/Temp/")
+        }
+        return any(
+            class_names & LEVEL_CLASS_NAMES
+            for class_names in self.get_class_names(referencers).values()
+        )
 
 
 @contextmanager
@@ -868,7 +1913,8 @@ def format_asset_directory(context, directory_template):
     else:
         data["version"]["version"] = f"v{version:03d}"
     asset_name_with_version = set_asset_name(data)
-    asset_dir = StringTemplate(directory_template).format_strict(data)
+    template = get_active_session().get_string_template(directory_template)
+    asset_dir = template.format_strict(data)
     return f"{AYON_ROOT_DIR}/{asset_dir}", asset_name_with_version
 
 
@@ -1022,16 +2068,14 @@ def has_asset_existing_directory(asset_name, asset_dir):
     Returns:
         str: package path
     """
-    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
-    all_assets = asset_registry.get_assets_by_path('/Game', recursive=True)
-    for game_asset in all_assets:
-        if game_asset.asset_name == asset_name:
-            asset_path = game_asset.get_asset().get_path_name()
-            existing_asset_dir = unreal.Paths.split(asset_path)[0]
-            existing_version_folder = existing_asset_dir.split("/")[-1]
-            existing_asset_dir = existing_asset_dir.replace(existing_version_folder, "")
-            if existing_asset_dir != asset_dir:
-                return asset_path
+    index = get_asset_name_index()
+    for package_name in index.get_package_names(asset_name):
+        asset_path = f"{package_name}.{asset_name}"
+        existing_asset_dir = package_name.rsplit("/", 1)[0]
+        existing_version_folder = existing_asset_dir.split("/")[-1]
+        existing_asset_dir = existing_asset_dir.replace(existing_version_folder, "")
+        if existing_asset_dir != asset_dir:
+            return asset_path
     return None
 
 def has_asset_directory_pattern_matched(asset_name, asset_dir, name, extension=None):
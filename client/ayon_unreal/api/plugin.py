@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
-import ast
 import collections
+import functools
 import sys
 import six
 from abc import (
@@ -14,10 +14,16 @@ import ayon_api
 from .pipeline import (
     create_publish_instance,
     imprint,
+    imprint_many,
+    imprint_session,
     ls_inst,
+    set_instance_members,
     UNREAL_VERSION
 )
 from .lib import remove_loaded_asset
+from .prefetch import get_local_path
+from .session import get_active_session, session_method
+from .tracing import traced_method
 from ayon_core.lib import (
     BoolDef,
     UILabelDef
@@ -28,8 +34,6 @@ from ayon_core.pipeline import (
     LoaderPlugin,
     CreatorError,
     CreatedInstance,
-    discover_loader_plugins,
-    loaders_from_representation,
     load_container,
     AYON_CONTAINER_ID
 )
@@ -82,21 +86,17 @@ class UnrealCreateLogic():
         self.get_cached_instances(self.collection_shared_data)
         for instance in self.collection_shared_data[
                 "unreal_cached_subsets"].get(self.identifier, []):
-            # Unreal saves metadata as string, so we need to convert it back
-            instance['creator_attributes'] = ast.literal_eval(
-                instance.get('creator_attributes', '{}'))
-            instance['publish_attributes'] = ast.literal_eval(
-                instance.get('publish_attributes', '{}'))
-            instance['members'] = ast.literal_eval(
-                instance.get('members', '[]'))
-            instance['families'] = ast.literal_eval(
-                instance.get('families', '[]'))
-            instance['active'] = ast.literal_eval(
-                instance.get('active', ''))
+            # Metadata are already decoded by `ls_inst()`, only fill
+            # missing values
+            instance.setdefault("creator_attributes", {})
+            instance.setdefault("publish_attributes", {})
+            instance.setdefault("members", [])
+            instance.setdefault("families", [])
             created_instance = CreatedInstance.from_existing(instance, self)
             self._add_instance_to_context(created_instance)
 
     def _default_update_instances(self, update_list):
+        data_by_node = {}
         for created_inst, changes in update_list:
             instance_node = created_inst.get("instance_path", "")
 
@@ -109,10 +109,9 @@ class UnrealCreateLogic():
                 key: changes[key].new_value
                 for key in changes.changed_keys
             }
-            imprint(
-                instance_node,
-                new_values
-            )
+            data_by_node.setdefault(instance_node, {}).update(new_values)
+
+        imprint_many(data_by_node)
 
     def _default_remove_instances(self, instances):
         for instance in instances:
@@ -139,13 +138,10 @@ class UnrealCreateLogic():
             self._add_instance_to_context(instance)
 
             pub_instance.set_editor_property('add_external_assets', True)
-            assets = pub_instance.get_editor_property('asset_data_external')
-
-            ar = unreal.AssetRegistryHelpers.get_asset_registry()
-
-            for member in pre_create_data.get("members", []):
-                obj = ar.get_asset_by_object_path(member).get_asset()
-                assets.add(obj)
+            missing = set_instance_members(
+                pub_instance, pre_create_data.get("members", []))
+            for member in missing:
+                unreal.log_warning(f"Member {member} not found, skipped.")
 
             imprint(f"{self.root}/{instance_name}",
                     instance.data_to_store())
@@ -284,9 +280,43 @@ class UnrealActorCreator(UnrealBaseCreator):
         ]
 
 
+def _imprint_session_method(fn):
+    """Decorate loader method to save imprinted containers at once."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with imprint_session():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
 class Loader(LoaderPlugin, ABC):
     """This serves as skeleton for future Ayon specific functionality"""
-    pass
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # share load session between loads of one batch, save containers
+        # imprinted by the load and its nested loads together and log
+        # Unreal API calls made by load and update when tracing
+        for method_name in ("load", "update"):
+            method = cls.__dict__.get(method_name)
+            if method is None or getattr(method, "__traced__", False):
+                continue
+            setattr(cls, method_name, traced_method(
+                session_method(_imprint_session_method(method))))
+
+    @classmethod
+    def filepath_from_context(cls, context):
+        """Get path of representation, local copy when it was prefetched.
+
+        Args:
+            context (dict): Load context.
+
+        Returns:
+            str: Path to representation file.
+
+        """
+        path = super().filepath_from_context(context)
+        return get_local_path(context["representation"], path)
 
 
 class LayoutLoader(Loader):
@@ -302,7 +332,7 @@ class LayoutLoader(Loader):
     remove_loaded_assets = False
 
     @staticmethod
-    def _get_fbx_loader(loaders, family):
+    def _get_fbx_loader(registry, family):
         name = ""
         if family in ['rig', 'skeletalMesh']:
             name = "SkeletalMeshFBXLoader"
@@ -315,14 +345,10 @@ class LayoutLoader(Loader):
 
             return None
 
-        for loader in loaders:
-            if loader.__name__ == name:
-                return loader
-
-        return None
+        return registry.get_loader(family, "fbx", name)
 
     @staticmethod
-    def _get_abc_loader(loaders, family):
+    def _get_abc_loader(registry, family):
         name = ""
         if family in ['rig', 'skeletalMesh']:
             name = "SkeletalMeshAlembicLoader"
@@ -332,11 +358,7 @@ class LayoutLoader(Loader):
         if name == "":
             return None
 
-        for loader in loaders:
-            if loader.__name__ == name:
-                return loader
-
-        return None
+        return registry.get_loader(family, "abc", name)
 
     def _transform_from_basis(self, transform, basis, unreal_import=False):
         """Transform a transform from a basis to a new basis."""
@@ -434,16 +456,14 @@ class LayoutLoader(Loader):
             "{}/{}".format(asset_dir, container_name), data)
 
     def _load_assets(self, instance_name, repre_id, product_type, repr_format):
-        all_loaders = discover_loader_plugins()
-        loaders = loaders_from_representation(
-            all_loaders, repre_id)
+        registry = get_active_session().get_loader_registry()
 
         loader = None
 
         if repr_format == 'fbx':
-            loader = self._get_fbx_loader(loaders, product_type)
+            loader = self._get_fbx_loader(registry, product_type)
         elif repr_format == 'abc':
-            loader = self._get_abc_loader(loaders, product_type)
+            loader = self._get_abc_loader(registry, product_type)
 
         if not loader:
             if repr_format == "ma":
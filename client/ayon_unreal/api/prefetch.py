@@ -0,0 +1,505 @@
+# -*- coding: utf-8 -*-
+"""Prefetch of representation files to local disk cache.
+
+Publish roots are usually network shares and importers read source files
+on the editor main thread. When `AYON_UNREAL_PREFETCH_DIR` environment
+variable points to a local directory, :func:`prefetch` copies files of
+representations loaded in one batch, like all elements of a layout, into
+it by background threads while the editor does other work. Loaders get
+the local copy by :func:`get_local_path`, which waits only for the copy
+of the representation being imported.
+
+Cache entries are directories keyed by representation id and size and
+modification time of its files, so a republished file never hits a stale
+entry. Copies are verified against `size` of representation files and
+their `hash` when it is SHA-256 of the content, computed while copying.
+Before each prefetch least recently used entries are evicted, so the
+cache with the new copies fits into `AYON_UNREAL_PREFETCH_SIZE_MB`.
+Sizes of entries are kept in a ledger, the cache directory is scanned
+only once per process.
+
+Local copies are only read by importers, imported assets keep the publish
+path as their source, see :func:`get_source_path`.
+"""
+import collections
+import functools
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+from ayon_core.pipeline import get_representation_path
+
+from ayon_unreal.api.session import get_load_session
+
+logger = logging.getLogger("ayon_core.hosts.unreal")
+
+PREFETCH_DIR_ENV = "AYON_UNREAL_PREFETCH_DIR"
+PREFETCH_SIZE_ENV = "AYON_UNREAL_PREFETCH_SIZE_MB"
+PREFETCH_WORKERS_ENV = "AYON_UNREAL_PREFETCH_WORKERS"
+DEFAULT_SIZE_MB = 20 * 1024
+DEFAULT_WORKERS = 4
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_TEMP_PREFIX = ".tmp_"
+CONTENT_HASH_TYPE = "sha256"
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+
+class PrefetchError(OSError):
+    """Representation files could not be copied to the cache."""
+
+
+def hash_file(path, chunk_size=HASH_CHUNK_SIZE):
+    """Get SHA-256 of file content read in chunks.
+
+    Args:
+        path (str): Path to file.
+        chunk_size (int): Size of chunks read at once.
+
+    Returns:
+        str: Hex digest.
+
+    """
+    hasher = hashlib.sha256()
+    with open(path, "rb") as stream:
+        for chunk in iter(functools.partial(stream.read, chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _copy_file(src, dst, chunk_size=HASH_CHUNK_SIZE):
+    """Copy file in chunks and return SHA-256 of the read content."""
+    hasher = hashlib.sha256()
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        for chunk in iter(functools.partial(source.read, chunk_size), b""):
+            hasher.update(chunk)
+            target.write(chunk)
+    shutil.copystat(src, dst)
+    return hasher.hexdigest()
+
+
+def _get_dir_size(path):
+    size = 0
+    for root, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                size += os.path.getsize(os.path.join(root, filename))
+            except OSError:
+                pass
+    return size
+
+
+def get_file_infos(repre_entity):
+    """Get published file information of representation by file name.
+
+    Args:
+        repre_entity (dict): Representation entity.
+
+    Returns:
+        dict[str, dict]: File information, like `size` and `hash`, by
+            file name.
+
+    """
+    file_infos = {}
+    for file_info in repre_entity.get("files") or []:
+        name = file_info.get("name") or os.path.basename(
+            file_info.get("path", ""))
+        if name:
+            file_infos[name] = file_info
+    return file_infos
+
+
+def get_representation_files(repre_entity, path=None):
+    """Get paths to all files of representation.
+
+    Files are expected next to the main file of representation, which is
+    the case for single files and sequences published by AYON.
+
+    Args:
+        repre_entity (dict): Representation entity.
+        path (Optional[str]): Resolved path of representation.
+
+    Returns:
+        list[str]: Paths to files, main file first.
+
+    """
+    path = os.path.normpath(path or get_representation_path(repre_entity))
+    directory = os.path.dirname(path)
+    paths = [path]
+    for name in get_file_infos(repre_entity):
+        file_path = os.path.join(directory, name)
+        if file_path not in paths:
+            paths.append(file_path)
+    return paths
+
+
+def _verify_copy(path, target, source_hash, file_info):
+    """Check copy against published file information and the source.
+
+    Size is compared with published size, or with size of the source when
+    there is none. Hash is compared only when it is SHA-256 of content,
+    AYON stores hashes of file stats by default.
+
+    Raises:
+        PrefetchError: Copy does not match.
+
+    """
+    size = file_info.get("size")
+    if size is None:
+        size = os.path.getsize(path)
+    if os.path.getsize(target) != int(size):
+        raise PrefetchError(f"Copy of {path} has unexpected size")
+    if (
+        file_info.get("hash_type") == CONTENT_HASH_TYPE
+        and file_info.get("hash") != source_hash
+    ):
+        raise PrefetchError(f"Copy of {path} does not match published hash")
+
+
+class RepresentationCache:
+    """Least recently used cache of representation files on local disk.
+
+    Args:
+        root (str): Cache directory.
+        max_size (int): Size cap in bytes.
+
+    """
+
+    def __init__(self, root, max_size):
+        self.root = root
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # sizes of entries by key, least recently used first
+        self._sizes = None
+        self._total = 0
+
+    def _get_sizes(self):
+        """Get ledger of entry sizes, scanning the cache on first use.
+
+        Must be called with the lock held.
+
+        """
+        if self._sizes is not None:
+            return self._sizes
+        entries = []
+        if os.path.isdir(self.root):
+            for entry in os.scandir(self.root):
+                if not entry.is_dir() or entry.name.startswith(_TEMP_PREFIX):
+                    continue
+                entries.append((
+                    entry.stat().st_mtime, entry.name,
+                    _get_dir_size(entry.path)
+                ))
+        self._sizes = collections.OrderedDict(
+            (key, size) for _, key, size in sorted(entries))
+        self._total = sum(self._sizes.values())
+        return self._sizes
+
+    def _touch(self, key, entry_dir):
+        """Mark entry as most recently used in the ledger."""
+        with self._lock:
+            sizes = self._get_sizes()
+            if key in sizes:
+                sizes.move_to_end(key)
+            else:
+                # written by another process
+                size = _get_dir_size(entry_dir)
+                sizes[key] = size
+                self._total += size
+
+    def get_key(self, repre_id, paths):
+        """Get key of cache entry for files of representation.
+
+        Args:
+            repre_id (str): Representation id.
+            paths (list[str]): Source files.
+
+        Returns:
+            str: Cache key.
+
+        Raises:
+            OSError: Source file does not exist.
+
+        """
+        hasher = hashlib.sha1(repre_id.encode("utf-8"))
+        for path in paths:
+            stat = os.stat(path)
+            hasher.update(
+                f"|{os.path.basename(path)}|{stat.st_size}"
+                f"|{stat.st_mtime_ns}".encode("utf-8")
+            )
+        return hasher.hexdigest()
+
+    def get(self, key):
+        """Get directory of complete cache entry and mark it as used.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[str]: Entry directory, None when it is not cached.
+
+        """
+        entry_dir = os.path.join(self.root, key)
+        if not os.path.isdir(entry_dir):
+            return None
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            return None
+        self._touch(key, entry_dir)
+        return entry_dir
+
+    def fetch(self, key, paths, file_infos=None):
+        """Copy files to cache entry unless it is cached already.
+
+        Args:
+            key (str): Cache key from :meth:`get_key`.
+            paths (list[str]): Source files.
+            file_infos (Optional[dict[str, dict]]): Published information
+                of files by file name, see :func:`get_file_infos`.
+
+        Returns:
+            str: Entry directory.
+
+        Raises:
+            PrefetchError: File could not be copied or copy is corrupted.
+
+        """
+        entry_dir = self.get(key)
+        if entry_dir is not None:
+            return entry_dir
+
+        file_infos = file_infos or {}
+        entry_dir = os.path.join(self.root, key)
+        temp_dir = os.path.join(
+            self.root, f"{_TEMP_PREFIX}{key}_{uuid.uuid4().hex}")
+        try:
+            os.makedirs(temp_dir)
+            for path in paths:
+                name = os.path.basename(path)
+                target = os.path.join(temp_dir, name)
+                source_hash = _copy_file(path, target)
+                _verify_copy(
+                    path, target, source_hash, file_infos.get(name, {}))
+            try:
+                os.rename(temp_dir, entry_dir)
+            except OSError:
+                # fetched meanwhile by another thread or process
+                if not os.path.isdir(entry_dir):
+                    raise
+        except OSError as exc:
+            raise PrefetchError(
+                f"Failed to prefetch {paths[0]}: {exc}") from exc
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        self._touch(key, entry_dir)
+        return entry_dir
+
+    def evict(self, keep=(), reserve=0):
+        """Remove least recently used entries over the size cap.
+
+        Args:
+            keep (Iterable[str]): Keys of entries which are never removed.
+            reserve (int): Size in bytes of copies about to be written,
+                which must fit into the cap too.
+
+        Returns:
+            list[str]: Keys of removed entries.
+
+        """
+        keep = set(keep)
+        removed = []
+        with self._lock:
+            sizes = self._get_sizes()
+            for key, size in list(sizes.items()):
+                if self._total + reserve <= self.max_size:
+                    break
+                if key in keep:
+                    continue
+                shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+                del sizes[key]
+                self._total -= size
+                removed.append(key)
+        if removed:
+            logger.debug(f"Evicted {len(removed)} prefetched representations")
+        return removed
+
+
+class Prefetcher:
+    """Copy representation files to cache by pool of threads.
+
+    Args:
+        cache (RepresentationCache): Cache to copy files into.
+        max_workers (int): Number of copying threads.
+
+    """
+
+    def __init__(self, cache, max_workers=DEFAULT_WORKERS):
+        self.cache = cache
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="ayon_prefetch")
+
+    def _fetch(self, key, paths, file_infos):
+        try:
+            return self.cache.fetch(key, paths, file_infos)
+        except PrefetchError as exc:
+            logger.warning(exc)
+            return None
+
+    def submit(self, repre_entities):
+        """Start copies of representation files in background.
+
+        Least recently used entries are evicted first to make room for
+        the copies which are not cached yet.
+
+        Args:
+            repre_entities (Iterable[dict]): Representation entities.
+
+        Returns:
+            dict[str, tuple[str, Future]]: Cache key and future of entry
+                directory by representation id. Representations whose
+                source files are not available are skipped.
+
+        """
+        pending = {}
+        for repre_entity in repre_entities:
+            repre_id = repre_entity["id"]
+            paths = get_representation_files(repre_entity)
+            try:
+                key = self.cache.get_key(repre_id, paths)
+                size = 0
+                if self.cache.get(key) is None:
+                    size = sum(os.path.getsize(path) for path in paths)
+            except OSError as exc:
+                logger.warning(
+                    f"Can't prefetch representation {repre_id}: {exc}")
+                continue
+            pending[repre_id] = (
+                key, paths, get_file_infos(repre_entity), size)
+
+        self.cache.evict(
+            keep={key for key, _, _, _ in pending.values()},
+            reserve=sum(size for _, _, _, size in pending.values())
+        )
+        return {
+            repre_id: (
+                key,
+                self._executor.submit(self._fetch, key, paths, file_infos)
+            )
+            for repre_id, (key, paths, file_infos, _) in pending.items()
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_prefetcher():
+    """Get prefetcher configured by environment.
+
+    Returns:
+        Optional[Prefetcher]: Prefetcher, None when prefetch is disabled.
+
+    """
+    global _prefetcher
+    root = os.getenv(PREFETCH_DIR_ENV)
+    if not root:
+        return None
+    with _prefetcher_lock:
+        if _prefetcher is None or _prefetcher.cache.root != root:
+            if _prefetcher is not None:
+                _prefetcher.shutdown()
+            max_size = int(
+                os.getenv(PREFETCH_SIZE_ENV) or DEFAULT_SIZE_MB) * 1024 ** 2
+            max_workers = int(
+                os.getenv(PREFETCH_WORKERS_ENV) or DEFAULT_WORKERS)
+            os.makedirs(root, exist_ok=True)
+            _prefetcher = Prefetcher(
+                RepresentationCache(root, max_size), max_workers)
+    return _prefetcher
+
+
+def prefetch(repre_entities):
+    """Copy files of representations to local cache in background.
+
+    Copies are available to loads in the current load session.
+
+    Args:
+        repre_entities (Iterable[dict]): Representations to be loaded.
+
+    Returns:
+        int: Number of representations being prefetched.
+
+    """
+    prefetcher = get_prefetcher()
+    session = get_load_session()
+    if prefetcher is None or session is None:
+        return 0
+
+    repre_entities_by_id = {
+        repre_entity["id"]: repre_entity
+        for repre_entity in repre_entities
+        if session.get(("prefetch", repre_entity["id"])) is None
+    }
+    submitted = prefetcher.submit(repre_entities_by_id.values())
+    for repre_id, item in submitted.items():
+        session.memoize(("prefetch", repre_id), lambda item=item: item)
+    logger.debug(f"Prefetching {len(submitted)} representations")
+    return len(submitted)
+
+
+def get_local_path(repre_entity, path):
+    """Get local copy of representation file when it was prefetched.
+
+    Waits for the copy when it is still in progress. The local copy is
+    remembered in the load session, so :func:`get_source_path` can map it
+    back to the path.
+
+    Args:
+        repre_entity (dict): Representation entity.
+        path (str): Resolved path of representation.
+
+    Returns:
+        str: Path to local copy, or the path when there is none.
+
+    """
+    session = get_load_session()
+    if session is None:
+        return path
+    item = session.get(("prefetch", repre_entity["id"]))
+    if item is None:
+        return path
+    _, future = item
+    try:
+        entry_dir = future.result()
+    except CancelledError:
+        # prefetcher was shut down before the copy started
+        entry_dir = None
+    if entry_dir is None:
+        return path
+    local_path = os.path.join(entry_dir, os.path.basename(path))
+    session.memoize(
+        ("prefetch_source", os.path.normpath(local_path)), lambda: path)
+    return local_path
+
+
+def get_source_path(path):
+    """Get publish path of local copy returned by :func:`get_local_path`.
+
+    Args:
+        path (str): Path to file, local copy or any other file.
+
+    Returns:
+        str: Publish path of local copy, the path itself otherwise.
+
+    """
+    session = get_load_session()
+    if session is None:
+        return path
+    return session.get(("prefetch_source", os.path.normpath(path)), path)
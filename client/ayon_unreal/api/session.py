@@ -0,0 +1,515 @@
+# -*- coding: utf-8 -*-
+"""Load session sharing cached data across loads of one batch.
+
+Loader action on many products calls `load()` of each loader separately
+and every call resolves the same project settings, folder entities and
+templates again. Load session memoizes these for the duration of a batch,
+together with loader plugins, which are discovered only once per batch.
+
+Loaders pick up the session from `options["load_session"]` or from the
+context variable set by :func:`load_session`. Loads started outside of
+explicit session share implicit batch session, which ends on the next
+editor tick, so everything run in one Loader action shares it and
+nothing outlives it. Commandlets never tick, there the batch session ends
+with the outermost `load()` or `update()` call.
+
+Packages dirtied by loads are not saved one by one. Loaders register
+directories of loaded assets by :func:`defer_save` and their dirty
+packages are saved in one call when the outermost :func:`load_session`
+context, which wraps every `load()` and `update()`, exits.
+"""
+import collections
+import contextlib
+import contextvars
+import functools
+import itertools
+
+import ayon_api
+from ayon_core.lib import StringTemplate
+from ayon_core.pipeline import (
+    discover_loader_plugins,
+    get_current_project_name,
+)
+from ayon_core.pipeline.context_tools import get_current_folder_entity
+from ayon_core.settings import get_project_settings
+
+import unreal  # noqa
+
+LOAD_SESSION_OPTION = "load_session"
+
+_current_session = contextvars.ContextVar(
+    "ayon_unreal_load_session", default=None)
+_session_ids = itertools.count(1)
+_batch_session = None
+_batch_tick_handle = None
+_slate_ticking = None
+
+
+def save_dirty_packages(directories):
+    """Save dirty content packages in directories in one call.
+
+    Clean packages are skipped and nothing is loaded.
+
+    Args:
+        directories (Iterable[str]): Content directories, like
+            `/Game/Ayon/Foo`.
+
+    Returns:
+        list[str]: Names of saved packages.
+
+    """
+    prefixes = tuple(
+        f"{directory.rstrip('/')}/" for directory in set(directories))
+    if not prefixes:
+        return []
+    utils = unreal.EditorLoadingAndSavingUtils
+    packages = [
+        package for package in utils.get_dirty_content_packages()
+        if package.get_name().startswith(prefixes)
+    ]
+    if packages:
+        utils.save_packages(packages, True)
+    return [package.get_name() for package in packages]
+
+
+class DeferredSave:
+    """Directories whose dirty packages are saved together later."""
+
+    def __init__(self):
+        self._directories = set()
+
+    def __bool__(self):
+        return bool(self._directories)
+
+    def add(self, directory):
+        self._directories.add(directory.rstrip("/"))
+
+    def flush(self):
+        """Save dirty packages of all added directories.
+
+        Returns:
+            list[str]: Names of saved packages.
+
+        """
+        directories, self._directories = self._directories, set()
+        return save_dirty_packages(directories)
+
+
+class LoaderRegistry:
+    """Loader plugins by product type and representation name.
+
+    Args:
+        loaders (Iterable[type]): Loader plugin classes.
+
+    """
+
+    def __init__(self, loaders):
+        self._loaders = list(loaders)
+        self._loaders_by_key = collections.defaultdict(list)
+        self._loaders_by_name = {}
+        self._lookup_cache = {}
+        for loader in self._loaders:
+            self._loaders_by_name.setdefault(loader.__name__, loader)
+            for product_type in getattr(loader, "product_types", None) or ():
+                for repre_name in loader.representations or ():
+                    self._loaders_by_key[(product_type, repre_name)].append(
+                        loader)
+
+    @classmethod
+    def discover(cls):
+        """Create registry of discovered loader plugins.
+
+        Returns:
+            LoaderRegistry: Registry.
+
+        """
+        return cls(discover_loader_plugins())
+
+    def get_loaders(self, product_type, repre_name):
+        """Get loaders of product type and representation.
+
+        Loaders supporting any product type or representation by `*` are
+        included after the specific ones.
+
+        Args:
+            product_type (str): Product type.
+            repre_name (str): Representation name.
+
+        Returns:
+            list[type]: Loader plugin classes.
+
+        """
+        loaders = []
+        for key in (
+            (product_type, repre_name),
+            (product_type, "*"),
+            ("*", repre_name),
+            ("*", "*"),
+        ):
+            for loader in self._loaders_by_key.get(key, ()):
+                if loader not in loaders:
+                    loaders.append(loader)
+        return loaders
+
+    def get_loader(self, product_type, repre_name, loader_name=None):
+        """Get loader of product type and representation.
+
+        Args:
+            product_type (str): Product type.
+            repre_name (str): Representation name.
+            loader_name (Optional[str]): Class name of the loader, first
+                compatible loader is returned when not set.
+
+        Returns:
+            Optional[type]: Loader plugin class.
+
+        """
+        key = (product_type, repre_name, loader_name)
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            pass
+        loader = next(
+            (
+                loader
+                for loader in self.get_loaders(product_type, repre_name)
+                if loader_name is None or loader.__name__ == loader_name
+            ),
+            None
+        )
+        self._lookup_cache[key] = loader
+        return loader
+
+    def get_loader_by_name(self, loader_name):
+        """Get loader by class name.
+
+        Args:
+            loader_name (str): Class name of the loader.
+
+        Returns:
+            Optional[type]: Loader plugin class.
+
+        """
+        return self._loaders_by_name.get(loader_name)
+
+
+class LoadSession:
+    """Memoized data shared by loads of one batch.
+
+    Attributes:
+        id (int): Unique id of the session.
+
+    """
+
+    def __init__(self):
+        self.id = next(_session_ids)
+        self._cache = {}
+        self._valid = True
+        self._deferred_save = DeferredSave()
+
+    @property
+    def is_valid(self):
+        return self._valid
+
+    def memoize(self, key, factory):
+        """Get value of key, create it by factory on first access.
+
+        Args:
+            key (Hashable): Cache key.
+            factory (Callable[[], Any]): Function creating the value.
+
+        Returns:
+            Any: Cached value.
+
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value = factory()
+        if self._valid:
+            self._cache[key] = value
+        return value
+
+    def get(self, key, default=None):
+        """Get cached value of key without creating it.
+
+        Args:
+            key (Hashable): Cache key.
+            default (Any): Value returned when key is not cached.
+
+        Returns:
+            Any: Cached value or default.
+
+        """
+        return self._cache.get(key, default)
+
+    def invalidate(self):
+        """Save deferred packages, drop all cached data and stop caching."""
+        self.flush_saves()
+        self._cache.clear()
+        self._valid = False
+
+    def defer_save(self, directory):
+        """Save dirty packages in directory with the others later.
+
+        Args:
+            directory (str): Content directory.
+
+        """
+        if not self._valid:
+            save_dirty_packages([directory])
+            return
+        self._deferred_save.add(directory)
+
+    def flush_saves(self):
+        """Save dirty packages of deferred directories now.
+
+        Returns:
+            list[str]: Names of saved packages.
+
+        """
+        return self._deferred_save.flush()
+
+    def get_project_settings(self, project_name=None):
+        """Get project settings.
+
+        Args:
+            project_name (Optional[str]): Project name. Defaults to current
+                project.
+
+        Returns:
+            dict: Project settings.
+
+        """
+        project_name = project_name or get_current_project_name()
+        return self.memoize(
+            ("project_settings", project_name),
+            lambda: get_project_settings(project_name)
+        )
+
+    def get_folder_entity(self, project_name, folder_path, fields=None):
+        """Get folder entity by path.
+
+        Args:
+            project_name (str): Project name.
+            folder_path (str): Folder path.
+            fields (Optional[Iterable[str]]): Fields to query.
+
+        Returns:
+            Optional[dict]: Folder entity.
+
+        """
+        fields = frozenset(fields) if fields is not None else None
+        return self.memoize(
+            ("folder_entity", project_name, folder_path, fields),
+            lambda: ayon_api.get_folder_by_path(
+                project_name, folder_path, fields=fields)
+        )
+
+    def get_current_folder_entity(self, fields=None):
+        """Get folder entity of current context.
+
+        Args:
+            fields (Optional[Iterable[str]]): Fields to query.
+
+        Returns:
+            Optional[dict]: Folder entity.
+
+        """
+        fields = frozenset(fields) if fields is not None else None
+        return self.memoize(
+            ("current_folder_entity", fields),
+            lambda: get_current_folder_entity(fields=fields)
+        )
+
+    def get_loader_registry(self):
+        """Get registry of loader plugins discovered once per session.
+
+        Returns:
+            LoaderRegistry: Loader registry.
+
+        """
+        return self.memoize(("loader_registry",), LoaderRegistry.discover)
+
+    def get_string_template(self, template):
+        """Get parsed string template.
+
+        Args:
+            template (str): Template.
+
+        Returns:
+            StringTemplate: Parsed template.
+
+        """
+        return self.memoize(
+            ("string_template", template),
+            lambda: StringTemplate(template)
+        )
+
+
+def _is_slate_ticking():
+    """Check if Slate post tick callbacks are called in this process.
+
+    Commandlets, like `-run=pythonscript`, run without Slate application.
+
+    Returns:
+        bool: Post tick callbacks are called.
+
+    """
+    global _slate_ticking
+    if _slate_ticking is None:
+        command_line = unreal.SystemLibrary.get_command_line().lower()
+        _slate_ticking = "-run=" not in command_line
+    return _slate_ticking
+
+
+def _end_batch_session(_delta_seconds=None):
+    global _batch_session, _batch_tick_handle
+    if _batch_tick_handle is not None:
+        unreal.unregister_slate_post_tick_callback(_batch_tick_handle)
+        _batch_tick_handle = None
+    if _batch_session is not None:
+        _batch_session.invalidate()
+        _batch_session = None
+
+
+def get_batch_session():
+    """Get implicit session of current batch of loads.
+
+    Session ends on the next editor tick, or at the end of the outermost
+    :func:`session_method` call when the editor doesn't tick.
+
+    Returns:
+        LoadSession: Batch session.
+
+    """
+    global _batch_session, _batch_tick_handle
+    if _batch_session is None:
+        _batch_session = LoadSession()
+        _batch_tick_handle = unreal.register_slate_post_tick_callback(
+            _end_batch_session)
+    return _batch_session
+
+
+def get_load_session(options=None):
+    """Get load session of current load.
+
+    Args:
+        options (Optional[dict]): Load options, session in them takes
+            precedence.
+
+    Returns:
+        Optional[LoadSession]: Load session, None outside of loads.
+
+    """
+    if options:
+        session = options.get(LOAD_SESSION_OPTION)
+        if session is not None:
+            return session
+    return _current_session.get()
+
+
+def get_active_session(options=None):
+    """Get load session of current load or a new one outside of loads.
+
+    New session isn't shared, so callers can use the session API
+    whether they run in a load or not.
+
+    Args:
+        options (Optional[dict]): Load options.
+
+    Returns:
+        LoadSession: Load session.
+
+    """
+    return get_load_session(options) or LoadSession()
+
+
+@contextlib.contextmanager
+def load_session(session=None):
+    """Run loads in the context in one load session.
+
+    Session already active in the context is reused. Packages deferred
+    to be saved are saved when the context activating the session exits
+    and session created by the context is invalidated at its end.
+
+    Args:
+        session (Optional[LoadSession]): Session to use.
+
+    Yields:
+        LoadSession: Active load session.
+
+    """
+    current = _current_session.get()
+    if current is not None and (session is None or session is current):
+        yield current
+        return
+
+    owned = session is None
+    if owned:
+        session = LoadSession()
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+        if owned:
+            session.invalidate()
+        else:
+            # batch session or session from options outlives the context,
+            # but packages dirtied by the outermost load are saved now
+            session.flush_saves()
+
+
+def defer_save(directory):
+    """Save dirty packages in directory at the end of current load session.
+
+    Packages are saved right away outside of load session.
+
+    Args:
+        directory (str): Content directory, like `/Game/Ayon/Foo`.
+
+    """
+    session = get_load_session()
+    if session is None:
+        save_dirty_packages([directory])
+        return
+    session.defer_save(directory)
+
+
+def session_method(fn):
+    """Decorate loader method to run in a load session.
+
+    Session is taken from `options` keyword argument or 4th positional
+    argument (`load(context, name, namespace, options)`), otherwise
+    implicit batch session is used. Without editor ticks the batch
+    session ends when the outermost decorated call returns.
+
+    Args:
+        fn (Callable): Method to decorate.
+
+    Returns:
+        Callable: Decorated method.
+
+    """
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        options = kwargs.get("options")
+        if options is None and len(args) > 3:
+            options = args[3]
+        session = get_load_session(
+            options if isinstance(options, dict) else None)
+        end_batch = False
+        if session is None:
+            session = get_batch_session()
+            end_batch = not _is_slate_ticking()
+        try:
+            with load_session(session):
+                return fn(self, *args, **kwargs)
+        finally:
+            if end_batch:
+                _end_batch_session()
+
+    wrapper.__load_session__ = True
+    return wrapper
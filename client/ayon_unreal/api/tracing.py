@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""Opt-in instrumentation of calls to the `unreal` API.
+
+When `AYON_UNREAL_TRACE_CALLS` environment variable is enabled, `unreal`
+global of AYON modules, `ayon_*` packages and plugins of this addon, is
+replaced by a proxy counting calls and cumulative wall time of every API
+function, attributed to the AYON function calling it. `sys.modules` is
+left untouched, so other editor scripts use `unreal` directly, and so
+are names imported by `from unreal import ...`. Table of
+collected calls is logged at the end of each loader `load()` and
+`update()` and after each publish plugin.
+
+Only module functions, editor libraries and objects returned by
+`get_asset_registry()`, `get_asset_tools()` and `get_editor_subsystem()`
+are traced. Other classes are returned as they are, so `isinstance`
+checks against them keep working.
+"""
+import collections
+import contextlib
+import functools
+import logging
+import os
+import sys
+import time
+
+import pyblish.api
+import unreal  # noqa
+
+logger = logging.getLogger("ayon_core.hosts.unreal")
+
+TRACE_CALLS_ENV = "AYON_UNREAL_TRACE_CALLS"
+
+_TRACED_CLASS_SUFFIXES = ("Library", "Helpers", "Subsystem")
+_TRACED_CLASSES = {"Paths"}
+_TRACED_RESULTS = {
+    "get_asset_registry",
+    "get_asset_tools",
+    "get_editor_subsystem",
+}
+_UNKNOWN_CALLER = "<unknown>"
+_PLUGINS_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "plugins")
+
+
+def is_tracing_enabled():
+    """Check if tracing of `unreal` calls is enabled by environment.
+
+    Returns:
+        bool: Tracing is enabled.
+
+    """
+    value = os.getenv(TRACE_CALLS_ENV, "").strip().lower()
+    return value in {"1", "true", "yes", "on"}
+
+
+def _get_caller():
+    """Get name of the closest AYON function on the call stack."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module_name = frame.f_globals.get("__name__", "")
+        if module_name != __name__ and (
+            module_name.startswith("ayon_")
+            or frame.f_code.co_filename.startswith(_PLUGINS_ROOT)
+        ):
+            return f"{module_name}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return _UNKNOWN_CALLER
+
+
+class CallTracer:
+    """Collect counts and wall time of traced API calls.
+
+    Statistics are keyed by API name (like
+    `EditorAssetLibrary.load_asset`) and calling function.
+
+    """
+
+    def __init__(self):
+        self._stats = collections.defaultdict(lambda: [0, 0.0])
+
+    def record(self, api_name, caller, duration):
+        stats = self._stats[(api_name, caller)]
+        stats[0] += 1
+        stats[1] += duration
+
+    def reset(self):
+        self._stats.clear()
+
+    def snapshot(self):
+        """Get collected statistics.
+
+        Returns:
+            dict[tuple[str, str], tuple[int, float]]: Number of calls and
+                cumulative time in seconds by API name and caller.
+
+        """
+        return {key: tuple(value) for key, value in self._stats.items()}
+
+    def format_table(self, title):
+        """Format collected statistics as table sorted by time.
+
+        Args:
+            title (str): Title of the table.
+
+        Returns:
+            str: Formatted table.
+
+        """
+        rows = sorted(
+            self._stats.items(), key=lambda item: item[1][1], reverse=True)
+        total_calls = sum(stats[0] for _, stats in rows)
+        total_time = sum(stats[1] for _, stats in rows)
+        api_width = max([len(key[0]) for key, _ in rows] + [3])
+        caller_width = max([len(key[1]) for key, _ in rows] + [6])
+        lines = [
+            f"Unreal API calls in {title}: {total_calls} calls, "
+            f"{total_time * 1000.0:.1f} ms",
+            f"{'API':<{api_width}}  {'Caller':<{caller_width}}  "
+            f"{'Calls':>7}  {'Total ms':>10}",
+        ]
+        for (api_name, caller), (count, duration) in rows:
+            lines.append(
+                f"{api_name:<{api_width}}  {caller:<{caller_width}}  "
+                f"{count:>7}  {duration * 1000.0:>10.2f}"
+            )
+        return "\n".join(lines)
+
+    def dump(self, title):
+        """Log collected statistics and reset them.
+
+        Args:
+            title (str): Title of the table.
+
+        """
+        if self._stats:
+            logger.info(self.format_table(title))
+        self.reset()
+
+
+def _unwrap(value):
+    if isinstance(value, _TracedProxy):
+        return value._target
+    return value
+
+
+class _TracedProxy:
+    """Proxy tracing calls of callable attributes of the target."""
+
+    def __init__(self, target, prefix, tracer):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_prefix", prefix)
+        object.__setattr__(self, "_tracer", tracer)
+        object.__setattr__(self, "_wrapped", {})
+
+    def __getattr__(self, name):
+        wrapped = self._wrapped.get(name)
+        if wrapped is not None:
+            return wrapped
+        value = getattr(self._target, name)
+        if not callable(value) or isinstance(value, type):
+            return value
+        api_name = f"{self._prefix}.{name}" if self._prefix else name
+        wrapped = self._wrap(value, api_name, name in _TRACED_RESULTS)
+        self._wrapped[name] = wrapped
+        return wrapped
+
+    def __setattr__(self, name, value):
+        self._wrapped.pop(name, None)
+        setattr(self._target, name, value)
+
+    def __dir__(self):
+        return dir(self._target)
+
+    def __repr__(self):
+        return f"<traced {self._target!r}>"
+
+    def _wrap(self, fn, api_name, wrap_result):
+        tracer = self._tracer
+
+        @functools.wraps(fn)
+        def traced(*args, **kwargs):
+            args = tuple(_unwrap(arg) for arg in args)
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                tracer.record(
+                    api_name, _get_caller(), time.perf_counter() - start)
+            if wrap_result and result is not None:
+                result = _TracedProxy(
+                    result, type(result).__name__, tracer)
+            return result
+        return traced
+
+
+class _TracedModule(_TracedProxy):
+    """Proxy of `unreal` module."""
+
+    def __getattr__(self, name):
+        wrapped = self._wrapped.get(name)
+        if wrapped is not None:
+            return wrapped
+        value = getattr(self._target, name)
+        if isinstance(value, type):
+            if name in _TRACED_CLASSES or name.endswith(
+                    _TRACED_CLASS_SUFFIXES):
+                wrapped = _TracedProxy(value, name, self._tracer)
+                self._wrapped[name] = wrapped
+                return wrapped
+            return value
+        if not callable(value):
+            return value
+        wrapped = self._wrap(value, name, name in _TRACED_RESULTS)
+        self._wrapped[name] = wrapped
+        return wrapped
+
+
+_tracer = None
+_trace_depth = 0
+_proxy = None
+# names of modules whose `unreal` global is the proxy
+_traced_modules = set()
+_modules_count = 0
+
+
+def get_call_tracer():
+    """Get call tracer if tracing is installed.
+
+    Returns:
+        Optional[CallTracer]: Call tracer, None if tracing is disabled.
+
+    """
+    return _tracer
+
+
+def _is_ayon_module(module_name, module):
+    if module_name == __name__:
+        return False
+    if module_name.startswith("ayon_"):
+        return True
+    # plugins are imported from their file paths under arbitrary names
+    filename = getattr(module, "__file__", None) or ""
+    return os.path.abspath(filename).startswith(_PLUGINS_ROOT)
+
+
+def _trace_modules():
+    """Set proxy as `unreal` global of AYON modules imported so far.
+
+    Plugins are discovered after tracing is installed, so modules are
+    checked again whenever any module was imported meanwhile.
+
+    """
+    global _modules_count
+    if _proxy is None or len(sys.modules) == _modules_count:
+        return
+    for module_name, module in list(sys.modules.items()):
+        if module_name in _traced_modules:
+            continue
+        if (
+            getattr(module, "unreal", None) is unreal
+            and _is_ayon_module(module_name, module)
+        ):
+            module.unreal = _proxy
+            _traced_modules.add(module_name)
+    _modules_count = len(sys.modules)
+
+
+def install_tracing():
+    """Trace `unreal` calls made by AYON modules.
+
+    Returns:
+        bool: Tracing was installed.
+
+    """
+    global _tracer, _proxy
+    if _tracer is not None:
+        return True
+    if not is_tracing_enabled():
+        return False
+
+    _tracer = CallTracer()
+    _proxy = _TracedModule(unreal, "", _tracer)
+    _trace_modules()
+    logger.info(
+        f"Tracing of Unreal API calls enabled by {TRACE_CALLS_ENV}.")
+    return True
+
+
+def uninstall_tracing():
+    """Restore `unreal` module in traced AYON modules."""
+    global _tracer, _proxy, _modules_count
+    for module_name in _traced_modules:
+        module = sys.modules.get(module_name)
+        if module is not None and getattr(module, "unreal", None) is _proxy:
+            module.unreal = unreal
+    _traced_modules.clear()
+    _modules_count = 0
+    _proxy = None
+    _tracer = None
+
+
+@contextlib.contextmanager
+def trace_calls(title):
+    """Log table of `unreal` calls made in the context.
+
+    Calls made before the context are dropped. Does nothing when tracing
+    is not installed or inside of another traced context.
+
+    Args:
+        title (str): Title of the table.
+
+    """
+    global _trace_depth
+    tracer = _tracer
+    if tracer is None or _trace_depth:
+        # nested loads are reported by the outermost one
+        yield
+        return
+    _trace_modules()
+    tracer.reset()
+    _trace_depth += 1
+    try:
+        yield
+    finally:
+        _trace_depth -= 1
+        tracer.dump(title)
+
+
+def traced_method(fn):
+    """Decorate method to log table of `unreal` calls made by it.
+
+    Args:
+        fn (Callable): Method to decorate.
+
+    Returns:
+        Callable: Decorated method.
+
+    """
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        if _tracer is None:
+            return fn(self, *args, **kwargs)
+        with trace_calls(f"{self.__class__.__name__}.{fn.__name__}"):
+            return fn(self, *args, **kwargs)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def _on_plugin_processed(result):
+    plugin = result.get("plugin")
+    instance = result.get("instance")
+    title = getattr(plugin, "__name__", str(plugin))
+    if instance is not None:
+        title = f"{title} ({instance})"
+    _tracer.dump(title)
+    # trace plugins discovered since the last check
+    _trace_modules()
+
+
+def register_publish_callbacks():
+    """Log table of `unreal` calls after each processed publish plugin."""
+    if _tracer is None:
+        return
+    pyblish.api.register_callback("pluginProcessed", _on_plugin_processed)
+
+
+def deregister_publish_callbacks():
+    if _tracer is None:
+        return
+    pyblish.api.deregister_callback(
+        "pluginProcessed", _on_plugin_processed)
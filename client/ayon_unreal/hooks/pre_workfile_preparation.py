@@ -267,6 +267,14 @@ class UnrealPrelaunchHook(PreLaunchHook):
                     f"Make sure the project is in the correct folder. Or enable 'allow project creation' in studio settings"
                 )
 
+        # Register AYON metadata as Asset Registry tags so containers
+        # can be listed without loading them in the editor.
+        if unreal_lib.register_metadata_tags(project_path):
+            self.log.info((
+                f"{self.signature} registered AYON metadata tags "
+                f"for Asset Registry in {project_path.as_posix()}"
+            ))
+
         self.launch_context.env["AYON_UNREAL_VERSION"] = engine_version
         # Append project file to launch arguments
         self.launch_context.launch_args.append(
@@ -528,3 +528,117 @@ def _build_and_move_plugin(engine_path: Path,
                            plugin_install_config_path.as_posix())
 
         dir_util.remove_tree(temp_dir.as_posix())
+
+
+# Metadata key listing all metadata keys imprinted on the asset, so readers
+# of Asset Registry tags can tell whether all metadata are available.
+AYON_METADATA_KEYS_TAG = "ayon_metadata_keys"
+
+# Metadata keys imprinted by AYON on `AyonAssetContainer` and
+# `AyonPublishInstance` assets. They are registered as Asset Registry tags
+# so their values can be read from `AssetData` without loading the asset.
+AYON_METADATA_TAGS = (
+    AYON_METADATA_KEYS_TAG,
+    # container keys
+    "schema",
+    "id",
+    "name",
+    "namespace",
+    "container_name",
+    "asset_name",
+    "loader",
+    "representation",
+    "parent",
+    "product_type",
+    "folder_path",
+    "asset",
+    "family",
+    "loaded_assets",
+    "master_directory",
+    "frameStart",
+    "frameEnd",
+    "source_hash",
+    # publish instance keys
+    "productType",
+    "productName",
+    "product_name",
+    "folderPath",
+    "task",
+    "variant",
+    "active",
+    "creator_identifier",
+    "creator_attributes",
+    "publish_attributes",
+    "instance_id",
+    "instance_path",
+    "members",
+    "families",
+    "level",
+    "sequence",
+    "master_sequence",
+    "master_level",
+    "output",
+)
+
+ASSET_MANAGER_SETTINGS_SECTION = "[/Script/Engine.AssetManagerSettings]"
+METADATA_TAGS_KEY = "+MetaDataTagsForAssetRegistry"
+
+
+def register_metadata_tags(project_path: Path, tags=None) -> bool:
+    """Register AYON metadata keys as Asset Registry tags.
+
+    Unreal transfers package metadata to Asset Registry only for keys
+    listed in `MetaDataTagsForAssetRegistry` of Asset Manager settings.
+    There is no way to set it from Python inside the editor, so it is
+    written to project `Config/DefaultGame.ini` before the editor starts.
+
+    Args:
+        project_path (Path): Path to Unreal project directory.
+        tags (Iterable[str], optional): Keys to register. Defaults to
+            `AYON_METADATA_TAGS`.
+
+    Returns:
+        bool: True if configuration file was modified.
+
+    """
+    tags = list(tags or AYON_METADATA_TAGS)
+    config_path = Path(project_path) / "Config" / "DefaultGame.ini"
+
+    lines = []
+    if config_path.is_file():
+        with open(config_path, "r") as fp:
+            lines = fp.read().splitlines()
+
+    section_index = None
+    existing = set()
+    current_section = None
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            current_section = stripped
+            if stripped == ASSET_MANAGER_SETTINGS_SECTION:
+                section_index = index
+            continue
+        if current_section != ASSET_MANAGER_SETTINGS_SECTION:
+            continue
+        key, _, value = stripped.partition("=")
+        if key == METADATA_TAGS_KEY:
+            existing.add(value.strip())
+
+    missing = [
+        f"{METADATA_TAGS_KEY}={tag}" for tag in tags if tag not in existing]
+    if not missing:
+        return False
+
+    if section_index is None:
+        if lines and lines[-1].strip():
+            lines.append("")
+        lines.append(ASSET_MANAGER_SETTINGS_SECTION)
+        lines.extend(missing)
+    else:
+        lines[section_index + 1:section_index + 1] = missing
+
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(config_path, "w") as fp:
+        fp.write("\n".join(lines) + "\n")
+    return True
@@ -0,0 +1,933 @@
+# -*- coding: utf-8 -*-
+"""Offline reader of Unreal package headers.
+
+Reads package file summary, name table, import and export tables and
+Asset Registry data of editor `.uasset` and `.umap` files without Unreal
+Engine, so containers can be indexed, `/Game/` dependencies checked and
+published packages validated on farm or in CI.
+
+Files are memory-mapped and only the header is touched, so reading is
+cheap even for large packages. Nothing here imports `unreal`, readers
+can run in worker processes (see :func:`read_packages`).
+
+Only versioned (editor) packages saved by Unreal Engine 4.x and 5.x are
+supported. Packages of UE5 object versions newer than
+`VER_UE5_AUTOMATIC_VERSION` are read with the newest known summary
+layout and rejected when their table offsets don't fit the header.
+Cooked packages are unversioned and can't be read without engine version
+information.
+"""
+import concurrent.futures
+import mmap
+import os
+import struct
+
+PACKAGE_FILE_TAG = 0x9E2A83C1
+PACKAGE_FILE_TAG_SWAPPED = 0xC1832A9E
+PACKAGE_EXTENSIONS = (".uasset", ".umap")
+
+PKG_CONTAINS_MAP = 0x00020000
+PKG_FILTER_EDITOR_ONLY = 0x80000000
+
+# EUnrealEngineObjectUE4Version
+VER_UE4_OLDEST_LOADABLE_PACKAGE = 214
+VER_UE4_WORLD_LEVEL_INFO = 224
+VER_UE4_ADDED_CHUNKID_TO_ASSETDATA_AND_UPACKAGE = 278
+VER_UE4_CHANGED_CHUNKID_TO_BE_AN_ARRAY_OF_CHUNKIDS = 326
+VER_UE4_ENGINE_VERSION_OBJECT = 336
+VER_UE4_LOAD_FOR_EDITOR_GAME = 365
+VER_UE4_ADD_STRING_ASSET_REFERENCES_MAP = 384
+VER_UE4_PACKAGE_SUMMARY_HAS_COMPATIBLE_ENGINE_VERSION = 444
+VER_UE4_SERIALIZE_TEXT_IN_PACKAGES = 459
+VER_UE4_COOKED_ASSETS_IN_EDITOR_SUPPORT = 485
+VER_UE4_NAME_HASHES_SERIALIZED = 504
+VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS = 507
+VER_UE4_TEMPLATE_INDEX_IN_COOKED_EXPORTS = 508
+VER_UE4_ADDED_SEARCHABLE_NAMES = 510
+VER_UE4_64BIT_EXPORTMAP_SERIALSIZES = 511
+VER_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID = 516
+VER_UE4_ADDED_PACKAGE_OWNER = 518
+VER_UE4_NON_OUTER_PACKAGE_IMPORT = 520
+VER_UE4_ASSETREGISTRY_DEPENDENCYFLAGS = 521
+VER_UE4_AUTOMATIC_VERSION = 522
+
+# EUnrealEngineObjectUE5Version
+VER_UE5_NAMES_REFERENCED_FROM_EXPORT_DATA = 1001
+VER_UE5_PAYLOAD_TOC = 1002
+VER_UE5_OPTIONAL_RESOURCES = 1003
+VER_UE5_REMOVE_OBJECT_EXPORT_PACKAGE_GUID = 1005
+VER_UE5_TRACK_OBJECT_EXPORT_IS_INHERITED = 1006
+VER_UE5_ADD_SOFTOBJECTPATH_LIST = 1008
+VER_UE5_DATA_RESOURCES = 1009
+VER_UE5_SCRIPT_SERIALIZATION_OFFSET = 1010
+VER_UE5_METADATA_SERIALIZATION_OFFSET = 1014
+VER_UE5_VERSE_CELLS = 1015
+VER_UE5_PACKAGE_SAVED_HASH = 1016
+VER_UE5_OS_SUB_OBJECT_SHADOW_SERIALIZATION = 1017
+VER_UE5_AUTOMATIC_VERSION = VER_UE5_OS_SUB_OBJECT_SHADOW_SERIALIZATION
+
+# oldest and newest legacy file versions with custom versions as guids
+_LEGACY_FILE_VERSION_RANGE = (-8, -3)
+
+
+class PackageReadError(ValueError):
+    """Package can't be read."""
+
+
+class EngineVersion:
+    """Engine version package was saved by.
+
+    Attributes:
+        major (int): Major version.
+        minor (int): Minor version.
+        patch (int): Patch version.
+        changelist (int): Changelist.
+        branch (str): Branch name.
+
+    """
+
+    def __init__(self, major=0, minor=0, patch=0, changelist=0, branch=""):
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        self.changelist = changelist
+        self.branch = branch
+
+    def __str__(self):
+        return f"{self.major}.{self.minor}.{self.patch}-{self.changelist}"
+
+    def __repr__(self):
+        return f"<EngineVersion {self}>"
+
+
+class PackageSummary:
+    """Package file summary (`FPackageFileSummary`).
+
+    Only fields needed to locate tables of the header are kept.
+
+    """
+
+    def __init__(self):
+        self.byte_order = "<"
+        self.legacy_file_version = 0
+        self.file_version_ue4 = 0
+        self.file_version_ue5 = 0
+        self.file_version_licensee = 0
+        self.custom_versions = {}
+        self.total_header_size = 0
+        self.folder_name = ""
+        self.package_flags = 0
+        self.name_count = 0
+        self.name_offset = 0
+        self.export_count = 0
+        self.export_offset = 0
+        self.import_count = 0
+        self.import_offset = 0
+        self.soft_package_references_count = 0
+        self.soft_package_references_offset = 0
+        self.guid = None
+        self.saved_by_engine_version = None
+        self.compatible_engine_version = None
+        self.asset_registry_data_offset = 0
+        self.bulk_data_start_offset = 0
+
+    @property
+    def is_map(self):
+        return bool(self.package_flags & PKG_CONTAINS_MAP)
+
+    @property
+    def is_filter_editor_only(self):
+        return bool(self.package_flags & PKG_FILTER_EDITOR_ONLY)
+
+
+class ObjectImport:
+    """Entry of import table (`FObjectImport`).
+
+    Attributes:
+        class_package (str): Package of the class, like `/Script/Engine`.
+        class_name (str): Class name, like `StaticMesh`.
+        outer_index (int): Package index of outer object.
+        object_name (str): Object name, package name for packages.
+        package_name (Optional[str]): Package of the import when it's not
+            given by outer chain.
+
+    """
+
+    def __init__(
+        self, class_package, class_name, outer_index, object_name,
+        package_name=None
+    ):
+        self.class_package = class_package
+        self.class_name = class_name
+        self.outer_index = outer_index
+        self.object_name = object_name
+        self.package_name = package_name
+
+    def __repr__(self):
+        return f"<ObjectImport {self.class_name} {self.object_name}>"
+
+
+class ObjectExport:
+    """Entry of export table (`FObjectExport`).
+
+    Attributes:
+        class_index (int): Package index of the class.
+        super_index (int): Package index of the super struct.
+        outer_index (int): Package index of outer object, 0 for objects
+            directly in the package.
+        object_name (str): Object name.
+        object_flags (int): Object flags.
+        serial_size (int): Size of serialized object.
+        serial_offset (int): Offset of serialized object in the file.
+        is_asset (bool): Export is main asset of the package.
+
+    """
+
+    def __init__(
+        self, class_index, super_index, outer_index, object_name,
+        object_flags, serial_size, serial_offset, is_asset
+    ):
+        self.class_index = class_index
+        self.super_index = super_index
+        self.outer_index = outer_index
+        self.object_name = object_name
+        self.object_flags = object_flags
+        self.serial_size = serial_size
+        self.serial_offset = serial_offset
+        self.is_asset = is_asset
+
+    def __repr__(self):
+        return f"<ObjectExport {self.object_name}>"
+
+
+class AssetRegistryEntry:
+    """Asset Registry data of an object stored in the package header.
+
+    Attributes:
+        object_path (str): Object path, like `/Game/Foo/Bar.Bar`.
+        class_path (str): Class as stored in the package, full path in
+            Unreal 5, like `/Script/Ayon.AyonAssetContainer`.
+        tags (dict[str, str]): Asset Registry tags and their values.
+
+    """
+
+    def __init__(self, object_path, class_path, tags):
+        self.object_path = object_path
+        self.class_path = class_path
+        self.tags = tags
+
+    @property
+    def class_name(self):
+        """str: Short class name, like `AyonAssetContainer`."""
+        return self.class_path.rsplit(".", 1)[-1]
+
+    def __repr__(self):
+        return f"<AssetRegistryEntry {self.class_name} {self.object_path}>"
+
+
+class _Cursor:
+    """Sequential reader of primitive values from buffer."""
+
+    def __init__(self, buffer, offset=0, byte_order="<"):
+        self.buffer = buffer
+        self.offset = offset
+        self._int16 = struct.Struct(f"{byte_order}H")
+        self._int32 = struct.Struct(f"{byte_order}i")
+        self._uint32 = struct.Struct(f"{byte_order}I")
+        self._int64 = struct.Struct(f"{byte_order}q")
+        self._pair = struct.Struct(f"{byte_order}ii")
+        self._byte_order = byte_order
+
+    def _unpack(self, fmt):
+        try:
+            value = fmt.unpack_from(self.buffer, self.offset)
+        except struct.error:
+            raise PackageReadError(
+                f"Unexpected end of package at offset {self.offset}.")
+        self.offset += fmt.size
+        return value
+
+    def skip(self, size):
+        self.offset += size
+
+    def uint16(self):
+        return self._unpack(self._int16)[0]
+
+    def int32(self):
+        return self._unpack(self._int32)[0]
+
+    def uint32(self):
+        return self._unpack(self._uint32)[0]
+
+    def int64(self):
+        return self._unpack(self._int64)[0]
+
+    def int32_pair(self):
+        return self._unpack(self._pair)
+
+    def count(self):
+        value = self.int32()
+        if value < 0 or value > len(self.buffer):
+            raise PackageReadError(
+                f"Invalid count {value} at offset {self.offset - 4}.")
+        return value
+
+    def guid(self):
+        end = self.offset + 16
+        if end > len(self.buffer):
+            raise PackageReadError(
+                f"Unexpected end of package at offset {self.offset}.")
+        value = bytes(self.buffer[self.offset:end]).hex()
+        self.offset = end
+        return value
+
+    def fstring(self):
+        length = self.int32()
+        if length == 0:
+            return ""
+        if length > 0:
+            size, encoding = length, "latin-1"
+        else:
+            size = -length * 2
+            encoding = "utf-16-be" if self._byte_order == ">" else "utf-16-le"
+        end = self.offset + size
+        if end > len(self.buffer):
+            raise PackageReadError(
+                f"Invalid string length {length} at offset "
+                f"{self.offset - 4}.")
+        data = bytes(self.buffer[self.offset:end])
+        self.offset = end
+        # strip null terminator
+        return data.decode(encoding)[:-1]
+
+
+def _read_engine_version(cursor):
+    major = cursor.uint16()
+    minor = cursor.uint16()
+    patch = cursor.uint16()
+    changelist = cursor.uint32()
+    branch = cursor.fstring()
+    return EngineVersion(major, minor, patch, changelist, branch)
+
+
+def read_summary(buffer):
+    """Read package file summary.
+
+    Args:
+        buffer (Union[bytes, mmap.mmap]): Content of package file.
+
+    Returns:
+        PackageSummary: Package summary.
+
+    Raises:
+        PackageReadError: Buffer is not supported package.
+
+    """
+    summary = PackageSummary()
+    tag = struct.unpack_from("<I", buffer, 0)[0] if len(buffer) >= 4 else 0
+    if tag == PACKAGE_FILE_TAG_SWAPPED:
+        summary.byte_order = ">"
+    elif tag != PACKAGE_FILE_TAG:
+        raise PackageReadError("File is not an Unreal package.")
+
+    cursor = _Cursor(buffer, 4, summary.byte_order)
+    legacy = cursor.int32()
+    low, high = _LEGACY_FILE_VERSION_RANGE
+    if not low <= legacy <= high:
+        raise PackageReadError(
+            f"Unsupported legacy file version {legacy}.")
+    summary.legacy_file_version = legacy
+    if legacy != -4:
+        # legacy UE3 version
+        cursor.skip(4)
+    summary.file_version_ue4 = cursor.int32()
+    if legacy <= -8:
+        summary.file_version_ue5 = cursor.int32()
+    summary.file_version_licensee = cursor.int32()
+    for _ in range(cursor.count()):
+        key = cursor.guid()
+        summary.custom_versions[key] = cursor.int32()
+
+    ue4 = summary.file_version_ue4
+    ue5 = summary.file_version_ue5
+    if not ue4 and not ue5:
+        raise PackageReadError(
+            "Unversioned (cooked) packages are not supported.")
+    if not VER_UE4_OLDEST_LOADABLE_PACKAGE <= ue4 <= VER_UE4_AUTOMATIC_VERSION:
+        raise PackageReadError(f"Unsupported UE4 object version {ue4}.")
+    if ue5 >= VER_UE5_PACKAGE_SAVED_HASH:
+        # saved hash (FIoHash)
+        cursor.skip(20)
+    summary.total_header_size = cursor.int32()
+    summary.folder_name = cursor.fstring()
+    summary.package_flags = cursor.uint32()
+    filter_editor_only = summary.is_filter_editor_only
+    summary.name_count = cursor.count()
+    summary.name_offset = cursor.int32()
+    if ue5 >= VER_UE5_ADD_SOFTOBJECTPATH_LIST:
+        # soft object paths count and offset
+        cursor.skip(8)
+    if (
+        ue4 >= VER_UE4_ADDED_PACKAGE_SUMMARY_LOCALIZATION_ID
+        and not filter_editor_only
+    ):
+        # localization id
+        cursor.fstring()
+    if ue4 >= VER_UE4_SERIALIZE_TEXT_IN_PACKAGES:
+        # gatherable text data count and offset
+        cursor.skip(8)
+    summary.export_count = cursor.count()
+    summary.export_offset = cursor.int32()
+    summary.import_count = cursor.count()
+    summary.import_offset = cursor.int32()
+    if ue5 >= VER_UE5_VERSE_CELLS:
+        # cell export and import counts and offsets
+        cursor.skip(16)
+    if ue5 >= VER_UE5_METADATA_SERIALIZATION_OFFSET:
+        # metadata offset
+        cursor.skip(4)
+    # depends offset
+    cursor.skip(4)
+    if ue4 >= VER_UE4_ADD_STRING_ASSET_REFERENCES_MAP:
+        summary.soft_package_references_count = cursor.count()
+        summary.soft_package_references_offset = cursor.int32()
+    if ue4 >= VER_UE4_ADDED_SEARCHABLE_NAMES:
+        # searchable names offset
+        cursor.skip(4)
+    # thumbnail table offset
+    cursor.skip(4)
+    if ue5 < VER_UE5_PACKAGE_SAVED_HASH:
+        summary.guid = cursor.guid()
+    if not filter_editor_only and ue4 >= VER_UE4_ADDED_PACKAGE_OWNER:
+        # persistent guid
+        cursor.skip(16)
+        if ue4 < VER_UE4_NON_OUTER_PACKAGE_IMPORT:
+            # owner persistent guid
+            cursor.skip(16)
+    # generations, export and name count of each
+    cursor.skip(cursor.count() * 8)
+    if ue4 >= VER_UE4_ENGINE_VERSION_OBJECT:
+        summary.saved_by_engine_version = _read_engine_version(cursor)
+    else:
+        summary.saved_by_engine_version = EngineVersion(
+            changelist=cursor.int32())
+    if ue4 >= VER_UE4_PACKAGE_SUMMARY_HAS_COMPATIBLE_ENGINE_VERSION:
+        summary.compatible_engine_version = _read_engine_version(cursor)
+    else:
+        summary.compatible_engine_version = summary.saved_by_engine_version
+    # compression flags
+    cursor.skip(4)
+    if cursor.count():
+        raise PackageReadError("Compressed packages are not supported.")
+    # package source
+    cursor.skip(4)
+    # additional packages to cook
+    for _ in range(cursor.count()):
+        cursor.fstring()
+    if legacy > -7:
+        # number of texture allocations
+        cursor.skip(4)
+    summary.asset_registry_data_offset = cursor.int32()
+    summary.bulk_data_start_offset = cursor.int64()
+
+    if not _has_valid_tables(summary, len(buffer)):
+        if ue5 > VER_UE5_AUTOMATIC_VERSION:
+            raise PackageReadError(f"Unsupported UE5 object version {ue5}.")
+        raise PackageReadError("Package tables are out of its header.")
+    return summary
+
+
+def _has_valid_tables(summary, size):
+    """Check that tables of summary are inside of package header.
+
+    Summary of unknown newer version read with older layout ends up
+    with offsets read from wrong fields.
+
+    """
+    header_size = summary.total_header_size
+    if not 0 < header_size <= size:
+        return False
+    for count, offset in (
+        (summary.name_count, summary.name_offset),
+        (summary.import_count, summary.import_offset),
+        (summary.export_count, summary.export_offset),
+    ):
+        if count and not 0 < offset < header_size:
+            return False
+    return True
+
+
+class PackageReader:
+    """Reader of header of one package file.
+
+    File is memory-mapped on first access and tables are read lazily,
+    use reader as context manager to unmap the file.
+
+    Args:
+        path (str): Path to `.uasset` or `.umap` file.
+        package_name (Optional[str]): Package name, like `/Game/Foo/Bar`.
+            Editor packages don't store their own name, it's needed to
+            resolve object paths of Asset Registry data stored relative
+            to the package.
+
+    Example:
+        >>> with PackageReader(path, "/Game/Ayon/Foo") as reader:
+        ...     reader.get_dependencies(root="/Game/")
+        ['/Game/Ayon/Bar/Bar_Material']
+
+    """
+
+    def __init__(self, path, package_name=None):
+        self.path = path
+        self.package_name = package_name
+        self._file = None
+        self._buffer = None
+        self._summary = None
+        self._names = None
+        self._imports = None
+        self._exports = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        if self._buffer is not None:
+            return
+        self._file = open(self.path, "rb")
+        try:
+            self._buffer = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty file can't be mapped
+            self._file.close()
+            self._file = None
+            raise PackageReadError(f"Package is empty: {self.path}")
+
+    def close(self):
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _cursor(self, offset):
+        self.open()
+        if not 0 <= offset <= len(self._buffer):
+            raise PackageReadError(
+                f"Offset {offset} is out of package {self.path}.")
+        return _Cursor(self._buffer, offset, self.summary.byte_order)
+
+    @property
+    def summary(self):
+        """PackageSummary: Package file summary."""
+        if self._summary is None:
+            self.open()
+            try:
+                self._summary = read_summary(self._buffer)
+            except PackageReadError as exc:
+                raise PackageReadError(f"{self.path}: {exc}")
+        return self._summary
+
+    @property
+    def names(self):
+        """list[str]: Name table."""
+        if self._names is None:
+            summary = self.summary
+            cursor = self._cursor(summary.name_offset)
+            has_hashes = (
+                summary.file_version_ue4 >= VER_UE4_NAME_HASHES_SERIALIZED)
+            names = []
+            for _ in range(summary.name_count):
+                names.append(cursor.fstring())
+                if has_hashes:
+                    # non-case and case preserving hashes
+                    cursor.skip(4)
+            self._names = names
+        return self._names
+
+    def _read_name(self, cursor):
+        index, number = cursor.int32_pair()
+        names = self.names
+        if not 0 <= index < len(names):
+            raise PackageReadError(
+                f"Invalid name index {index} in {self.path}.")
+        if number:
+            return f"{names[index]}_{number - 1}"
+        return names[index]
+
+    @property
+    def imports(self):
+        """list[ObjectImport]: Import table."""
+        if self._imports is None:
+            summary = self.summary
+            cursor = self._cursor(summary.import_offset)
+            has_package_name = (
+                summary.file_version_ue4 >= VER_UE4_NON_OUTER_PACKAGE_IMPORT
+                and not summary.is_filter_editor_only
+            )
+            has_optional = (
+                summary.file_version_ue5 >= VER_UE5_OPTIONAL_RESOURCES)
+            imports = []
+            for _ in range(summary.import_count):
+                class_package = self._read_name(cursor)
+                class_name = self._read_name(cursor)
+                outer_index = cursor.int32()
+                object_name = self._read_name(cursor)
+                package_name = None
+                if has_package_name:
+                    package_name = self._read_name(cursor)
+                    if package_name == "None":
+                        package_name = None
+                if has_optional:
+                    cursor.skip(4)
+                imports.append(ObjectImport(
+                    class_package, class_name, outer_index, object_name,
+                    package_name
+                ))
+            self._imports = imports
+        return self._imports
+
+    @property
+    def exports(self):
+        """list[ObjectExport]: Export table."""
+        if self._exports is None:
+            self._exports = self._read_exports()
+        return self._exports
+
+    def _read_exports(self):
+        summary = self.summary
+        ue4 = summary.file_version_ue4
+        ue5 = summary.file_version_ue5
+        cursor = self._cursor(summary.export_offset)
+        exports = []
+        for _ in range(summary.export_count):
+            class_index = cursor.int32()
+            super_index = cursor.int32()
+            if ue4 >= VER_UE4_TEMPLATE_INDEX_IN_COOKED_EXPORTS:
+                # template index
+                cursor.skip(4)
+            outer_index = cursor.int32()
+            object_name = self._read_name(cursor)
+            object_flags = cursor.uint32()
+            if ue4 >= VER_UE4_64BIT_EXPORTMAP_SERIALSIZES:
+                serial_size = cursor.int64()
+                serial_offset = cursor.int64()
+            else:
+                serial_size = cursor.int32()
+                serial_offset = cursor.int32()
+            # forced export, not for client, not for server
+            cursor.skip(12)
+            if ue5 < VER_UE5_REMOVE_OBJECT_EXPORT_PACKAGE_GUID:
+                # package guid
+                cursor.skip(16)
+            if ue5 >= VER_UE5_TRACK_OBJECT_EXPORT_IS_INHERITED:
+                # is inherited instance
+                cursor.skip(4)
+            # package flags
+            cursor.skip(4)
+            if ue4 >= VER_UE4_LOAD_FOR_EDITOR_GAME:
+                # not always loaded for editor game
+                cursor.skip(4)
+            is_asset = False
+            if ue4 >= VER_UE4_COOKED_ASSETS_IN_EDITOR_SUPPORT:
+                is_asset = bool(cursor.int32())
+            if ue5 >= VER_UE5_OPTIONAL_RESOURCES:
+                # generate public hash
+                cursor.skip(4)
+            if ue4 >= VER_UE4_PRELOAD_DEPENDENCIES_IN_COOKED_EXPORTS:
+                # first export dependency and four dependency counts
+                cursor.skip(20)
+            if ue5 >= VER_UE5_SCRIPT_SERIALIZATION_OFFSET:
+                # script serialization start and end offsets
+                cursor.skip(16)
+            exports.append(ObjectExport(
+                class_index, super_index, outer_index, object_name,
+                object_flags, serial_size, serial_offset, is_asset
+            ))
+        return exports
+
+    def get_object_name(self, package_index):
+        """Get name of object referenced by package index.
+
+        Args:
+            package_index (int): Package index, negative for imports,
+                positive for exports.
+
+        Returns:
+            Optional[str]: Object name, None for null index.
+
+        """
+        if package_index < 0:
+            return self.imports[-package_index - 1].object_name
+        if package_index > 0:
+            return self.exports[package_index - 1].object_name
+        return None
+
+    def get_export_class_name(self, export):
+        """Get class name of export.
+
+        Args:
+            export (ObjectExport): Export of the package.
+
+        Returns:
+            Optional[str]: Class name.
+
+        """
+        return self.get_object_name(export.class_index)
+
+    def get_import_package_name(self, index):
+        """Get package the import lives in.
+
+        Args:
+            index (int): Index in import table.
+
+        Returns:
+            str: Package name, like `/Script/Engine` or `/Game/Foo/Bar`.
+
+        """
+        imports = self.imports
+        visited = set()
+        while True:
+            object_import = imports[index]
+            if object_import.package_name:
+                return object_import.package_name
+            if object_import.outer_index >= 0:
+                # outermost import is the package itself
+                return object_import.object_name
+            if index in visited:
+                raise PackageReadError(
+                    f"Cyclic import outer chain in {self.path}.")
+            visited.add(index)
+            index = -object_import.outer_index - 1
+
+    def get_dependencies(self, root=None):
+        """Get packages imported by the package.
+
+        Args:
+            root (Optional[str]): Only packages starting with root, like
+                `/Game/`, are returned. All packages if None.
+
+        Returns:
+            list[str]: Sorted package names.
+
+        """
+        dependencies = set()
+        for index in range(len(self.imports)):
+            package_name = self.get_import_package_name(index)
+            if root is None or package_name.startswith(root):
+                dependencies.add(package_name)
+        dependencies.discard(self.package_name)
+        return sorted(dependencies)
+
+    def get_soft_package_references(self):
+        """Get packages referenced softly by the package.
+
+        Returns:
+            list[str]: Package names.
+
+        """
+        summary = self.summary
+        if not summary.soft_package_references_count:
+            return []
+        cursor = self._cursor(summary.soft_package_references_offset)
+        return [
+            self._read_name(cursor)
+            for _ in range(summary.soft_package_references_count)
+        ]
+
+    def get_asset_registry_entries(self):
+        """Get Asset Registry data stored in package header.
+
+        Tags are only stored for tags registered for Asset Registry
+        (see `ayon_unreal.lib.AYON_METADATA_TAGS`) and asset properties
+        marked as Asset Registry searchable.
+
+        Returns:
+            list[AssetRegistryEntry]: Asset Registry data of objects.
+
+        """
+        summary = self.summary
+        if summary.asset_registry_data_offset <= 0:
+            return []
+        cursor = self._cursor(summary.asset_registry_data_offset)
+        if (
+            summary.file_version_ue4 >= VER_UE4_ASSETREGISTRY_DEPENDENCYFLAGS
+            and not summary.is_filter_editor_only
+        ):
+            # dependency data offset
+            cursor.skip(8)
+        entries = []
+        for _ in range(cursor.count()):
+            object_path = cursor.fstring()
+            class_path = cursor.fstring()
+            tags = {}
+            for _ in range(cursor.count()):
+                key = cursor.fstring()
+                tags[key] = cursor.fstring()
+            if not object_path.startswith("/") and self.package_name:
+                # Unreal 5 stores path relative to package
+                object_path = f"{self.package_name}.{object_path}"
+            entries.append(AssetRegistryEntry(object_path, class_path, tags))
+        return entries
+
+
+class PackageInfo:
+    """Everything read from package header, picklable.
+
+    Attributes:
+        path (str): Path to package file.
+        package_name (Optional[str]): Package name.
+        summary (Optional[PackageSummary]): Package summary.
+        exports (list[tuple[str, str]]): Object and class name of exports.
+        dependencies (list[str]): Imported package names.
+        soft_references (list[str]): Softly referenced package names.
+        asset_registry (list[AssetRegistryEntry]): Asset Registry data.
+        error (Optional[str]): Reason why package could not be read.
+
+    """
+
+    def __init__(self, path, package_name=None):
+        self.path = path
+        self.package_name = package_name
+        self.summary = None
+        self.exports = []
+        self.dependencies = []
+        self.soft_references = []
+        self.asset_registry = []
+        self.error = None
+
+    def get_entries_by_class(self, class_name):
+        """Get Asset Registry entries of objects of class.
+
+        Args:
+            class_name (str): Short class name, like `AyonAssetContainer`.
+
+        Returns:
+            list[AssetRegistryEntry]: Matching entries.
+
+        """
+        return [
+            entry for entry in self.asset_registry
+            if entry.class_name == class_name
+        ]
+
+
+def get_package_name(path, content_dir, mount_point="/Game/"):
+    """Get package name of package file in content directory.
+
+    Args:
+        path (str): Path to package file.
+        content_dir (str): Content directory the mount point maps to.
+        mount_point (str): Mount point of content directory.
+
+    Returns:
+        Optional[str]: Package name, None if file is outside of content
+            directory.
+
+    """
+    relative = os.path.relpath(
+        os.path.abspath(path), os.path.abspath(content_dir))
+    if relative.startswith(os.pardir):
+        return None
+    relative = os.path.splitext(relative)[0].replace(os.sep, "/")
+    return f"{mount_point.rstrip('/')}/{relative}"
+
+
+def iter_package_files(content_dir):
+    """Iterate over package files in content directory.
+
+    Args:
+        content_dir (str): Directory to walk.
+
+    Yields:
+        str: Paths to `.uasset` and `.umap` files.
+
+    """
+    for dirpath, _, filenames in os.walk(content_dir):
+        for filename in filenames:
+            if filename.lower().endswith(PACKAGE_EXTENSIONS):
+                yield os.path.join(dirpath, filename)
+
+
+def read_package(path, package_name=None, dependency_root=None):
+    """Read package header into picklable info.
+
+    Errors are stored on the result instead of raised, so one broken
+    package doesn't stop reading of the others.
+
+    Args:
+        path (str): Path to package file.
+        package_name (Optional[str]): Package name.
+        dependency_root (Optional[str]): Only dependencies starting with
+            root are collected, like `/Game/`.
+
+    Returns:
+        PackageInfo: Package info.
+
+    """
+    info = PackageInfo(path, package_name)
+    try:
+        with PackageReader(path, package_name) as reader:
+            info.summary = reader.summary
+            info.exports = [
+                (export.object_name, reader.get_export_class_name(export))
+                for export in reader.exports
+            ]
+            info.dependencies = reader.get_dependencies(dependency_root)
+            info.soft_references = [
+                name for name in reader.get_soft_package_references()
+                if dependency_root is None or name.startswith(dependency_root)
+            ]
+            info.asset_registry = reader.get_asset_registry_entries()
+    except (OSError, PackageReadError) as exc:
+        info.error = str(exc)
+    return info
+
+
+def _read_package_args(args):
+    return read_package(*args)
+
+
+def read_packages(
+    paths, content_dir=None, mount_point="/Game/", dependency_root=None,
+    max_workers=None
+):
+    """Read headers of many packages in parallel processes.
+
+    Args:
+        paths (Iterable[str]): Paths to package files.
+        content_dir (Optional[str]): Content directory of packages, used
+            to resolve package names.
+        mount_point (str): Mount point of content directory.
+        dependency_root (Optional[str]): Only dependencies starting with
+            root are collected, like `/Game/`.
+        max_workers (Optional[int]): Number of worker processes, reads in
+            current process if 1.
+
+    Returns:
+        list[PackageInfo]: Package infos in order of paths.
+
+    """
+    jobs = []
+    for path in paths:
+        package_name = None
+        if content_dir:
+            package_name = get_package_name(path, content_dir, mount_point)
+        jobs.append((path, package_name, dependency_root))
+
+    if max_workers == 1 or len(jobs) < 2:
+        return [_read_package_args(job) for job in jobs]
+
+    workers = max_workers or os.cpu_count() or 1
+    # few chunks per worker balance load without per-package overhead
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        return list(executor.map(
+            _read_package_args, jobs, chunksize=chunksize))
@@ -1,7 +1,7 @@
 import unreal
 
 from ayon_unreal.api.tools_ui import qt_app_context
-from ayon_unreal.api.pipeline import delete_asset_if_unused
+from ayon_unreal.api.cleanup import UnusedContainerSweep
 from ayon_core.pipeline import InventoryAction
 
 
@@ -16,23 +16,23 @@ class DeleteUnusedAssets(InventoryAction):
 
     dialog = None
 
-    def _delete_unused_assets(self, containers):
+    def _get_supported_containers(self, containers):
         allowed_families = ["model", "rig"]
 
+        supported = []
         for container in containers:
             container_dir = container.get("namespace")
             if container.get("family") not in allowed_families:
                 unreal.log_warning(
                     f"Container {container_dir} is not supported.")
                 continue
+            supported.append(container)
+        return supported
 
-            asset_content = unreal.EditorAssetLibrary.list_assets(
-                container_dir, recursive=True, include_folder=False
-            )
+    def _delete_unused_assets(self, sweep, report):
+        sweep.delete(report)
 
-            delete_asset_if_unused(container, asset_content)
-
-    def _show_confirmation_dialog(self, containers):
+    def _show_confirmation_dialog(self, sweep, report):
         from qtpy import QtCore
         from ayon_core.tools.utils import SimplePopup
         from ayon_core.style import load_stylesheet
@@ -46,12 +46,14 @@ class DeleteUnusedAssets(InventoryAction):
         dialog.setWindowTitle("Delete all unused assets")
         dialog.set_message(
             "You are about to delete all the assets in the project that \n"
-            "are not used in any level. Are you sure you want to continue?"
+            "are not used in any level.\n\n"
+            f"{report.format()}\n\n"
+            "Are you sure you want to continue?"
         )
         dialog.set_button_text("Delete")
 
         dialog.on_clicked.connect(
-            lambda: self._delete_unused_assets(containers)
+            lambda: self._delete_unused_assets(sweep, report)
         )
 
         dialog.show()
@@ -62,5 +64,11 @@ class DeleteUnusedAssets(InventoryAction):
         self.dialog = dialog
 
     def process(self, containers):
+        sweep = UnusedContainerSweep()
+        report = sweep.sweep(self._get_supported_containers(containers))
+        unreal.log(report.format())
+        if not report.unused:
+            return
+
         with qt_app_context():
-            self._show_confirmation_dialog(containers)
+            self._show_confirmation_dialog(sweep, report)
@@ -1,8 +1,10 @@
-import re
+import collections
 import unreal
 
 from ayon_unreal.api.pipeline import (
     ls,
+    find_common_name,
+    LevelComponentIndex,
     replace_static_mesh_actors,
     replace_skeletal_mesh_actors,
     replace_geometry_cache_actors,
@@ -10,30 +12,55 @@ from ayon_unreal.api.pipeline import (
 from ayon_core.pipeline import InventoryAction
 
 
-def find_common_parts(old_asset_name, new_asset_name):
-    # Find the common prefix
-    prefix_match = re.match(r"^(.*?)(\d+)(.*?)$", old_asset_name)
-    if not prefix_match:
-        return
-    name, _, ext = prefix_match.groups()
+def _replace_actors(container, old_content, asset_content, selected,
+                    component_index):
+    family = container.get("family")
+    loader = container.get("loader")
+    args = (old_content, asset_content, selected, component_index)
+    if family == "rig":
+        replace_skeletal_mesh_actors(*args)
+        replace_static_mesh_actors(*args)
 
-    # Construct a dynamic pattern based on the common prefix and suffix
-    pattern = re.escape(name) + r"(\d+)" + re.escape(ext)
+    elif family == "model":
+        if loader == "PointCacheAlembicLoader":
+            replace_geometry_cache_actors(*args)
+        else:
+            replace_static_mesh_actors(*args)
 
-    # Match the pattern in the second variable
-    new_version_match = re.match(pattern, new_asset_name)
-    if not new_version_match:
-        return
+    elif family == "pointcache":
+        if loader == "PointCacheAlembicLoader":
+            replace_geometry_cache_actors(*args)
+        else:
+            replace_skeletal_mesh_actors(*args)
 
-    return new_asset_name
+    elif family == "animation":
+        if loader == "AnimationAlembicLoader":
+            replace_skeletal_mesh_actors(*args)
 
 
 def update_assets(containers, selected):
     allowed_families = ["animation", "model", "rig", "pointcache"]
 
-    # Get all the containers in the Unreal Project
-    all_containers = ls()
-
+    # Bucket all the containers in the Unreal Project by version
+    # agnostic common name of their asset name
+    containers_by_key = collections.defaultdict(list)
+    for project_container in ls(lazy=True):
+        key = find_common_name(project_container.get("asset_name") or "")
+        if key is not None:
+            containers_by_key[key].append(project_container)
+
+    # One index of level components is shared by all replacements
+    component_index = LevelComponentIndex(selected)
+    content_by_dir = {}
+
+    def list_content(directory):
+        if directory not in content_by_dir:
+            content_by_dir[directory] = (
+                unreal.EditorAssetLibrary.list_assets(
+                    directory, recursive=True, include_folder=False))
+        return content_by_dir[directory]
+
+    updated = False
     for container in containers:
         container_dir = container.get("namespace")
         if container.get("family") not in allowed_families:
@@ -43,62 +70,31 @@ def update_assets(containers, selected):
 
         # Get all containers with same asset_name but different objectName.
         # These are the containers that need to be updated in the level.
+        key = find_common_name(container.get("asset_name") or "")
         sa_containers = [
             i
-            for i in all_containers
+            for i in containers_by_key.get(key, [])
             if (
-                find_common_parts(
-                    i.get("asset_name"), container.get("asset_name")) and
                 i.get("objectName") != container.get("objectName")
+                and i.get("namespace") != container_dir
             )
         ]
         if not sa_containers:
-            return
+            unreal.log_warning(
+                f"No other version of {container_dir} found.")
+            continue
 
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            container_dir, recursive=True, include_folder=False
-        )
+        asset_content = list_content(container_dir)
 
         # Update all actors in level
         for sa_cont in sa_containers:
-            sa_dir = sa_cont.get("namespace")
-            if sa_dir == container_dir:
-                return
-            old_content = unreal.EditorAssetLibrary.list_assets(
-                sa_dir, recursive=True, include_folder=False
-            )
+            old_content = list_content(sa_cont.get("namespace"))
+            updated |= bool(_replace_actors(
+                container, old_content, asset_content, selected,
+                component_index))
 
-            unreal.log("old_content")
-            unreal.log(old_content)
-
-            if container.get("family") == "rig":
-                replace_skeletal_mesh_actors(
-                    old_content, asset_content, selected)
-                replace_static_mesh_actors(
-                    old_content, asset_content, selected)
-
-            elif container.get("family") == "model":
-                if container.get("loader") == "PointCacheAlembicLoader":
-                    replace_geometry_cache_actors(
-                        old_content, asset_content, selected)
-                else:
-                    replace_static_mesh_actors(
-                        old_content, asset_content, selected)
-
-            elif container.get("family") == "pointcache":
-                if container.get("loader") == "PointCacheAlembicLoader":
-                    replace_geometry_cache_actors(
-                        old_content, asset_content, selected)
-                else:
-                    replace_skeletal_mesh_actors(
-                        old_content, asset_content, selected)
-
-            elif container.get("family") == "animation":
-                if container.get("loader") == "AnimationAlembicLoader":
-                    replace_skeletal_mesh_actors(
-                        old_content, asset_content, selected)
-
-            unreal.EditorLevelLibrary.save_current_level()
+    if updated:
+        unreal.EditorLevelLibrary.save_current_level()
 
 
 class UpdateAllActors(InventoryAction):
@@ -4,11 +4,16 @@ import os
 
 from ayon_core.lib import EnumDef
 from ayon_core.pipeline import (
-    get_representation_path,
     AYON_CONTAINER_ID
 )
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import (
+    get_source_hash,
+    import_tasks,
+    is_source_imported,
+)
 from ayon_unreal.api import pipeline as unreal_pipeline
+from ayon_unreal.api.session import defer_save
 import unreal  # noqa
 
 
@@ -112,7 +117,7 @@ class AnimationAlembicLoader(plugin.Loader):
                         filepath, asset_dir, asset_name, False, loaded_options
                     )
 
-        unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+        import_tasks([task])
 
         # avoid duplicate container asset data being created
         if not unreal.EditorAssetLibrary.does_asset_exist(
@@ -131,7 +136,8 @@ class AnimationAlembicLoader(plugin.Loader):
         frameStart,
         frameEnd,
         representation,
-        product_type
+        product_type,
+        source_hash=None
     ):
         data = {
             "schema": "ayon:container-2.0",
@@ -144,6 +150,7 @@ class AnimationAlembicLoader(plugin.Loader):
             "representation": representation["id"],
             "parent": representation["versionId"],
             "product_type": product_type,
+            "source_hash": source_hash,
             "frameStart": frameStart,
             "frameEnd": frameEnd,
             # TODO these should be probably removed
@@ -225,15 +232,14 @@ class AnimationAlembicLoader(plugin.Loader):
             folder_entity["attrib"]["frameStart"],
             folder_entity["attrib"]["frameEnd"],
             context["representation"],
-            product_type
+            product_type,
+            source_hash=get_source_hash(path)
         )
 
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
         )
-
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
         return asset_content
 
@@ -244,28 +250,35 @@ class AnimationAlembicLoader(plugin.Loader):
 
         # Create directory for folder and Ayon container
         suffix = "_CON"
-        source_path = get_representation_path(repre_entity)
+        source_path = self.filepath_from_context(context)
 
         ext = os.path.splitext(source_path)[-1].lstrip(".")
         asset_root, asset_name = unreal_pipeline.format_asset_directory(context, self.loaded_asset_dir)
-        # do import fbx and replace existing data
-        asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
-        asset_dir, container_name = asset_tools.create_unique_asset_name(
-             asset_root, suffix=f"_{ext}")
-
-        container_name += suffix
-        if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
-            unreal.EditorAssetLibrary.make_directory(asset_dir)
-        loaded_options = {
-            "abc_conversion_preset": self.abc_conversion_preset,
-            "frameStart": int(container.get("frameStart", "1")),
-            "frameEnd": int(container.get("frameEnd", "1"))
-        }
-
-        self.import_and_containerize(
-            source_path, asset_dir, asset_name,
-            container_name, loaded_options
-        )
+        source_hash = get_source_hash(source_path)
+        if is_source_imported(container, source_hash):
+            # same file is already imported, only retarget container
+            asset_dir = container["namespace"]
+            container_name = container["objectName"]
+            asset_name = container.get("asset_name", asset_name)
+        else:
+            # do import fbx and replace existing data
+            asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
+            asset_dir, container_name = asset_tools.create_unique_asset_name(
+                 asset_root, suffix=f"_{ext}")
+
+            container_name += suffix
+            if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
+                unreal.EditorAssetLibrary.make_directory(asset_dir)
+            loaded_options = {
+                "abc_conversion_preset": self.abc_conversion_preset,
+                "frameStart": int(container.get("frameStart", "1")),
+                "frameEnd": int(container.get("frameEnd", "1"))
+            }
+
+            self.import_and_containerize(
+                source_path, asset_dir, asset_name,
+                container_name, loaded_options
+            )
 
         # update metadata
         self.imprint(
@@ -276,14 +289,10 @@ class AnimationAlembicLoader(plugin.Loader):
             container.get("frameStart", "1"),
             container.get("frameEnd", "1"),
             repre_entity,
-            product_type
+            product_type,
+            source_hash=source_hash
         )
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=True
-        )
-
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
     def remove(self, container):
         path = container["namespace"]
@@ -5,13 +5,12 @@ import os
 import ayon_api
 import unreal
 from ayon_core.pipeline import (AYON_CONTAINER_ID, get_current_project_name,
-                                get_representation_path, load_container,
-                                discover_loader_plugins,
-                                loaders_from_representation)
-from ayon_core.pipeline.context_tools import get_current_folder_entity
+                                get_representation_path, load_container)
 from ayon_core.pipeline.load import LoadError
 from ayon_unreal.api import pipeline as unreal_pipeline
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import import_tasks
+from ayon_unreal.api.session import defer_save, get_active_session
 from unreal import (EditorAssetLibrary, MovieSceneSkeletalAnimationSection,
                     MovieSceneSkeletalAnimationTrack)
 
@@ -61,13 +60,8 @@ class AnimationFBXLoader(plugin.Loader):
                 f"No valid representation for version {version_ids}")
         repre_id = repre_entity["id"]
 
-        target_loader = None
-        all_loaders = discover_loader_plugins()
-        loaders = loaders_from_representation(
-            all_loaders, repre_id)
-        for loader in loaders:
-            if loader.__name__ == "SkeletalMeshFBXLoader":
-                target_loader = loader
+        registry = get_active_session().get_loader_registry()
+        target_loader = registry.get_loader_by_name("SkeletalMeshFBXLoader")
         assets = load_container(
             target_loader,
             repre_id,
@@ -86,7 +80,8 @@ class AnimationFBXLoader(plugin.Loader):
         task = unreal.AssetImportTask()
         task.options = unreal.FbxImportUI()
 
-        folder_entity = get_current_folder_entity(fields=["attrib.fps"])
+        folder_entity = get_active_session().get_current_folder_entity(
+            fields=["attrib.fps"])
 
         task.set_editor_property('filename', path)
         task.set_editor_property('destination_path', asset_dir)
@@ -134,7 +129,7 @@ class AnimationFBXLoader(plugin.Loader):
         task.options.anim_sequence_import_data.set_editor_property(
             'import_rotation', unreal.Rotator(roll=90.0, pitch=0.0, yaw=0.0))
 
-        unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+        import_tasks([task])
 
     def _process(self, path, asset_dir, asset_name,
                  instance_name, loaded_options=None):
@@ -270,23 +265,26 @@ class AnimationFBXLoader(plugin.Loader):
 
         ar = unreal.AssetRegistryHelpers.get_asset_registry()
 
-        containers = unreal_pipeline.ls()
-        for container in containers:
+        container_index = unreal_pipeline.ContainerIndex()
+        rig_containers = (
+            container
+            for rig in rigs
+            for container in container_index.by_parent(rig)
+        )
+        for container in rig_containers:
             self.log.debug(f"Checking container: {container}")
-            if container["parent"] not in rigs:
-                unreal.log("{}".format(container["parent"]))
-                # we found loaded version of the linked rigs
-                if container["loader"] != "SkeletalMeshFBXLoader":
-                    continue
-                namespace = container["namespace"]
-
-                _filter = unreal.ARFilter(
-                    class_names=["Skeleton"],
-                    package_paths=[namespace],
-                    recursive_paths=False)
-                if skeletons := ar.get_assets(_filter):
-                    skeleton = skeletons[0].get_asset()
-                    break
+            # we found loaded version of the linked rigs
+            if container["loader"] != "SkeletalMeshFBXLoader":
+                continue
+            namespace = container["namespace"]
+
+            _filter = unreal.ARFilter(
+                class_names=["Skeleton"],
+                package_paths=[namespace],
+                recursive_paths=False)
+            if skeletons := ar.get_assets(_filter):
+                skeleton = skeletons[0].get_asset()
+                break
 
         if not skeleton:
            ar = unreal.AssetRegistryHelpers.get_asset_registry()
@@ -462,10 +460,12 @@ class AnimationFBXLoader(plugin.Loader):
                 loaded_asset.set_editor_property(
                     "root_motion_root_lock",
                     unreal.RootMotionRootLock.ANIM_FIRST_FRAME)
-            EditorAssetLibrary.save_asset(asset)
+        defer_save(asset_dir)
 
         if master_level:
             unreal.EditorLevelLibrary.save_current_level()
+            # packages must be saved before the level is switched
+            get_active_session().flush_saves()
             unreal.EditorLevelLibrary.load_level(master_level)
 
     def update(self, container, context):
@@ -514,12 +514,12 @@ class AnimationFBXLoader(plugin.Loader):
         asset_content = EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
         )
-
-        for a in asset_content:
-            EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
         if master_level:
             unreal.EditorLevelLibrary.save_current_level()
+            # packages must be saved before the level is switched
+            get_active_session().flush_saves()
             unreal.EditorLevelLibrary.load_level(master_level)
 
         return asset_content
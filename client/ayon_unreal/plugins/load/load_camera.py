@@ -21,6 +21,7 @@ from ayon_unreal.api.pipeline import (
     generate_hierarchy_path,
     remove_map_and_sequence
 )
+from ayon_unreal.api.session import defer_save
 
 
 class CameraLoader(plugin.Loader):
@@ -224,9 +225,7 @@ class CameraLoader(plugin.Loader):
         asset_content = EditorAssetLibrary.list_assets(
             hierarchy_dir, recursive=True, include_folder=False
         )
-
-        for a in asset_content:
-            EditorAssetLibrary.save_asset(a)
+        defer_save(hierarchy_dir)
 
         return asset_content
 
@@ -276,12 +275,7 @@ class CameraLoader(plugin.Loader):
         EditorLevelLibrary.load_level(master_level)
 
         # Save all assets in the hierarchy
-        asset_content = EditorAssetLibrary.list_assets(
-            hierarchy_dir, recursive=True, include_folder=False
-        )
-
-        for a in asset_content:
-            EditorAssetLibrary.save_asset(a)
+        defer_save(hierarchy_dir)
 
     def switch(self, container, context):
         self.update(container, context)
@@ -3,11 +3,15 @@
 import os
 
 from ayon_core.pipeline import (
-    get_representation_path,
     AYON_CONTAINER_ID
 )
 from ayon_core.lib import EnumDef
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import (
+    get_source_hash,
+    import_tasks,
+    is_source_imported,
+)
 from ayon_unreal.api.pipeline import (
     create_container,
     imprint,
@@ -15,6 +19,7 @@ from ayon_unreal.api.pipeline import (
     format_asset_directory,
     UNREAL_VERSION
 )
+from ayon_unreal.api.session import defer_save
 
 import unreal  # noqa
 
@@ -133,7 +138,7 @@ class PointCacheAlembicLoader(plugin.Loader):
                         frame_start, frame_end, loaded_options
                     )
 
-        unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+        import_tasks([task])
 
         if not unreal.EditorAssetLibrary.does_asset_exist(
             f"{asset_dir}/{container_name}"):
@@ -149,7 +154,8 @@ class PointCacheAlembicLoader(plugin.Loader):
         representation,
         frame_start,
         frame_end,
-        product_type
+        product_type,
+        source_hash=None
     ):
         data = {
             "schema": "ayon:container-2.0",
@@ -163,6 +169,7 @@ class PointCacheAlembicLoader(plugin.Loader):
             "frame_start": frame_start,
             "frame_end": frame_end,
             "product_type": product_type,
+            "source_hash": source_hash,
             "folder_path": folder_path,
             # TODO these should be probably removed
             "family": product_type,
@@ -238,14 +245,13 @@ class PointCacheAlembicLoader(plugin.Loader):
             context["representation"],
             frame_start,
             frame_end,
-            context["product"]["productType"]
+            context["product"]["productType"],
+            source_hash=get_source_hash(path)
         )
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
         )
-
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
         return asset_content
 
@@ -256,26 +262,32 @@ class PointCacheAlembicLoader(plugin.Loader):
         repre_entity = context["representation"]
         asset_dir = container["namespace"]
         suffix = "_CON"
-        path = get_representation_path(repre_entity)
+        path = self.filepath_from_context(context)
         ext = os.path.splitext(path)[-1].lstrip(".")
         asset_root, asset_name = format_asset_directory(context, self.loaded_asset_dir)
-        tools = unreal.AssetToolsHelpers().get_asset_tools()
-        asset_dir, container_name = tools.create_unique_asset_name(
-            asset_root, suffix=f"_{ext}")
-
-        container_name += suffix
-
         frame_start = int(container.get("frame_start"))
         frame_end = int(container.get("frame_end"))
-        if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
-            unreal.EditorAssetLibrary.make_directory(asset_dir)
-        loaded_options = {
-            "abc_conversion_preset": self.abc_conversion_preset,
-            "show_dialog": self.show_dialog,
-        }
-        self.import_and_containerize(
-            path, asset_dir, asset_name, container_name,
-            frame_start, frame_end, loaded_options)
+        source_hash = get_source_hash(path)
+        if is_source_imported(container, source_hash):
+            # same file is already imported, only retarget container
+            asset_dir = container["namespace"]
+            container_name = container["objectName"]
+            asset_name = container.get("asset_name", asset_name)
+        else:
+            tools = unreal.AssetToolsHelpers().get_asset_tools()
+            asset_dir, container_name = tools.create_unique_asset_name(
+                asset_root, suffix=f"_{ext}")
+
+            container_name += suffix
+            if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
+                unreal.EditorAssetLibrary.make_directory(asset_dir)
+            loaded_options = {
+                "abc_conversion_preset": self.abc_conversion_preset,
+                "show_dialog": self.show_dialog,
+            }
+            self.import_and_containerize(
+                path, asset_dir, asset_name, container_name,
+                frame_start, frame_end, loaded_options)
 
 
         self.imprint(
@@ -286,15 +298,11 @@ class PointCacheAlembicLoader(plugin.Loader):
             repre_entity,
             frame_start,
             frame_end,
-            product_type
-        )
-
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=False
+            product_type,
+            source_hash=source_hash
         )
 
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
     def remove(self, container):
         path = container["namespace"]
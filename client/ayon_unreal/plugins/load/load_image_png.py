@@ -2,16 +2,21 @@
 """Load textures from PNG."""
 import os
 from ayon_core.pipeline import (
-    get_representation_path,
     AYON_CONTAINER_ID
 )
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import (
+    get_source_hash,
+    import_tasks,
+    is_source_imported,
+)
 from ayon_unreal.api.pipeline import (
     create_container,
     imprint,
     has_asset_directory_pattern_matched,
     format_asset_directory
 )
+from ayon_unreal.api.session import defer_save
 
 import unreal  # noqa
 
@@ -116,7 +121,7 @@ class TexturePNGLoader(plugin.Loader):
                     f"{asset_dir}/{asset_name}"):
                         task = self.get_task(filepath, asset_dir, asset_name, False)
 
-            unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+            import_tasks([task])
 
         if not unreal.EditorAssetLibrary.does_asset_exist(
             f"{asset_dir}/{container_name}"):
@@ -130,7 +135,8 @@ class TexturePNGLoader(plugin.Loader):
             container_name,
             asset_name,
             repre_entity,
-            product_type
+            product_type,
+            source_hash=None
     ):
         data = {
             "schema": "ayon:container-2.0",
@@ -143,6 +149,7 @@ class TexturePNGLoader(plugin.Loader):
             "representation": repre_entity["id"],
             "parent": repre_entity["versionId"],
             "product_type": product_type,
+            "source_hash": source_hash,
             # TODO these shold be probably removed
             "asset": folder_path,
             "family": product_type
@@ -199,14 +206,14 @@ class TexturePNGLoader(plugin.Loader):
             container_name,
             asset_name,
             context["representation"],
-            context["product"]["productType"]
+            context["product"]["productType"],
+            source_hash=get_source_hash(path)
         )
 
         asset_contents = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
         )
-        for unreal_asset in asset_contents:
-            unreal.EditorAssetLibrary.save_asset(unreal_asset)
+        defer_save(asset_dir)
 
         return asset_contents
 
@@ -214,22 +221,29 @@ class TexturePNGLoader(plugin.Loader):
         folder_path = context["folder"]["path"]
         product_type = context["product"]["productType"]
         repre_entity = context["representation"]
-        path = get_representation_path(repre_entity)
+        path = self.filepath_from_context(context)
         ext = os.path.splitext(path)[-1].lstrip(".")
 
         # Create directory for asset and Ayon container
         suffix = "_CON"
         asset_root, asset_name = format_asset_directory(context, self.loaded_asset_dir)
 
-        tools = unreal.AssetToolsHelpers().get_asset_tools()
-        asset_dir, container_name = tools.create_unique_asset_name(
-            asset_root, suffix=f"_{ext}")
+        source_hash = get_source_hash(path)
+        if is_source_imported(container, source_hash):
+            # same file is already imported, only retarget container
+            asset_dir = container["namespace"]
+            container_name = container["objectName"]
+            asset_name = container.get("asset_name", asset_name)
+        else:
+            tools = unreal.AssetToolsHelpers().get_asset_tools()
+            asset_dir, container_name = tools.create_unique_asset_name(
+                asset_root, suffix=f"_{ext}")
 
-        container_name += suffix
-        if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
-            unreal.EditorAssetLibrary.make_directory(asset_dir)
+            container_name += suffix
+            if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
+                unreal.EditorAssetLibrary.make_directory(asset_dir)
 
-        self.import_and_containerize(path, asset_dir, asset_name, container_name)
+            self.import_and_containerize(path, asset_dir, asset_name, container_name)
 
         self.imprint(
             folder_path,
@@ -237,14 +251,11 @@ class TexturePNGLoader(plugin.Loader):
             container_name,
             asset_name,
             repre_entity,
-            product_type
+            product_type,
+            source_hash=source_hash
         )
 
-        asset_contents = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=False
-        )
-        for unreal_asset in asset_contents:
-            unreal.EditorAssetLibrary.save_asset(unreal_asset)
+        defer_save(asset_dir)
 
     def remove(self, container):
         path = container["namespace"]
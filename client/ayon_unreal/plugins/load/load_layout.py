@@ -8,14 +8,14 @@ from unreal import (
     EditorLevelLibrary,
     LevelSequenceEditorBlueprintLibrary as LevelSequenceLib,
 )
-import ayon_api
 
 from ayon_core.pipeline import (
     get_representation_path,
     get_current_project_name,
 )
-from ayon_core.settings import get_current_project_settings
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import batch_import
+from ayon_unreal.api.prefetch import prefetch
 from ayon_unreal.api.pipeline import (
     generate_master_level_sequence,
     set_sequence_hierarchy,
@@ -27,6 +27,7 @@ from ayon_unreal.api.pipeline import (
     update_container,
     remove_map_and_sequence
 )
+from ayon_unreal.api.session import defer_save, get_active_session
 from ayon_unreal.api.lib import (
     import_animation
 )
@@ -156,6 +157,8 @@ class LayoutLoader(plugin.LayoutLoader):
         repre_entities_by_version_id = self._get_repre_entities_by_version_id(
             project_name, data, loaded_extension, force_loaded=force_loaded
         )
+        elements = []
+        repre_entities_to_load = {}
         for element in data:
             repre_id = None
             repr_format = None
@@ -186,7 +189,29 @@ class LayoutLoader(plugin.LayoutLoader):
             if not repr_format:
                 self.log.warning(f"Representation name not defined for element: {element}")
                 continue
+            elements.append((element, repre_id, repr_format))
+            if repre_id not in repr_loaded:
+                repre_entities_to_load[repre_id] = repre_entity
+
+        # copy files of all elements to local cache in background, while
+        # the editor imports them one by one
+        prefetch(repre_entities_to_load.values())
+
+        # Load all representations first, so their files are imported
+        # in grouped imports instead of one import per representation
+        loaded_by_repre_id = {}
+        with batch_import() as batch:
+            for element, repre_id, repr_format in elements:
+                if repre_id in repr_loaded or repre_id in loaded_by_repre_id:
+                    continue
+                product_type = element.get("product_type")
+                if product_type is None:
+                    product_type = element.get("family")
+                loaded_by_repre_id[repre_id] = self._load_assets(
+                    element.get('instance_name'), repre_id,
+                    product_type, repr_format)
 
+        for element, repre_id, _ in elements:
             instance_name = element.get('instance_name')
 
             skeleton = None
@@ -198,9 +223,7 @@ class LayoutLoader(plugin.LayoutLoader):
                 if product_type is None:
                     product_type = element.get("family")
 
-                assets = self._load_assets(
-                    instance_name, repre_id,
-                    product_type, repr_format)
+                assets = batch.get_result(loaded_by_repre_id[repre_id])
 
                 container = None
 
@@ -279,7 +302,8 @@ class LayoutLoader(plugin.LayoutLoader):
         Returns:
             list(str): list of container content
         """
-        data = get_current_project_settings()
+        session = get_active_session(options)
+        data = session.get_project_settings()
         create_sequences = data["unreal"]["level_sequences_for_layouts"]
 
         # Create directory for asset and Ayon container
@@ -309,7 +333,8 @@ class LayoutLoader(plugin.LayoutLoader):
 
             project_name = get_current_project_name()
             folder_attributes = (
-                ayon_api.get_folder_by_path(project_name, folder_path)["attrib"]
+                session.get_folder_entity(
+                    project_name, folder_path)["attrib"]
             )
             shot.set_display_rate(
                 unreal.FrameRate(folder_attributes.get("fps"), 1.0))
@@ -364,14 +389,12 @@ class LayoutLoader(plugin.LayoutLoader):
 
         asset_content = EditorAssetLibrary.list_assets(
             save_dir, recursive=True, include_folder=False)
-
-        for a in asset_content:
-            EditorAssetLibrary.save_asset(a)
+        defer_save(save_dir)
 
         return asset_content
 
     def update(self, container, context):
-        data = get_current_project_settings()
+        data = get_active_session().get_project_settings()
         create_sequences = data["unreal"]["level_sequences_for_layouts"]
 
         ar = unreal.AssetRegistryHelpers.get_asset_registry()
@@ -443,11 +466,9 @@ class LayoutLoader(plugin.LayoutLoader):
 
         save_dir = hierarchy_dir if create_sequences else asset_dir
 
-        asset_content = EditorAssetLibrary.list_assets(
-            save_dir, recursive=True, include_folder=False)
-
-        for a in asset_content:
-            EditorAssetLibrary.save_asset(a)
+        defer_save(save_dir)
+        # packages must be saved before the level is switched
+        get_active_session().flush_saves()
 
         if master_level:
             EditorLevelLibrary.load_level(master_level)
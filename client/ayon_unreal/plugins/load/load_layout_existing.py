@@ -125,6 +125,7 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
         )
         containers = []
         actors_matched = []
+        container_index = upipeline.ContainerIndex()
 
         for (repre_entity, lasset) in layout_data:
             # For every actor in the scene, check if it has a representation in
@@ -187,16 +188,10 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
             if found:
                 continue
 
-            all_containers = upipeline.ls()
-
             loaded = False
 
-            for container in all_containers:
-                repre_id = container.get('representation')
-
-                if not repre_id == repre_entity["id"]:
-                    continue
-
+            for container in container_index.by_representation(
+                    repre_entity["id"]):
                 asset_dir = container.get('namespace')
 
                 arfilter = unreal.ARFilter(
@@ -233,6 +228,10 @@ class ExistingLayoutLoader(plugin.LayoutLoader):
                 product_type,
                 extension
             )
+            # New container was created, index it for following elements
+            for asset in assets or []:
+                if asset.split(".")[0].endswith("_CON"):
+                    container_index.add(upipeline.parse_container(asset))
             con = None
             for asset in assets:
                 obj = ar.get_asset_by_object_path(asset).get_asset()
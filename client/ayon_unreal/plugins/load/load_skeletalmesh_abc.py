@@ -3,11 +3,16 @@
 import os
 
 from ayon_core.pipeline import (
-    get_representation_path,
     AYON_CONTAINER_ID
 )
 from ayon_core.lib import EnumDef
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import (
+    get_load_result,
+    get_source_hash,
+    import_tasks,
+    is_source_imported,
+)
 from ayon_unreal.api.pipeline import (
     create_container,
     imprint,
@@ -15,6 +20,7 @@ from ayon_unreal.api.pipeline import (
     format_asset_directory,
     UNREAL_VERSION
 )
+from ayon_unreal.api.session import defer_save
 import unreal  # noqa
 
 
@@ -131,8 +137,25 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
 
     def import_and_containerize(
         self, filepath, asset_dir, asset_name, container_name,
-        loaded_options, asset_path=None
+        loaded_options, asset_path=None, on_imported=None
     ):
+        """Import file and create container for it.
+
+        Args:
+            filepath (str): Path to imported file.
+            asset_dir (str): Directory of the container.
+            asset_name (str): Name of imported asset.
+            container_name (str): Name of the container.
+            loaded_options (dict): Import options.
+            asset_path (Optional[str]): Existing asset to reimport.
+            on_imported (Optional[Callable[[], Any]]): Called after import
+                and containerisation, import is deferred to the end of
+                import batch when given.
+
+        Returns:
+            ImportJob: Import job.
+
+        """
         task = None
         if asset_path:
             loaded_asset_dir = unreal.Paths.split(asset_path)[0]
@@ -144,12 +167,19 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
                     task = self.get_task(
                         filepath, asset_dir, asset_name, False, loaded_options)
 
-        unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
-
-        if not unreal.EditorAssetLibrary.does_asset_exist(
-            f"{asset_dir}/{container_name}"):
-                # Create Asset Container
-                create_container(container=container_name, path=asset_dir)
+        def _containerize():
+            if not unreal.EditorAssetLibrary.does_asset_exist(
+                f"{asset_dir}/{container_name}"):
+                    # Create Asset Container
+                    create_container(container=container_name, path=asset_dir)
+            if on_imported is not None:
+                return on_imported()
+
+        if on_imported is None:
+            job = import_tasks([task])
+            _containerize()
+            return job
+        return import_tasks([task], on_imported=_containerize)
 
     def imprint(
         self,
@@ -160,7 +190,8 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
         representation,
         product_type,
         frameStart,
-        frameEnd
+        frameEnd,
+        source_hash=None
     ):
         data = {
             "schema": "ayon:container-2.0",
@@ -173,6 +204,7 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
             "representation": representation["id"],
             "parent": representation["versionId"],
             "product_type": product_type,
+            "source_hash": source_hash,
             "frameStart":frameStart,
             "frameEnd": frameEnd,
             # TODO these should be probably removed
@@ -195,7 +227,8 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
             data (dict): Those would be data to be imprinted.
 
         Returns:
-            list(str): list of container content
+            list(str): list of container content, or only the container
+                while import is deferred by import batch
         """
         # Create directory for asset and ayon container
         folder_entity = context["folder"]
@@ -223,36 +256,41 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
             asset_name, asset_dir, name, extension=ext)
         if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
             unreal.EditorAssetLibrary.make_directory(asset_dir)
-        self.import_and_containerize(path, asset_dir, asset_name,
-                                     container_name, loaded_options,
-                                     asset_path=asset_path)
 
-        if asset_path:
-            unreal.EditorAssetLibrary.rename_asset(
-                f"{asset_path}",
-                f"{asset_dir}/{asset_name}.{asset_name}"
+        def _finish_load():
+            if asset_path:
+                unreal.EditorAssetLibrary.rename_asset(
+                    f"{asset_path}",
+                    f"{asset_dir}/{asset_name}.{asset_name}"
+                )
+
+            product_type = context["product"]["productType"]
+            self.imprint(
+                folder_path,
+                asset_dir,
+                container_name,
+                asset_name,
+                context["representation"],
+                product_type,
+                folder_entity["attrib"]["frameStart"],
+                folder_entity["attrib"]["frameEnd"],
+                source_hash=get_source_hash(path)
             )
 
-        product_type = context["product"]["productType"]
-        self.imprint(
-            folder_path,
-            asset_dir,
-            container_name,
-            asset_name,
-            context["representation"],
-            product_type,
-            folder_entity["attrib"]["frameStart"],
-            folder_entity["attrib"]["frameEnd"],
-        )
-
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=True
-        )
+            asset_content = unreal.EditorAssetLibrary.list_assets(
+                asset_dir, recursive=True, include_folder=True
+            )
+            defer_save(asset_dir)
 
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+            return asset_content
 
-        return asset_content
+        job = self.import_and_containerize(
+            path, asset_dir, asset_name, container_name, loaded_options,
+            asset_path=asset_path, on_imported=_finish_load
+        )
+        # inside of import batch the import is deferred
+        return get_load_result(
+            job, f"{asset_dir}/{container_name}.{container_name}")
 
     def update(self, container, context):
         folder_path = context["folder"]["path"]
@@ -261,24 +299,31 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
 
         # Create directory for folder and Ayon container
         suffix = "_CON"
-        path = get_representation_path(repre_entity)
+        path = self.filepath_from_context(context)
         ext = os.path.splitext(path)[-1].lstrip(".")
         asset_root, asset_name = format_asset_directory(context, self.loaded_asset_dir)
-        tools = unreal.AssetToolsHelpers().get_asset_tools()
-        asset_dir, container_name = tools.create_unique_asset_name(
-            asset_root, suffix=f"_{ext}")
-
-        container_name += suffix
-        if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
-            unreal.EditorAssetLibrary.make_directory(asset_dir)
-        loaded_options = {
-            "default_conversion": False,
-            "abc_conversion_preset": self.abc_conversion_preset,
-            "frameStart": container.get("frameStart", 1),
-            "frameEnd": container.get("frameEnd", 1)
-        }
-        self.import_and_containerize(path, asset_dir, asset_name,
-                                     container_name, loaded_options)
+        source_hash = get_source_hash(path)
+        if is_source_imported(container, source_hash):
+            # same file is already imported, only retarget container
+            asset_dir = container["namespace"]
+            container_name = container["objectName"]
+            asset_name = container.get("asset_name", asset_name)
+        else:
+            tools = unreal.AssetToolsHelpers().get_asset_tools()
+            asset_dir, container_name = tools.create_unique_asset_name(
+                asset_root, suffix=f"_{ext}")
+
+            container_name += suffix
+            if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
+                unreal.EditorAssetLibrary.make_directory(asset_dir)
+            loaded_options = {
+                "default_conversion": False,
+                "abc_conversion_preset": self.abc_conversion_preset,
+                "frameStart": container.get("frameStart", 1),
+                "frameEnd": container.get("frameEnd", 1)
+            }
+            self.import_and_containerize(path, asset_dir, asset_name,
+                                         container_name, loaded_options)
 
         self.imprint(
             folder_path,
@@ -288,15 +333,11 @@ class SkeletalMeshAlembicLoader(plugin.Loader):
             repre_entity,
             product_type,
             container.get("frameStart", 1),
-            container.get("frameEnd", 1)
-        )
-
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=False
+            container.get("frameEnd", 1),
+            source_hash=source_hash
         )
 
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
     def remove(self, container):
         path = container["namespace"]
@@ -3,10 +3,15 @@
 import os
 
 from ayon_core.pipeline import (
-    get_representation_path,
     AYON_CONTAINER_ID
 )
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import (
+    get_load_result,
+    get_source_hash,
+    import_tasks,
+    is_source_imported,
+)
 from ayon_unreal.api.pipeline import (
     create_container,
     imprint,
@@ -14,6 +19,7 @@ from ayon_unreal.api.pipeline import (
     format_asset_directory,
     UNREAL_VERSION
 )
+from ayon_unreal.api.session import defer_save
 from ayon_core.lib import EnumDef, BoolDef
 import unreal  # noqa
 
@@ -140,8 +146,25 @@ class StaticMeshAlembicLoader(plugin.Loader):
 
     def import_and_containerize(
         self, filepath, asset_dir, asset_name, container_name,
-        loaded_options, asset_path=None
+        loaded_options, asset_path=None, on_imported=None
     ):
+        """Import file and create container for it.
+
+        Args:
+            filepath (str): Path to imported file.
+            asset_dir (str): Directory of the container.
+            asset_name (str): Name of imported asset.
+            container_name (str): Name of the container.
+            loaded_options (dict): Import options.
+            asset_path (Optional[str]): Existing asset to reimport.
+            on_imported (Optional[Callable[[], Any]]): Called after import
+                and containerisation, import is deferred to the end of
+                import batch when given.
+
+        Returns:
+            ImportJob: Import job.
+
+        """
         task = None
         if asset_path:
             loaded_asset_dir = unreal.Paths.split(asset_path)[0]
@@ -153,11 +176,19 @@ class StaticMeshAlembicLoader(plugin.Loader):
                     task = self.get_task(
                         filepath, asset_dir, asset_name, False, loaded_options)
 
-        unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
-        if not unreal.EditorAssetLibrary.does_asset_exist(
-            f"{asset_dir}/{container_name}"):
-                # Create Asset Container
-                create_container(container=container_name, path=asset_dir)
+        def _containerize():
+            if not unreal.EditorAssetLibrary.does_asset_exist(
+                f"{asset_dir}/{container_name}"):
+                    # Create Asset Container
+                    create_container(container=container_name, path=asset_dir)
+            if on_imported is not None:
+                return on_imported()
+
+        if on_imported is None:
+            job = import_tasks([task])
+            _containerize()
+            return job
+        return import_tasks([task], on_imported=_containerize)
 
     def imprint(
         self,
@@ -166,7 +197,8 @@ class StaticMeshAlembicLoader(plugin.Loader):
         container_name,
         asset_name,
         representation,
-        product_type
+        product_type,
+        source_hash=None
     ):
         data = {
             "schema": "ayon:container-2.0",
@@ -179,6 +211,7 @@ class StaticMeshAlembicLoader(plugin.Loader):
             "representation": representation["id"],
             "parent": representation["versionId"],
             "product_type": product_type,
+            "source_hash": source_hash,
             # TODO these should be probably removed
             "asset": folder_path,
             "family": product_type
@@ -198,7 +231,8 @@ class StaticMeshAlembicLoader(plugin.Loader):
             data (dict): Those would be data to be imprinted.
 
         Returns:
-            list(str): list of container content
+            list(str): list of container content, or only the container
+                while import is deferred by import batch
         """
         # Create directory for asset and Ayon container
         folder_path = context["folder"]["path"]
@@ -223,33 +257,41 @@ class StaticMeshAlembicLoader(plugin.Loader):
         container_name += suffix
         asset_path = has_asset_directory_pattern_matched(
             asset_name, asset_dir, name, extension=ext)
+
+        def _finish_load():
+            product_type = context["product"]["productType"]
+            self.imprint(
+                folder_path,
+                asset_dir,
+                container_name,
+                asset_name,
+                context["representation"],
+                product_type,
+                source_hash=get_source_hash(path)
+            )
+            if asset_path:
+                unreal.EditorAssetLibrary.rename_asset(
+                    f"{asset_path}",
+                    f"{asset_dir}/{asset_name}.{asset_name}"
+                )
+            asset_content = unreal.EditorAssetLibrary.list_assets(
+                asset_dir, recursive=True, include_folder=False
+            )
+            defer_save(asset_dir)
+
+            return asset_content
+
         if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
             unreal.EditorAssetLibrary.make_directory(asset_dir)
-            self.import_and_containerize(path, asset_dir, asset_name,
-                                         container_name, loaded_options,
-                                         asset_path=asset_path)
-
-        product_type = context["product"]["productType"]
-        self.imprint(
-            folder_path,
-            asset_dir,
-            container_name,
-            asset_name,
-            context["representation"],
-            product_type
-        )
-        if asset_path:
-            unreal.EditorAssetLibrary.rename_asset(
-                f"{asset_path}",
-                f"{asset_dir}/{asset_name}.{asset_name}"
+            job = self.import_and_containerize(
+                path, asset_dir, asset_name, container_name, loaded_options,
+                asset_path=asset_path, on_imported=_finish_load
             )
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=False
-        )
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+            # inside of import batch the import is deferred
+            return get_load_result(
+                job, f"{asset_dir}/{container_name}.{container_name}")
 
-        return asset_content
+        return _finish_load()
 
     def update(self, container, context):
         folder_path = context["folder"]["path"]
@@ -258,22 +300,29 @@ class StaticMeshAlembicLoader(plugin.Loader):
 
         # Create directory for asset and Ayon container
         suffix = "_CON"
-        path = get_representation_path(repre_entity)
+        path = self.filepath_from_context(context)
         ext = os.path.splitext(path)[-1].lstrip(".")
         asset_root, asset_name = format_asset_directory(context, self.loaded_asset_dir)
-        tools = unreal.AssetToolsHelpers().get_asset_tools()
-        asset_dir, container_name = tools.create_unique_asset_name(
-            asset_root, suffix=f"_{ext}")
-
-        container_name += suffix
-        if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
-            unreal.EditorAssetLibrary.make_directory(asset_dir)
-        loaded_options = {
-            "default_conversion": False,
-            "abc_conversion_preset": self.abc_conversion_preset
-        }
-        self.import_and_containerize(path, asset_dir, asset_name,
-                                     container_name, loaded_options)
+        source_hash = get_source_hash(path)
+        if is_source_imported(container, source_hash):
+            # same file is already imported, only retarget container
+            asset_dir = container["namespace"]
+            container_name = container["objectName"]
+            asset_name = container.get("asset_name", asset_name)
+        else:
+            tools = unreal.AssetToolsHelpers().get_asset_tools()
+            asset_dir, container_name = tools.create_unique_asset_name(
+                asset_root, suffix=f"_{ext}")
+
+            container_name += suffix
+            if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
+                unreal.EditorAssetLibrary.make_directory(asset_dir)
+            loaded_options = {
+                "default_conversion": False,
+                "abc_conversion_preset": self.abc_conversion_preset
+            }
+            self.import_and_containerize(path, asset_dir, asset_name,
+                                         container_name, loaded_options)
 
         self.imprint(
             folder_path,
@@ -281,15 +330,11 @@ class StaticMeshAlembicLoader(plugin.Loader):
             container_name,
             asset_name,
             repre_entity,
-            product_type
-        )
-
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=False
+            product_type,
+            source_hash=source_hash
         )
 
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
     def remove(self, container):
         path = container["namespace"]
@@ -3,16 +3,22 @@
 import os
 
 from ayon_core.pipeline import (
-    get_representation_path,
     AYON_CONTAINER_ID
 )
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import (
+    get_load_result,
+    get_source_hash,
+    import_tasks,
+    is_source_imported,
+)
 from ayon_unreal.api.pipeline import (
     create_container,
     imprint,
     has_asset_directory_pattern_matched,
     format_asset_directory
 )
+from ayon_unreal.api.session import defer_save
 import unreal  # noqa
 
 
@@ -78,8 +84,26 @@ class StaticMeshFBXLoader(plugin.Loader):
 
     @classmethod
     def import_and_containerize(
-        cls, filepath, asset_dir, asset_name, container_name, asset_path=None
+        cls, filepath, asset_dir, asset_name, container_name, asset_path=None,
+        on_imported=None
     ):
+        """Import file and create container for it.
+
+        Args:
+            filepath (str): Path to imported file.
+            asset_dir (str): Directory of the container.
+            asset_name (str): Name of imported asset.
+            container_name (str): Name of the container.
+            asset_path (Optional[str]): Existing asset to reimport.
+            on_imported (Optional[Callable[[], Any]]): Called after import
+                and containerisation, import is deferred to the end of
+                import batch when given.
+
+        Returns:
+            ImportJob: Import job.
+
+        """
+        tasks = []
         if cls.use_interchange:
             unreal.log("Import using interchange method")
             unreal.SystemLibrary.execute_console_command(None, "Interchange.FeatureFlags.Import.FBX 1")
@@ -107,21 +131,27 @@ class StaticMeshFBXLoader(plugin.Loader):
 
         else:
             unreal.log("Import using defered method")
-            task = None
             if asset_path:
                 loaded_asset_dir = unreal.Paths.split(asset_path)[0]
-                task = cls.get_task(filepath, loaded_asset_dir, asset_name, True)
+                tasks.append(cls.get_task(filepath, loaded_asset_dir, asset_name, True))
             else:
                 if not unreal.EditorAssetLibrary.does_asset_exist(
                     f"{asset_dir}/{asset_name}"):
-                        task = cls.get_task(filepath, asset_dir, asset_name, False)
-
-            unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
-
-        if not unreal.EditorAssetLibrary.does_asset_exist(
-            f"{asset_dir}/{container_name}"):
-                # Create Asset Container
-                create_container(container=container_name, path=asset_dir)
+                        tasks.append(cls.get_task(filepath, asset_dir, asset_name, False))
+
+        def _containerize():
+            if not unreal.EditorAssetLibrary.does_asset_exist(
+                f"{asset_dir}/{container_name}"):
+                    # Create Asset Container
+                    create_container(container=container_name, path=asset_dir)
+            if on_imported is not None:
+                return on_imported()
+
+        if on_imported is None:
+            job = import_tasks(tasks)
+            _containerize()
+            return job
+        return import_tasks(tasks, on_imported=_containerize)
 
     def imprint(
         self,
@@ -130,7 +160,8 @@ class StaticMeshFBXLoader(plugin.Loader):
         container_name,
         asset_name,
         repre_entity,
-        product_type
+        product_type,
+        source_hash=None
     ):
         data = {
             "schema": "ayon:container-2.0",
@@ -143,6 +174,7 @@ class StaticMeshFBXLoader(plugin.Loader):
             "representation": repre_entity["id"],
             "parent": repre_entity["versionId"],
             "product_type": product_type,
+            "source_hash": source_hash,
             # TODO these shold be probably removed
             "asset": folder_path,
             "family": product_type
@@ -162,7 +194,8 @@ class StaticMeshFBXLoader(plugin.Loader):
             options (dict): Those would be data to be imprinted.
 
         Returns:
-            list(str): list of container content
+            list(str): list of container content, or only the container
+                while import is deferred by import batch
         """
         # Create directory for asset and Ayon container
         folder_path = context["folder"]["path"]
@@ -182,33 +215,39 @@ class StaticMeshFBXLoader(plugin.Loader):
         )
         if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
             unreal.EditorAssetLibrary.make_directory(asset_dir)
-        self.import_and_containerize(
-            path, asset_dir, asset_name,
-            container_name, asset_path=asset_path
-        )
-        if asset_path:
-            unreal.EditorAssetLibrary.rename_asset(
-                f"{asset_path}",
-                f"{asset_dir}/{asset_name}.{asset_name}"
-            )
 
-        self.imprint(
-            folder_path,
-            asset_dir,
-            container_name,
-            asset_name,
-            context["representation"],
-            context["product"]["productType"]
-        )
+        def _finish_load():
+            if asset_path:
+                unreal.EditorAssetLibrary.rename_asset(
+                    f"{asset_path}",
+                    f"{asset_dir}/{asset_name}.{asset_name}"
+                )
+
+            self.imprint(
+                folder_path,
+                asset_dir,
+                container_name,
+                asset_name,
+                context["representation"],
+                context["product"]["productType"],
+                source_hash=get_source_hash(path)
+            )
 
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=True
-        )
+            asset_content = unreal.EditorAssetLibrary.list_assets(
+                asset_dir, recursive=True, include_folder=True
+            )
+            defer_save(asset_dir)
 
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+            return asset_content
 
-        return asset_content
+        job = self.import_and_containerize(
+            path, asset_dir, asset_name,
+            container_name, asset_path=asset_path,
+            on_imported=_finish_load
+        )
+        # inside of import batch the import is deferred
+        return get_load_result(
+            job, f"{asset_dir}/{container_name}.{container_name}")
 
     def update(self, container, context):
         folder_path = context["folder"]["path"]
@@ -217,19 +256,26 @@ class StaticMeshFBXLoader(plugin.Loader):
 
         # Create directory for asset and Ayon container
         suffix = "_CON"
-        path = get_representation_path(repre_entity)
+        path = self.filepath_from_context(context)
         ext = os.path.splitext(path)[-1].lstrip(".")
         asset_root, asset_name = format_asset_directory(context, self.loaded_asset_dir)
-        tools = unreal.AssetToolsHelpers().get_asset_tools()
-        asset_dir, container_name = tools.create_unique_asset_name(
-            asset_root, suffix=f"_{ext}")
+        source_hash = get_source_hash(path)
+        if is_source_imported(container, source_hash):
+            # same file is already imported, only retarget container
+            asset_dir = container["namespace"]
+            container_name = container["objectName"]
+            asset_name = container.get("asset_name", asset_name)
+        else:
+            tools = unreal.AssetToolsHelpers().get_asset_tools()
+            asset_dir, container_name = tools.create_unique_asset_name(
+                asset_root, suffix=f"_{ext}")
 
 
-        container_name += suffix
-        if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
-            unreal.EditorAssetLibrary.make_directory(asset_dir)
-        self.import_and_containerize(path, asset_dir, asset_name,
-                                     container_name)
+            container_name += suffix
+            if not unreal.EditorAssetLibrary.does_directory_exist(asset_dir):
+                unreal.EditorAssetLibrary.make_directory(asset_dir)
+            self.import_and_containerize(path, asset_dir, asset_name,
+                                         container_name)
 
         self.imprint(
             folder_path,
@@ -237,15 +283,11 @@ class StaticMeshFBXLoader(plugin.Loader):
             container_name,
             asset_name,
             repre_entity,
-            product_type
-        )
-
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            asset_dir, recursive=True, include_folder=False
+            product_type,
+            source_hash=source_hash
         )
 
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
     def remove(self, container):
         path = container["namespace"]
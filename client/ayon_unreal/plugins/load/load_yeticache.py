@@ -7,7 +7,9 @@ from ayon_core.pipeline import (
     AYON_CONTAINER_ID
 )
 from ayon_unreal.api import plugin
+from ayon_unreal.api.importing import import_tasks
 from ayon_unreal.api import pipeline as unreal_pipeline
+from ayon_unreal.api.session import defer_save
 import unreal  # noqa
 
 
@@ -119,7 +121,7 @@ class YetiLoader(plugin.Loader):
                 f"{asset_dir}/{asset_name}"):
                     task = self.get_task(path, asset_dir, asset_name, False)
 
-        unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])  # noqa: E501
+        import_tasks([task])
 
         if not unreal.EditorAssetLibrary.does_asset_exist(
             f"{asset_dir}/{container_name}"):
@@ -153,9 +155,7 @@ class YetiLoader(plugin.Loader):
         asset_content = unreal.EditorAssetLibrary.list_assets(
             asset_dir, recursive=True, include_folder=True
         )
-
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(asset_dir)
 
         return asset_content
 
@@ -168,7 +168,7 @@ class YetiLoader(plugin.Loader):
         task = self.get_task(source_path, destination_path, name, False)
 
         # do import fbx and replace existing data
-        unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task])
+        import_tasks([task])
 
         container_path = f'{container["namespace"]}/{container["objectName"]}'
         # update metadata
@@ -180,12 +180,7 @@ class YetiLoader(plugin.Loader):
             }
         )
 
-        asset_content = unreal.EditorAssetLibrary.list_assets(
-            destination_path, recursive=True, include_folder=True
-        )
-
-        for a in asset_content:
-            unreal.EditorAssetLibrary.save_asset(a)
+        defer_save(destination_path)
 
     def remove(self, container):
         path = container["namespace"]
@@ -2,6 +2,8 @@ import unreal
 
 import pyblish.api
 
+from ayon_unreal.api.pipeline import get_instance_members
+
 
 class CollectInstanceMembers(pyblish.api.InstancePlugin):
     """
@@ -33,14 +35,11 @@ class CollectInstanceMembers(pyblish.api.InstancePlugin):
             self.log.error(f"{inst_path}.{inst_name}")
             raise RuntimeError(f"Instance {instance} not found.")
 
-        if not pub_instance.get_editor_property("add_external_assets"):
+        members = get_instance_members(pub_instance)
+        if members is None:
             # No external assets in the instance
             return
 
-        assets = pub_instance.get_editor_property('asset_data_external')
-
-        members = [asset.get_path_name() for asset in assets]
-
         self.log.debug(f"Members: {members}")
 
         instance.data["members"] = members
@@ -3,13 +3,14 @@ import os
 import re
 import json
 import math
+import textwrap
 
 import unreal
 from unreal import EditorLevelLibrary as ell
-from unreal import EditorAssetLibrary as eal
 import ayon_api
 
 from ayon_core.pipeline import publish
+from ayon_unreal.api.pipeline import get_container_index
 
 
 class ExtractLayout(publish.Extractor):
@@ -32,46 +33,62 @@ class ExtractLayout(publish.Extractor):
         assert current_level == instance.data.get("level"), \
             "Wrong level loaded"
 
-        json_data = []
         project_name = instance.context.data["projectName"]
         eas = unreal.EditorActorSubsystem()
         sel_actors = eas.get_all_level_actors()
         members = set(instance.data.get("members", []))
         actors = [a for a in sel_actors if a.get_path_name() in members]
-        for actor in actors:
-            mesh = None
-            # Check type the type of mesh
-            if actor.get_class().get_name() == 'SkeletalMeshActor':
-                mesh = actor.skeletal_mesh_component.skeletal_mesh
-            elif actor.get_class().get_name() == 'StaticMeshActor':
-                mesh = actor.static_mesh_component.static_mesh
-
-            if mesh:
+
+        # Containers are looked up by directory of the mesh they loaded
+        containers_by_dir = {}
+        for container in get_container_index():
+            containers_by_dir.setdefault(
+                container.get("namespace"), container)
+        blend_ids_by_version = {}
+        basis = self.get_basis_matrix()
+
+        json_filename = "{}.json".format(instance.name)
+        json_path = os.path.join(staging_dir, json_filename)
+
+        failed = False
+        with open(json_path, "w+") as file:
+            writer = _JsonListWriter(file)
+            for actor in actors:
+                mesh = None
+                # Check type the type of mesh
+                if actor.get_class().get_name() == 'SkeletalMeshActor':
+                    mesh = actor.skeletal_mesh_component.skeletal_mesh
+                elif actor.get_class().get_name() == 'StaticMeshActor':
+                    mesh = actor.static_mesh_component.static_mesh
+
+                if not mesh:
+                    continue
+
                 # Search the reference to the Asset Container for the object
-                path = unreal.Paths.get_path(mesh.get_path_name())
-                filter = unreal.ARFilter(
-                    class_names=["AyonAssetContainer"], package_paths=[path])
-                ar = unreal.AssetRegistryHelpers.get_asset_registry()
-                try:
-                    asset_container = ar.get_assets(filter)[0].get_asset()
-                except IndexError:
+                mesh_path = mesh.get_path_name()
+                container = containers_by_dir.get(
+                    mesh_path.split(".")[0].rsplit("/", 1)[0])
+                if container is None:
                     self.log.error("AssetContainer not found.")
-                    return
+                    failed = True
+                    break
 
-                parent_id = eal.get_metadata_tag(asset_container, "parent")
-                repre_id = eal.get_metadata_tag(asset_container, "representation")
-                family = eal.get_metadata_tag(asset_container, "family")
+                parent_id = container.get("parent", "")
+                repre_id = container.get("representation", "")
+                family = container.get("family", "")
                 json_element = {}
                 json_element["reference"] = str(repre_id)
                 json_element["representation"] = str(repre_id)
                 # TODO: remove the option after tweaking
                 # the layout loader in blender
                 if instance.data.get("export_blender", False):
-                    blend = ayon_api.get_representation_by_name(
-                        project_name, "blend", parent_id, fields={"id"}
-                    )
-                    blend_id = blend["id"]
-                    json_element["reference"] = str(blend_id)
+                    if parent_id not in blend_ids_by_version:
+                        blend = ayon_api.get_representation_by_name(
+                            project_name, "blend", parent_id, fields={"id"}
+                        )
+                        blend_ids_by_version[parent_id] = blend["id"]
+                    json_element["reference"] = str(
+                        blend_ids_by_version[parent_id])
                 instance_name = mesh.get_name()
                 extension = instance_name.split("_")[-1]
                 asset_name = re.match(f'(.+)_{extension}$', instance_name)
@@ -80,39 +97,36 @@ class ExtractLayout(publish.Extractor):
                 json_element["instance_name"] = asset_name.group(1)
                 json_element["asset_name"] = instance_name
                 json_element["extension"] = extension
+
+                # Read transform components only once
                 transform = actor.get_actor_transform()
+                translation = transform.translation
+                euler = transform.rotation.euler()
+                scale = transform.scale3d
+                translation = (translation.x, translation.y, translation.z)
+                euler = (euler.x, euler.y, euler.z)
+                scale = (scale.x, scale.y, scale.z)
+
                 json_element["host"] = self.hosts
                 json_element["transform"] = {
-                    "translation": {
-                        "x": transform.translation.x,
-                        "y": transform.translation.y,
-                        "z": transform.translation.z
-                    },
+                    "translation": dict(zip("xyz", translation)),
                     "rotation": {
-                        "x": math.radians(transform.rotation.euler().x),
-                        "y": math.radians(transform.rotation.euler().y),
-                        "z": math.radians(transform.rotation.euler().z)
+                        axis: math.radians(value)
+                        for axis, value in zip("xyz", euler)
                     },
-                    "scale": {
-                        "x": transform.scale3d.x,
-                        "y": transform.scale3d.y,
-                        "z": transform.scale3d.z
-                    }
-                }
-                json_element["transform_matrix"] = self.get_transform_matrix(transform)
-                json_element["basis"] = self.get_basis_matrix()
-                json_element["rotation"] = {
-                    "x": transform.rotation.euler().x,
-                    "y": transform.rotation.euler().y,
-                    "z": transform.rotation.euler().z
+                    "scale": dict(zip("xyz", scale))
                 }
-                json_data.append(json_element)
-
-        json_filename = "{}.json".format(instance.name)
-        json_path = os.path.join(staging_dir, json_filename)
-
-        with open(json_path, "w+") as file:
-            json.dump(json_data, fp=file, indent=2)
+                json_element["transform_matrix"] = self.get_transform_matrix(
+                    translation, euler, scale)
+                json_element["basis"] = basis
+                json_element["rotation"] = dict(zip("xyz", euler))
+                writer.write(json_element)
+            writer.close()
+
+        if failed:
+            # extraction failed, don't leave incomplete file behind
+            os.remove(json_path)
+            return
 
         if "representations" not in instance.data:
             instance.data["representations"] = []
@@ -146,34 +160,23 @@ class ExtractLayout(publish.Extractor):
         ]
         return basis_list
 
-    def get_transform_matrix(self, transform):
+    def get_transform_matrix(self, translation, rotation, scale):
         """Get transform matrix for each actor
 
         Args:
-            transform (Matrix): Actor's transformation
+            translation (tuple[float, float, float]): Actor's translation.
+            rotation (tuple[float, float, float]): Actor's rotation as
+                euler angles in degrees.
+            scale (tuple[float, float, float]): Actor's scale.
 
         Returns:
             list: Actor's transformation data
         """
-        translation = [
-            transform.translation.x,
-            transform.translation.z,
-            transform.translation.y
-        ]
-        rotation = [
-            transform.rotation.euler().x,
-            transform.rotation.euler().z,
-            transform.rotation.euler().y
-        ]
-        scale = [
-            transform.scale3d.x,
-            transform.scale3d.z,
-            transform.scale3d.y,
-        ]
+        # swap Y and Z axis
         transform = unreal.Transform(
-            location=translation,
-            rotation=rotation,
-            scale=scale
+            location=[translation[0], translation[2], translation[1]],
+            rotation=[rotation[0], rotation[2], rotation[1]],
+            scale=[scale[0], scale[2], scale[1]]
         )
         transform_m_matrix = transform.to_matrix()
         transform_matrix = [
@@ -187,3 +190,28 @@ class ExtractLayout(publish.Extractor):
              transform_m_matrix.w_plane.z, transform_m_matrix.w_plane.w]
         ]
         return transform_matrix
+
+
+class _JsonListWriter:
+    """Write JSON list element by element.
+
+    Output is the same as of `json.dump(elements, fp, indent=2)`, but
+    elements don't have to be kept in memory.
+
+    Args:
+        fp (IO[str]): File to write to.
+
+    """
+
+    def __init__(self, fp):
+        self._fp = fp
+        self._count = 0
+
+    def write(self, element):
+        prefix = "[\n" if not self._count else ",\n"
+        data = json.dumps(element, indent=2)
+        self._fp.write(prefix + textwrap.indent(data, "  "))
+        self._count += 1
+
+    def close(self):
+        self._fp.write("\n]" if self._count else "[]")
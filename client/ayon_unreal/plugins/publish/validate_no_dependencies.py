@@ -1,7 +1,7 @@
-import unreal
-
 import pyblish.api
 
+from ayon_unreal.api.dependencies import get_dependency_analyzer
+
 
 class ValidateNoDependencies(pyblish.api.InstancePlugin):
     """Ensure that the uasset has no dependencies
@@ -16,26 +16,19 @@ class ValidateNoDependencies(pyblish.api.InstancePlugin):
     hosts = ["unreal"]
     optional = True
 
+    # check also dependencies of dependencies
+    transitive = False
+
     def process(self, instance):
-        ar = unreal.AssetRegistryHelpers.get_asset_registry()
-        all_dependencies = []
-
-        for obj in instance[:]:
-            asset = ar.get_asset_by_object_path(obj)
-            dependencies = ar.get_dependencies(
-                asset.package_name,
-                unreal.AssetRegistryDependencyOptions(
-                    include_soft_package_references=False,
-                    include_hard_package_references=True,
-                    include_searchable_names=False,
-                    include_soft_management_references=False,
-                    include_hard_management_references=False
-                ))
-            if dependencies:
-                for dep in dependencies:
-                    if str(dep).startswith("/Game/"):
-                        all_dependencies.append(str(dep))
+        analyzer = get_dependency_analyzer(instance.context)
+        result = analyzer.analyze(
+            instance[:], transitive=self.transitive, root="/Game/")
+
+        for cycle in result.cycles:
+            self.log.warning(
+                f"Dependency cycle found: {' -> '.join(cycle)}")
 
+        all_dependencies = result.dependencies
         if all_dependencies:
             raise RuntimeError(
                 f"Dependencies found: {all_dependencies}")
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Synthetic projects for benchmarks."""
+import uuid
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+PROJECT_SIZES = (100, 1000, 10000)
+
+
+def encode_metadata(data):
+    """Encode metadata like `imprint()` does, with list of their keys."""
+    from ayon_unreal.api.metadata import encode_data, encode_value
+    from ayon_unreal.lib import AYON_METADATA_KEYS_TAG
+
+    encoded = encode_data(data)
+    encoded[AYON_METADATA_KEYS_TAG] = encode_value(sorted(encoded))
+    return encoded
+
+
+def build_project(unreal, count, with_tags=True):
+    """Create project with containers and their loaded assets.
+
+    Every container has one static mesh loaded in its directory and
+    every tenth container has publish instance next to it.
+
+    Args:
+        unreal (types.ModuleType): Simulated `unreal` module.
+        count (int): Number of containers.
+        with_tags (bool): Metadata are available as Asset Registry tags.
+            When disabled, containers must be loaded to read metadata.
+
+    Returns:
+        list[dict]: Imprinted container data with `asset_dir` of
+            container.
+
+    """
+    state = unreal.state
+    if not with_tags:
+        state.registered_tags = set()
+    containers = []
+    for i in range(count):
+        folder = f"sq{i // 100:03d}/sh{i:05d}"
+        product = f"modelMain{i % 7}"
+        asset_dir = f"/Game/Ayon/{folder}/{product}_v001"
+        mesh = state.add_asset(
+            f"{asset_dir}/{product}", unreal.StaticMesh, saved=True)
+        data = {
+            "schema": "ayon:container-2.0",
+            "id": "ayon.load.container",
+            "name": product,
+            "namespace": f"{folder.replace('/', '_')}_{product}",
+            "asset_name": product,
+            "container_name": f"{product}_CON",
+            "loader": "StaticMeshFBXLoader",
+            "representation": str(uuid.UUID(int=i)),
+            "parent": str(uuid.UUID(int=count + i // 3)),
+            "product_type": "model",
+            "family": "model",
+            "folder_path": f"/{folder}",
+            "loaded_assets": [mesh.get_path_name()],
+        }
+        container = state.add_asset(
+            f"{asset_dir}/{product}_CON", unreal.AyonAssetContainer)
+        container._metadata.update(encode_metadata(data))
+        state.save(container._package)
+        containers.append(dict(data, asset_dir=asset_dir))
+
+        if i % 10 == 0:
+            instance = state.add_asset(
+                f"{asset_dir}/{product}_INS", unreal.AyonPublishInstance)
+            instance._metadata.update(encode_metadata({
+                "id": "ayon.create.instance",
+                "productType": "model",
+                "folderPath": f"/{folder}",
+                "members": [mesh.get_path_name()],
+                "active": True,
+            }))
+            state.save(instance._package)
+    state.loaded.clear()
+    unreal.calls.clear()
+    return containers
+
+
+@pytest.fixture(params=PROJECT_SIZES, ids=lambda size: f"{size}")
+def project_size(request):
+    return request.param
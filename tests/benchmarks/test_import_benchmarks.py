@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of batched import of loader tasks."""
+import os
+
+from .conftest import build_project
+
+
+def _make_tasks(unreal, count):
+    tasks = []
+    for i in range(count):
+        ext, options = (
+            ("fbx", unreal.FbxImportUI) if i % 2 else
+            ("abc", unreal.AbcImportSettings)
+        )
+        task = unreal.AssetImportTask()
+        task.set_editor_property("filename", f"/publish/model{i}.{ext}")
+        task.set_editor_property(
+            "destination_path", f"/Game/Ayon/model{i}_v001")
+        task.set_editor_property("destination_name", f"model{i}")
+        task.set_editor_property("save", True)
+        task.set_editor_property("options", options())
+        tasks.append(task)
+    return tasks
+
+
+def test_import_tasks(benchmark, unreal, project_size):
+    from ayon_unreal.api.importing import import_tasks
+
+    tasks = _make_tasks(unreal, project_size)
+
+    def run():
+        return [import_tasks([task], on_imported=list) for task in tasks]
+
+    jobs = benchmark.pedantic(run, rounds=1)
+
+    assert all(job.done for job in jobs)
+    assert unreal.calls["AssetTools.import_asset_tasks"] == project_size
+
+
+def test_batch_import(benchmark, unreal, project_size):
+    from ayon_unreal.api.importing import batch_import, import_tasks
+
+    tasks = _make_tasks(unreal, project_size)
+    order = []
+
+    def run():
+        with batch_import():
+            jobs = [
+                import_tasks(
+                    [task], on_imported=lambda i=i: order.append(i) or i)
+                for i, task in enumerate(tasks)
+            ]
+            assert not any(job.done for job in jobs)
+        return jobs
+
+    jobs = benchmark.pedantic(run, rounds=1)
+
+    assert [job.result for job in jobs] == list(range(project_size))
+    assert order == list(range(project_size))
+    # one import per importer type
+    assert unreal.calls["AssetTools.import_asset_tasks"] == 2
+    assert len(unreal.state.imports) == project_size
+
+
+def test_unchanged_source(
+        benchmark, unreal, pipeline, project_size, tmp_path):
+    from ayon_unreal.api.importing import get_source_hash, is_source_imported
+    from ayon_unreal.api.session import load_session
+
+    source = tmp_path / "hero_modelMain.fbx"
+    source.write_bytes(os.urandom(4 * 1024 * 1024))
+    containers = build_project(unreal, project_size)
+    with load_session():
+        source_hash = get_source_hash(str(source))
+    for container in containers:
+        container["namespace"] = container["asset_dir"]
+        container["objectName"] = container["container_name"]
+        container["source_hash"] = source_hash
+
+    def run():
+        with load_session():
+            return [
+                is_source_imported(container, get_source_hash(str(source)))
+                for container in containers
+            ]
+
+    assert all(benchmark.pedantic(run, rounds=1))
+    assert not unreal.calls["AssetTools.import_asset_tasks"]
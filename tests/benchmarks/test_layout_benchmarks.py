@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of layout loading on synthetic layouts."""
+import json
+
+import pytest
+
+LAYOUT_SIZES = (10, 100, 1000)
+IDENTITY = [
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+]
+
+
+@pytest.fixture(params=LAYOUT_SIZES, ids=lambda size: f"{size}")
+def layout_size(request):
+    return request.param
+
+
+def _write_layout(path, count):
+    """Write layout with one model instance of each of `count` versions."""
+    data = [
+        {
+            "representation": f"repre{i:05d}",
+            "version": f"version{i:05d}",
+            "extension": "fbx",
+            "product_type": "model",
+            "instance_name": f"modelMain{i:05d}",
+            "transform_matrix": IDENTITY,
+            "basis": IDENTITY,
+            "host": ["unreal"],
+        }
+        for i in range(count)
+    ]
+    with open(path, "w") as stream:
+        json.dump(data, stream)
+    return data
+
+
+@pytest.fixture
+def layout_loader(unreal, pipeline, monkeypatch):
+    """Layout loader with loads of models simulated by import tasks."""
+    from ayon_unreal.api.importing import get_load_result, import_tasks
+    from ayon_unreal.plugins.load.load_layout import LayoutLoader
+
+    def get_repre_entities_by_version_id(project_name, data, *_args, **_kw):
+        return {
+            element["version"]: [{
+                "id": element["representation"],
+                "versionId": element["version"],
+                "name": element["extension"],
+            }]
+            for element in data
+        }
+
+    def load_assets(instance_name, repre_id, product_type, repr_format):
+        asset_dir = f"/Game/Ayon/Assets/{repre_id}"
+        task = unreal.AssetImportTask()
+        task.set_editor_property("filename", f"/publish/{repre_id}.fbx")
+        task.set_editor_property("destination_path", asset_dir)
+        task.set_editor_property("destination_name", repre_id)
+        task.set_editor_property("options", unreal.FbxImportUI())
+
+        def on_imported():
+            pipeline.create_container(f"{repre_id}_CON", asset_dir)
+            return unreal.EditorAssetLibrary.list_assets(asset_dir)
+
+        return get_load_result(
+            import_tasks([task], on_imported=on_imported),
+            f"{asset_dir}/{repre_id}_CON.{repre_id}_CON"
+        )
+
+    loader = LayoutLoader()
+    monkeypatch.setattr(
+        loader, "_get_repre_entities_by_version_id",
+        get_repre_entities_by_version_id)
+    monkeypatch.setattr(loader, "_load_assets", load_assets)
+    return loader
+
+
+def test_layout_process(
+    benchmark, unreal, layout_loader, layout_size, tmp_path
+):
+    lib_path = str(tmp_path / "layout.json")
+    _write_layout(lib_path, layout_size)
+
+    loaded_assets = benchmark.pedantic(
+        layout_loader._process,
+        args=(lib_path, "project", "/Game/Ayon/layout", None),
+        rounds=1
+    )
+
+    assert len(loaded_assets) == layout_size
+    assert len(unreal.state.actors) == layout_size
+    # all models are imported in one grouped import
+    assert unreal.calls["AssetTools.import_asset_tasks"] == 1
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of pipeline hot paths on synthetic projects."""
+from .conftest import build_project
+
+
+def _consume(iterable):
+    return sum(1 for _ in iterable)
+
+
+def test_ls_from_tags(benchmark, unreal, pipeline, project_size):
+    build_project(unreal, project_size)
+
+    count = benchmark(
+        lambda: _consume(pipeline.ls(use_cache=False)))
+
+    assert count == project_size
+    assert not unreal.state.loaded
+
+
+def test_ls_loading_assets(benchmark, unreal, pipeline, project_size):
+    build_project(unreal, project_size, with_tags=False)
+
+    count = benchmark(
+        lambda: _consume(pipeline.ls(use_cache=False)))
+
+    assert count == project_size
+    assert len(unreal.state.loaded) == project_size
+
+
+def test_ls_cached(benchmark, unreal, pipeline, project_size):
+    build_project(unreal, project_size, with_tags=False)
+    _consume(pipeline.ls())
+    unreal.state.loaded.clear()
+
+    count = benchmark(lambda: _consume(pipeline.ls()))
+
+    assert count == project_size
+    assert not unreal.state.loaded
+
+
+def test_ls_lazy(benchmark, unreal, pipeline, project_size):
+    build_project(unreal, project_size)
+
+    def run():
+        return [
+            container["representation"]
+            for container in pipeline.ls(use_cache=False, lazy=True)
+        ]
+
+    assert len(benchmark(run)) == project_size
+
+
+def test_ls_inst(benchmark, unreal, pipeline, project_size):
+    build_project(unreal, project_size)
+
+    count = benchmark(
+        lambda: _consume(pipeline.ls_inst(use_cache=False)))
+
+    assert count == len(range(0, project_size, 10))
+
+
+def test_container_index(benchmark, unreal, pipeline, project_size):
+    containers = build_project(unreal, project_size)
+    listed = list(pipeline.ls(use_cache=False))
+    representation_id = containers[-1]["representation"]
+
+    def run():
+        index = pipeline.ContainerIndex(listed)
+        return index.by_representation(representation_id)
+
+    assert len(benchmark(run)) == 1
+
+
+def _imprint_changes(containers):
+    return {
+        f"{data['asset_dir']}/{data['container_name']}": {
+            "representation": data["representation"],
+            "loaded_assets": data["loaded_assets"],
+        }
+        for data in containers
+    }
+
+
+def test_imprint(benchmark, unreal, pipeline, project_size):
+    changes = _imprint_changes(build_project(unreal, project_size))
+
+    def run():
+        # counts are checked for the last round, benchmark may run once
+        unreal.calls.clear()
+        for node, data in changes.items():
+            pipeline.imprint(node, data)
+
+    benchmark.pedantic(run, rounds=3)
+    assert unreal.calls["EditorAssetLibrary.save_asset"] == project_size
+
+
+def test_imprint_many(benchmark, unreal, pipeline, project_size):
+    changes = _imprint_changes(build_project(unreal, project_size))
+
+    def run():
+        unreal.calls.clear()
+        pipeline.imprint_many(changes)
+
+    benchmark.pedantic(run, rounds=3)
+    assert unreal.calls["EditorAssetLibrary.save_loaded_assets"] == 1
+
+
+def test_has_asset_existing_directory(
+    benchmark, unreal, pipeline, project_size
+):
+    build_project(unreal, project_size)
+
+    result = benchmark(
+        pipeline.has_asset_existing_directory,
+        "missing_asset", "/Game/Ayon/sq000/sh00000/")
+
+    assert result is None
+
+
+def test_set_instance_members(benchmark, unreal, pipeline, project_size):
+    containers = build_project(unreal, project_size)
+    members = [
+        path for data in containers for path in data["loaded_assets"]]
+    instance = unreal.AyonPublishInstance(
+        name="modelMain_INS", package="/Game/Ayon/modelMain_INS")
+
+    def run():
+        unreal.calls.clear()
+        return pipeline.set_instance_members(instance, members)
+
+    missing = benchmark.pedantic(run, rounds=3)
+
+    assert not missing
+    assert len(instance.get_editor_property("asset_data_external")) == (
+        project_size)
+    assert unreal.calls["AssetRegistry.get_assets"] == 1
+    assert not unreal.calls["AssetRegistry.get_asset_by_object_path"]
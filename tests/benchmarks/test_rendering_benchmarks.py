@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of render queue setup on synthetic sequences."""
+import pytest
+
+from .conftest import encode_metadata
+
+SHOT_COUNTS = (10, 100, 1000)
+RENDER_CONFIG = "/Game/Ayon/render_config"
+
+
+@pytest.fixture(params=SHOT_COUNTS, ids=lambda count: f"{count}")
+def shot_count(request):
+    return request.param
+
+
+def _build_render_instance(unreal, shot_count):
+    """Create render instance of master sequence with `shot_count` shots.
+
+    Returns:
+        unreal.Object: Publish instance, selected in Content Browser.
+
+    """
+    state = unreal.state
+    master = state.add_asset("/Game/Ayon/sq010/sq010", unreal.LevelSequence)
+    sub_track = master.add_master_track(unreal.MovieSceneSubTrack)
+    for i in range(shot_count):
+        shot = state.add_asset(
+            f"/Game/Ayon/sq010/sh{i:04d}/sh{i:04d}", unreal.LevelSequence)
+        section = sub_track.add_section()
+        section.set_sequence(shot)
+        section.set_range(1001 + i * 10, 1011 + i * 10)
+    level = state.add_asset("/Game/Ayon/sq010/sq010_map", unreal.World)
+    state.current_level = level
+    state.add_asset(RENDER_CONFIG, unreal.MoviePipelineConfig)
+
+    instance = state.add_asset(
+        "/Game/Ayon/sq010/renderMain_INS", unreal.AyonPublishInstance)
+    instance._metadata.update(encode_metadata({
+        "id": "ayon.create.instance",
+        "productType": "render",
+        "sequence": master.get_path_name(),
+        "master_sequence": master.get_path_name(),
+        "master_level": level.get_path_name(),
+        "output": "sq010",
+        "frameStart": 1001,
+        "frameEnd": 1001 + shot_count * 10,
+    }))
+    state.save(instance._package)
+    state.selected_assets = [instance]
+    return instance
+
+
+def test_start_rendering(benchmark, unreal, pipeline, shot_count, monkeypatch):
+    from ayon_unreal.api import rendering
+
+    class Anatomy:
+        def __init__(self, project_name):
+            self.roots = {"renders": "/renders"}
+
+    monkeypatch.setenv("AYON_PROJECT_NAME", "project")
+    monkeypatch.setattr(rendering, "Anatomy", Anatomy)
+    monkeypatch.setattr(
+        rendering, "get_project_settings", lambda project_name: {
+            "unreal": {
+                "render_config_path": RENDER_CONFIG,
+                "render_format": "exr",
+                "preroll_frames": 0,
+            }
+        })
+    _build_render_instance(unreal, shot_count)
+    unreal.calls.clear()
+
+    benchmark.pedantic(rendering.start_rendering, rounds=1)
+
+    (queue,) = unreal.state.render_queues
+    jobs = queue.get_jobs()
+    assert len(jobs) == shot_count
+    output = jobs[-1].get_configuration().find_setting_by_class(
+        unreal.MoviePipelineOutputSetting)
+    assert output.output_directory.path == (
+        f"/renders/project/sq010/sh{shot_count - 1:04d}")
+    assert unreal.calls["MoviePipelinePIEExecutor.execute"] == 1
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks of saving packages dirtied by loads."""
+from .conftest import build_project
+
+
+def _dirty_loaded_dirs(unreal, containers, every=10):
+    """Dirty meshes of every n-th container, returns their directories."""
+    directories = []
+    for data in containers[::every]:
+        unreal.state.dirty.update(
+            path.rpartition(".")[0] for path in data["loaded_assets"])
+        directories.append(data["asset_dir"])
+    return directories
+
+
+def test_save_asset_loop(benchmark, unreal, pipeline, project_size):
+    containers = build_project(unreal, project_size)
+    directories = _dirty_loaded_dirs(unreal, containers)
+
+    def run():
+        for directory in directories:
+            content = unreal.EditorAssetLibrary.list_assets(
+                directory, recursive=True, include_folder=False)
+            for path in content:
+                unreal.EditorAssetLibrary.save_asset(path)
+
+    benchmark.pedantic(run, rounds=1)
+
+    assert not unreal.state.dirty
+
+
+def test_deferred_save(benchmark, unreal, pipeline, project_size):
+    from ayon_unreal.api.session import defer_save, load_session
+
+    containers = build_project(unreal, project_size)
+    directories = _dirty_loaded_dirs(unreal, containers)
+
+    def run():
+        with load_session():
+            for directory in directories:
+                defer_save(directory)
+            assert unreal.state.dirty
+
+    benchmark.pedantic(run, rounds=1)
+
+    assert not unreal.state.dirty
+    assert unreal.calls["EditorLoadingAndSavingUtils.save_packages"] == 1
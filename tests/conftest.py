@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Shared fixtures running AYON Unreal client code against simulator."""
+import os
+import sys
+import tempfile
+
+import pytest
+
+from tests import unreal_sim
+
+CLIENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "client")
+if CLIENT_DIR not in sys.path:
+    sys.path.insert(0, CLIENT_DIR)
+
+# Simulator must be installed before any `ayon_unreal` module imports
+# `unreal`, state is reset for every test by `unreal` fixture.
+unreal_sim.install(tempfile.mkdtemp(prefix="unreal_sim_"))
+
+
+@pytest.fixture
+def unreal(tmp_path):
+    """Simulated `unreal` module with empty project.
+
+    Metadata keys are registered as Asset Registry tags like in projects
+    prepared by the launch hook.
+
+    """
+    pytest.importorskip("ayon_core")
+    from ayon_unreal.lib import AYON_METADATA_TAGS
+
+    return unreal_sim.install(
+        str(tmp_path / "project"), registered_tags=AYON_METADATA_TAGS)
+
+
+@pytest.fixture
+def pipeline(unreal, monkeypatch):
+    """`ayon_unreal.api.pipeline` with module caches reset."""
+    from ayon_unreal.api import events, importing, pipeline, session
+
+    monkeypatch.setattr(pipeline, "_container_cache", None)
+    monkeypatch.setattr(pipeline, "_container_index", None)
+    monkeypatch.setattr(pipeline, "_containers_latest_state", None)
+    monkeypatch.setattr(pipeline, "_asset_name_index", None)
+    monkeypatch.setattr(events, "_event_bus", None)
+    monkeypatch.setattr(importing, "_import_callbacks", [])
+    monkeypatch.setattr(session, "_batch_session", None)
+    monkeypatch.setattr(session, "_batch_tick_handle", None)
+    monkeypatch.setattr(session, "_slate_ticking", None)
+    return pipeline
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""Save sample packages by Unreal Editor for package reader tests.
+
+Samples built by `make_packages` follow the reader's understanding of the
+format. Packages saved here by the engine itself, together with values
+the editor reports for them, catch where that understanding is wrong.
+
+Run in Unreal Editor 5.x with AYON integration plugin enabled, from
+the Python console or as commandlet:
+
+    UnrealEditor-Cmd <project> -run=pythonscript
+        -script=<repo>/tests/fixtures/export_engine_packages.py
+
+Container, material and level packages are copied to `engine` directory
+next to this module, each with JSON sidecar of expected values. Commit
+both, and export again with each newly supported engine version.
+"""
+import json
+import os
+import shutil
+
+import unreal
+
+ENGINE_PACKAGES_DIR = os.path.join(os.path.dirname(__file__), "engine")
+ROOT = "/Game/AyonFixtures/modelMain_v001"
+LEVEL = "/Game/AyonFixtures/shot010_layout"
+CONTAINER_METADATA = {
+    "schema": "ayon:container-2.0",
+    "id": "ayon.load.container",
+    "name": "modelMain",
+    "namespace": ROOT,
+    "container_name": "modelMain_CON",
+    "loader": "StaticMeshFBXLoader",
+    "representation": "2f0e8f5a9c1e11ee8c900242ac120002",
+    "product_type": "model",
+}
+
+
+def _create_container():
+    tools = unreal.AssetToolsHelpers().get_asset_tools()
+    eal = unreal.EditorAssetLibrary
+    for path in (f"{ROOT}/modelMain_CON", f"{ROOT}/M_modelMain"):
+        if eal.does_asset_exist(path):
+            eal.delete_asset(path)
+    tools.create_asset(
+        "M_modelMain", ROOT, None, unreal.MaterialFactoryNew())
+    container = tools.create_asset(
+        "modelMain_CON", ROOT, None, unreal.AyonAssetContainerFactory())
+    for key, value in CONTAINER_METADATA.items():
+        eal.set_metadata_tag(container, key, value)
+    eal.save_directory(ROOT, only_if_is_dirty=False, recursive=True)
+    return [f"{ROOT}/modelMain_CON", f"{ROOT}/M_modelMain"]
+
+
+def _create_level():
+    eal = unreal.EditorAssetLibrary
+    if eal.does_asset_exist(LEVEL):
+        eal.delete_asset(LEVEL)
+    level_subsystem = unreal.get_editor_subsystem(
+        unreal.LevelEditorSubsystem)
+    level_subsystem.new_level(LEVEL)
+    actor_subsystem = unreal.get_editor_subsystem(
+        unreal.EditorActorSubsystem)
+    actor = actor_subsystem.spawn_actor_from_class(
+        unreal.StaticMeshActor, unreal.Vector())
+    actor.static_mesh_component.set_material(
+        0, eal.load_asset(f"{ROOT}/M_modelMain"))
+    level_subsystem.save_current_level()
+    return LEVEL
+
+
+def _get_expected(package_name):
+    ar = unreal.AssetRegistryHelpers.get_asset_registry()
+    asset = unreal.EditorAssetLibrary.load_asset(package_name)
+    asset_data = ar.get_asset_by_object_path(asset.get_path_name())
+    options = unreal.AssetRegistryDependencyOptions(
+        include_soft_package_references=False,
+        include_hard_package_references=True,
+        include_searchable_names=False,
+        include_soft_management_references=False,
+        include_hard_management_references=False
+    )
+    tags = {}
+    for key in CONTAINER_METADATA:
+        value = unreal.AssetRegistryHelpers.get_tag_value(asset_data, key)
+        if value is not None:
+            tags[key] = str(value)
+    engine_version = unreal.SystemLibrary.get_engine_version()
+    return {
+        "package_name": package_name,
+        "engine_version": engine_version.split("-")[0],
+        "asset_name": asset.get_name(),
+        "class_name": asset.get_class().get_name(),
+        "dependencies": sorted(
+            str(name)
+            for name in ar.get_dependencies(package_name, options) or []
+            if str(name).startswith("/Game/")
+        ),
+        "tags": tags,
+    }
+
+
+def main():
+    os.makedirs(ENGINE_PACKAGES_DIR, exist_ok=True)
+    content_dir = unreal.Paths.convert_relative_path_to_full(
+        unreal.Paths.project_content_dir())
+    for package_name in _create_container() + [_create_level()]:
+        expected = _get_expected(package_name)
+        ext = ".umap" if package_name == LEVEL else ".uasset"
+        source = os.path.join(
+            content_dir, f"{package_name[len('/Game/'):]}{ext}")
+        filename = os.path.basename(source)
+        shutil.copyfile(source, os.path.join(ENGINE_PACKAGES_DIR, filename))
+        with open(
+            os.path.join(ENGINE_PACKAGES_DIR, f"{filename}.json"), "w"
+        ) as stream:
+            json.dump(expected, stream, indent=4, sort_keys=True)
+        unreal.log(f"Exported {package_name} to {ENGINE_PACKAGES_DIR}")
+
+
+if __name__ == "__main__":
+    main()
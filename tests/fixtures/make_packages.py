@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""Build small sample package headers used by package reader tests.
+
+Samples contain only the header serialized the way Unreal Editor saves
+it, export data is omitted. Run the module to regenerate sample files:
+
+    python -m tests.fixtures.make_packages
+"""
+import os
+import struct
+
+PACKAGES_DIR = os.path.join(os.path.dirname(__file__), "packages")
+
+PACKAGE_FILE_TAG = 0x9E2A83C1
+PKG_CONTAINS_MAP = 0x00020000
+
+
+def _fstring(value):
+    if not value:
+        return struct.pack("<i", 0)
+    try:
+        data = (value + "\0").encode("ascii")
+        return struct.pack("<i", len(data)) + data
+    except UnicodeEncodeError:
+        data = (value + "\0").encode("utf-16-le")
+        return struct.pack("<i", -(len(data) // 2)) + data
+
+
+def _engine_version(major, minor, patch):
+    return struct.pack("<HHHI", major, minor, patch, 0) + _fstring(
+        f"++UE{major}+Release-{major}.{minor}")
+
+
+class PackageBuilder:
+    """Serialize package header of given version.
+
+    Args:
+        ue4 (int): UE4 object version.
+        ue5 (int): UE5 object version, 0 for Unreal 4 packages.
+        engine_version (tuple[int, int, int]): Saved by engine version.
+
+    """
+
+    def __init__(self, ue4, ue5=0, engine_version=(5, 1, 0)):
+        self.ue4 = ue4
+        self.ue5 = ue5
+        self.legacy = -8 if ue5 else -7
+        self.engine_version = engine_version
+        self.package_flags = 0
+        self.names = []
+        self.imports = []
+        self.exports = []
+        self.soft_references = []
+        self.asset_registry = []
+
+    def name(self, value):
+        base, number = value, 0
+        head, sep, tail = value.rpartition("_")
+        if sep and tail.isdigit() and not tail.startswith("0"):
+            base, number = head, int(tail) + 1
+        if base not in self.names:
+            self.names.append(base)
+        return struct.pack("<ii", self.names.index(base), number)
+
+    def add_import(self, class_package, class_name, outer, object_name):
+        """Add import, returns its package index."""
+        self.imports.append((class_package, class_name, outer, object_name))
+        return -len(self.imports)
+
+    def add_package_import(self, package_name):
+        return self.add_import(
+            "/Script/CoreUObject", "Package", 0, package_name)
+
+    def add_export(self, class_index, object_name, is_asset=True):
+        self.exports.append((class_index, object_name, is_asset))
+        return len(self.exports)
+
+    def _import_table(self):
+        data = b""
+        for class_package, class_name, outer, object_name in self.imports:
+            data += self.name(class_package) + self.name(class_name)
+            data += struct.pack("<i", outer) + self.name(object_name)
+            if self.ue4 >= 520:
+                data += self.name("None")
+            if self.ue5 >= 1003:
+                data += struct.pack("<i", 0)
+        return data
+
+    def _export_table(self, serial_offset):
+        data = b""
+        for class_index, object_name, is_asset in self.exports:
+            data += struct.pack("<iii", class_index, 0, 0)
+            data += struct.pack("<i", 0) + self.name(object_name)
+            data += struct.pack("<I", 0x1)
+            data += struct.pack("<qq", 0, serial_offset)
+            data += struct.pack("<iii", 0, 0, 0)
+            if self.ue5 < 1005:
+                data += bytes(16)
+            if self.ue5 >= 1006:
+                data += struct.pack("<i", 0)
+            data += struct.pack("<Iii", 0, 0, int(is_asset))
+            if self.ue5 >= 1003:
+                data += struct.pack("<i", 0)
+            data += struct.pack("<iiiii", -1, 0, 0, 0, 0)
+            if self.ue5 >= 1010:
+                data += struct.pack("<qq", 0, 0)
+        return data
+
+    def _asset_registry_data(self):
+        data = struct.pack("<q", 0)
+        data += struct.pack("<i", len(self.asset_registry))
+        for object_path, class_path, tags in self.asset_registry:
+            data += _fstring(object_path) + _fstring(class_path)
+            data += struct.pack("<i", len(tags))
+            for key, value in tags.items():
+                data += _fstring(key) + _fstring(value)
+        return data
+
+    def _summary(self, offsets):
+        data = struct.pack(
+            "<Iii", PACKAGE_FILE_TAG, self.legacy, 864)
+        data += struct.pack("<i", self.ue4)
+        if self.ue5:
+            data += struct.pack("<i", self.ue5)
+        data += struct.pack("<i", 0)
+        # one custom version
+        data += struct.pack("<i", 1) + bytes(range(16)) + struct.pack(
+            "<i", 3)
+        if self.ue5 >= 1016:
+            data += bytes(20)
+        data += struct.pack("<i", offsets["total"])
+        data += _fstring("None")
+        data += struct.pack("<I", self.package_flags)
+        data += struct.pack("<ii", len(self.names), offsets["names"])
+        if self.ue5 >= 1008:
+            data += struct.pack("<ii", 0, 0)
+        data += _fstring("")
+        data += struct.pack("<ii", 0, 0)
+        data += struct.pack("<ii", len(self.exports), offsets["exports"])
+        data += struct.pack("<ii", len(self.imports), offsets["imports"])
+        if self.ue5 >= 1015:
+            data += struct.pack("<iiii", 0, 0, 0, 0)
+        if self.ue5 >= 1014:
+            data += struct.pack("<i", 0)
+        data += struct.pack("<i", offsets["total"])
+        data += struct.pack(
+            "<ii", len(self.soft_references), offsets["soft"])
+        data += struct.pack("<ii", 0, 0)
+        if self.ue5 < 1016:
+            data += bytes(range(16, 32))
+        data += bytes(16)
+        data += struct.pack("<iii", 1, len(self.exports), len(self.names))
+        data += _engine_version(*self.engine_version)
+        data += _engine_version(*self.engine_version)
+        data += struct.pack("<Iii", 0, 0, 0)
+        data += struct.pack("<i", 0)
+        data += struct.pack("<iq", offsets["registry"], offsets["total"])
+        data += struct.pack("<ii", 0, 0)
+        data += struct.pack("<ii", 0, 0)
+        if self.ue5 >= 1001:
+            data += struct.pack("<i", 0)
+        if self.ue5 >= 1002:
+            data += struct.pack("<q", -1)
+        if self.ue5 >= 1009:
+            data += struct.pack("<i", 0)
+        return data
+
+    def build(self):
+        """Serialize the package header.
+
+        Returns:
+            bytes: Package content.
+
+        """
+        # tables register names, serialize them before the name table
+        imports = self._import_table()
+        soft = b"".join(self.name(ref) for ref in self.soft_references)
+        registry = self._asset_registry_data()
+        exports = self._export_table(0)
+
+        offsets = dict.fromkeys(
+            ("total", "names", "imports", "exports", "soft", "registry"), 0)
+        size = len(self._summary(offsets))
+        names = b"".join(
+            _fstring(name) + struct.pack("<HH", 0, 0) for name in self.names)
+        offsets["names"] = size
+        offsets["imports"] = offsets["names"] + len(names)
+        offsets["exports"] = offsets["imports"] + len(imports)
+        offsets["soft"] = offsets["exports"] + len(exports)
+        offsets["registry"] = offsets["soft"] + len(soft)
+        offsets["total"] = offsets["registry"] + len(registry)
+        return (
+            self._summary(offsets) + names + imports
+            + self._export_table(offsets["total"]) + soft + registry
+        )
+
+
+def build_static_mesh_package():
+    """UE 5.1 static mesh referencing material of another container."""
+    builder = PackageBuilder(ue4=522, ue5=1008, engine_version=(5, 1, 1))
+    engine = builder.add_package_import("/Script/Engine")
+    static_mesh = builder.add_import(
+        "/Script/CoreUObject", "Class", engine, "StaticMesh")
+    material = builder.add_package_import(
+        "/Game/Ayon/hero/modelMain_v001/M_hero")
+    builder.add_import(
+        "/Script/Engine", "Material", material, "M_hero")
+    builder.add_export(static_mesh, "hero_modelMain")
+    builder.soft_references.append("/Game/Ayon/hero/lookMain_v002/T_hero")
+    builder.asset_registry.append((
+        "hero_modelMain", "/Script/Engine.StaticMesh", {"NaniteEnabled": "0"}
+    ))
+    return builder.build()
+
+
+def build_container_package():
+    """UE 5.1 AYON container with metadata tags."""
+    builder = PackageBuilder(ue4=522, ue5=1008, engine_version=(5, 1, 1))
+    ayon = builder.add_package_import("/Script/Ayon")
+    container_class = builder.add_import(
+        "/Script/CoreUObject", "Class", ayon, "AyonAssetContainer")
+    builder.add_export(container_class, "modelMain_CON")
+    builder.asset_registry.append((
+        "modelMain_CON", "/Script/Ayon.AyonAssetContainer", {
+            "id": "ayon.load.container",
+            "namespace": "/Game/Ayon/hero/modelMain_v001",
+            "representation": "2f0e8f5a9c1e11ee8c900242ac120002",
+            "loader": "StaticMeshFBXLoader",
+            "product_type": "model",
+        }
+    ))
+    return builder.build()
+
+
+def build_level_package():
+    """UE 4.27 level with an instance of static mesh."""
+    builder = PackageBuilder(ue4=522, engine_version=(4, 27, 2))
+    builder.package_flags |= PKG_CONTAINS_MAP
+    engine = builder.add_package_import("/Script/Engine")
+    world = builder.add_import(
+        "/Script/CoreUObject", "Class", engine, "World")
+    mesh = builder.add_package_import(
+        "/Game/Ayon/hero/modelMain_v001/hero_modelMain")
+    builder.add_import(
+        "/Script/Engine", "StaticMesh", mesh, "hero_modelMain")
+    builder.add_export(world, "shot010_layout")
+    builder.asset_registry.append((
+        "/Game/Ayon/sq01/shot010_layout.shot010_layout",
+        "World", {}
+    ))
+    return builder.build()
+
+
+SAMPLE_PACKAGES = {
+    "hero_modelMain.uasset": build_static_mesh_package,
+    "modelMain_CON.uasset": build_container_package,
+    "shot010_layout.umap": build_level_package,
+}
+
+
+def main():
+    os.makedirs(PACKAGES_DIR, exist_ok=True)
+    for filename, build in SAMPLE_PACKAGES.items():
+        with open(os.path.join(PACKAGES_DIR, filename), "wb") as stream:
+            stream.write(build())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Sweep of containers not used by any level."""
+
+
+def _add_container(unreal, name):
+    namespace = f"/Game/Ayon/{name}_v001"
+    mesh = unreal.state.add_asset(
+        f"{namespace}/{name}", unreal.StaticMesh, saved=True)
+    unreal.state.add_asset(
+        f"{namespace}/{name}_CON", unreal.AyonAssetContainer, saved=True)
+    return {"namespace": namespace}, mesh.get_path_name().split(".")[0]
+
+
+def test_sweep_follows_referencers(unreal, pipeline):
+    from ayon_unreal.api.cleanup import UnusedContainerSweep
+
+    placed, placed_mesh = _add_container(unreal, "placed")
+    material, material_package = _add_container(unreal, "material")
+    unused, _ = _add_container(unreal, "unused")
+    _, not_selected_mesh = _add_container(unreal, "other")
+    unreal.state.add_asset("/Game/Maps/Main", unreal.World, saved=True)
+    unreal.state.dependencies.update({
+        "/Game/Maps/Main": {placed_mesh, not_selected_mesh},
+        placed_mesh: {material_package},
+    })
+    unreal.calls.clear()
+
+    report = UnusedContainerSweep().sweep([placed, material, unused])
+
+    assert report.used == [placed, material]
+    assert report.unused == [unused]
+    # referencers of the other container are never queried
+    assert unreal.calls["AssetRegistry.get_referencers"] == 6
+
+
+def test_sweep_queries_each_referencer_once(unreal, pipeline):
+    from ayon_unreal.api.cleanup import UnusedContainerSweep
+
+    meshes = []
+    containers = []
+    for name in ("a", "b", "c"):
+        container, mesh = _add_container(unreal, name)
+        containers.append(container)
+        meshes.append(mesh)
+    # shared blueprint placed in level references all meshes
+    unreal.state.add_asset("/Game/BP/Props", unreal.Blueprint, saved=True)
+    unreal.state.add_asset("/Game/Maps/Main", unreal.World, saved=True)
+    unreal.state.dependencies.update({
+        "/Game/Maps/Main": {"/Game/BP/Props"},
+        "/Game/BP/Props": set(meshes),
+    })
+    unreal.calls.clear()
+
+    sweep = UnusedContainerSweep()
+    report = sweep.sweep(containers)
+
+    assert report.used == containers
+    # 3 meshes, 3 containers and blueprint, each queried once
+    assert unreal.calls["AssetRegistry.get_referencers"] == 7
+    assert all(sweep.is_used(container) for container in containers)
+    assert unreal.calls["AssetRegistry.get_referencers"] == 7
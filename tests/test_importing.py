@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Results of loads deferred by import batch."""
+import pytest
+
+pytest.importorskip("ayon_core")
+
+CONTAINER = "/Game/Ayon/model_v001/model_CON.model_CON"
+
+
+def _load(unreal):
+    """Import model like loaders do and return their result."""
+    from ayon_unreal.api.importing import get_load_result, import_tasks
+
+    task = unreal.AssetImportTask()
+    task.set_editor_property("filename", "/publish/model_v001.fbx")
+    task.set_editor_property("destination_path", "/Game/Ayon/model_v001")
+    task.set_editor_property("destination_name", "model")
+    job = import_tasks(
+        [task],
+        on_imported=lambda: ["/Game/Ayon/model_v001/model.model", CONTAINER]
+    )
+    return get_load_result(job, CONTAINER)
+
+
+def test_load_result(unreal):
+    assert _load(unreal) == ["/Game/Ayon/model_v001/model.model", CONTAINER]
+
+
+def test_deferred_load_result(unreal):
+    from ayon_unreal.api.importing import batch_import
+
+    with batch_import() as batch:
+        loaded = _load(unreal)
+        assert loaded == [CONTAINER]
+        assert unreal.calls["AssetTools.import_asset_tasks"] == 0
+
+    assert batch.get_result(loaded) == [
+        "/Game/Ayon/model_v001/model.model", CONTAINER]
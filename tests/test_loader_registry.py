@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Loader registry memoized in load session."""
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_unreal.api import session  # noqa: E402
+
+
+class StaticMeshFBXLoader:
+    product_types = {"model", "staticMesh"}
+    representations = {"fbx"}
+
+
+class SkeletalMeshFBXLoader:
+    product_types = {"rig", "skeletalMesh"}
+    representations = {"fbx"}
+
+
+class AnyFileLoader:
+    product_types = {"*"}
+    representations = {"*"}
+
+
+class DisabledLoader:
+    product_types = set()
+    representations = {"fbx"}
+
+
+LOADERS = [
+    AnyFileLoader,
+    StaticMeshFBXLoader,
+    SkeletalMeshFBXLoader,
+    DisabledLoader,
+]
+
+
+def test_get_loader():
+    registry = session.LoaderRegistry(LOADERS)
+
+    assert registry.get_loaders("model", "fbx") == [
+        StaticMeshFBXLoader, AnyFileLoader]
+    assert registry.get_loader("rig", "fbx") is SkeletalMeshFBXLoader
+    assert registry.get_loader(
+        "rig", "fbx", "StaticMeshFBXLoader") is None
+    assert registry.get_loader(
+        "rig", "abc", "AnyFileLoader") is AnyFileLoader
+    assert registry.get_loader_by_name("DisabledLoader") is DisabledLoader
+
+
+def test_discovered_once_per_session(monkeypatch):
+    discovered = []
+
+    def discover_loader_plugins():
+        discovered.append(True)
+        return LOADERS
+
+    monkeypatch.setattr(
+        session, "discover_loader_plugins", discover_loader_plugins)
+
+    with session.load_session() as load_session:
+        for product_type in ("model", "rig", "camera"):
+            load_session.get_loader_registry().get_loader(
+                product_type, "fbx")
+    with session.load_session() as load_session:
+        load_session.get_loader_registry()
+
+    assert len(discovered) == 2
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""Codec of metadata stored on Unreal assets."""
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_unreal.api import metadata  # noqa: E402
+
+
+@pytest.mark.parametrize("value", [
+    "",
+    "model_v001",
+    "True",
+    "1001",
+    "[v001]",
+    "ayon:1:str:looks encoded",
+    True,
+    False,
+    0,
+    1001,
+    -1,
+    24.5,
+    ["/Game/Ayon/Foo.Foo", "/Game/Ayon/Bar.Bar"],
+    {"review": {"active": True}, "frames": [1, 2]},
+    [],
+    {},
+])
+def test_round_trip(value):
+    encoded = metadata.encode_value(value)
+
+    assert isinstance(encoded, str)
+    decoded = metadata.decode_value(encoded)
+    assert decoded == value
+    assert type(decoded) is type(value)
+
+
+def test_tuple_decodes_to_list():
+    assert metadata.decode_value(metadata.encode_value((1, 2))) == [1, 2]
+
+
+def test_none_is_empty_string():
+    assert metadata.encode_value(None) == ""
+    assert metadata.decode_value("") == ""
+
+
+@pytest.mark.parametrize("key, legacy, expected", [
+    ("loaded_assets", "['/Game/Ayon/Foo.Foo']", ["/Game/Ayon/Foo.Foo"]),
+    ("members", "('/Game/Foo.Foo',)", ["/Game/Foo.Foo"]),
+    ("creator_attributes", "{'review': True}", {"review": True}),
+    ("active", "True", True),
+    ("active", "False", False),
+    ("frameStart", "1001", 1001),
+    ("frame_end", "-5", -5),
+    ("frameEnd", "", ""),
+    # keys that always held strings are never evaluated
+    ("name", "True", "True"),
+    ("name", "[v001]", "[v001]"),
+    ("representation", "1001", "1001"),
+    ("members", "[broken", "[broken"),
+])
+def test_decode_legacy(key, legacy, expected):
+    assert metadata.decode_value(legacy, key) == expected
+    assert metadata.decode_data({key: legacy}) == {key: expected}
+    assert metadata.LazyMetadata({key: legacy})[key] == expected
+
+
+def test_encode_data_round_trip():
+    data = {
+        "name": "True",
+        "frameStart": 1001,
+        "active": False,
+        "members": ["/Game/Foo.Foo"],
+        "source_hash": None,
+        "loader": lambda: "StaticMeshFBXLoader",
+    }
+
+    decoded = metadata.decode_data(metadata.encode_data(data))
+
+    assert decoded == {
+        "name": "True",
+        "frameStart": 1001,
+        "active": False,
+        "members": ["/Game/Foo.Foo"],
+        "source_hash": "",
+        "loader": "StaticMeshFBXLoader",
+    }
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Offline package reader against small sample packages."""
+import glob
+import json
+import os
+import struct
+
+import pytest
+
+from tests.fixtures.make_packages import (
+    PACKAGES_DIR,
+    SAMPLE_PACKAGES,
+    PackageBuilder,
+)
+
+pytest.importorskip("ayon_core")
+
+from ayon_unreal import package_reader  # noqa: E402
+
+CONTENT_DIR = os.path.dirname(PACKAGES_DIR)
+# saved by Unreal Editor, see `tests.fixtures.export_engine_packages`
+ENGINE_PACKAGES = sorted(
+    path
+    for ext in package_reader.PACKAGE_EXTENSIONS
+    for path in glob.glob(os.path.join(
+        os.path.dirname(PACKAGES_DIR), "engine", f"*{ext}"))
+)
+
+
+def _sample(filename):
+    return os.path.join(PACKAGES_DIR, filename)
+
+
+@pytest.mark.parametrize("filename", sorted(SAMPLE_PACKAGES))
+def test_samples_are_up_to_date(filename):
+    with open(_sample(filename), "rb") as stream:
+        assert stream.read() == SAMPLE_PACKAGES[filename]()
+
+
+def test_summary():
+    with package_reader.PackageReader(_sample("shot010_layout.umap")) as r:
+        summary = r.summary
+        assert summary.legacy_file_version == -7
+        assert summary.file_version_ue4 == 522
+        assert summary.file_version_ue5 == 0
+        assert summary.is_map
+        assert str(summary.saved_by_engine_version) == "4.27.2-0"
+
+
+def test_tables():
+    path = _sample("hero_modelMain.uasset")
+    with package_reader.PackageReader(path) as reader:
+        assert "StaticMesh" in reader.names
+        assert [i.object_name for i in reader.imports] == [
+            "/Script/Engine",
+            "StaticMesh",
+            "/Game/Ayon/hero/modelMain_v001/M_hero",
+            "M_hero",
+        ]
+        (export,) = reader.exports
+        assert export.object_name == "hero_modelMain"
+        assert export.is_asset
+        assert reader.get_export_class_name(export) == "StaticMesh"
+
+
+def test_dependencies():
+    path = _sample("hero_modelMain.uasset")
+    with package_reader.PackageReader(path) as reader:
+        assert reader.get_dependencies(root="/Game/") == [
+            "/Game/Ayon/hero/modelMain_v001/M_hero"]
+        assert reader.get_dependencies() == [
+            "/Game/Ayon/hero/modelMain_v001/M_hero", "/Script/Engine"]
+        assert reader.get_soft_package_references() == [
+            "/Game/Ayon/hero/lookMain_v002/T_hero"]
+
+
+def test_asset_registry_relative_object_path():
+    path = _sample("modelMain_CON.uasset")
+    package_name = package_reader.get_package_name(path, CONTENT_DIR)
+    assert package_name == "/Game/packages/modelMain_CON"
+    with package_reader.PackageReader(path, package_name) as reader:
+        (entry,) = reader.get_asset_registry_entries()
+    assert entry.object_path == "/Game/packages/modelMain_CON.modelMain_CON"
+    assert entry.class_name == "AyonAssetContainer"
+    assert entry.tags["namespace"] == "/Game/Ayon/hero/modelMain_v001"
+
+
+@pytest.mark.parametrize("ue5", [0, 1004, 1008, 1010, 1016, 1017, 1018])
+def test_versions(tmp_path, ue5):
+    builder = PackageBuilder(ue4=522, ue5=ue5)
+    engine = builder.add_package_import("/Script/Engine")
+    builder.add_export(
+        builder.add_import("/Script/CoreUObject", "Class", engine, "Actor"),
+        "Actor_12"
+    )
+    path = tmp_path / "Actor.uasset"
+    path.write_bytes(builder.build())
+    with package_reader.PackageReader(str(path)) as reader:
+        assert reader.summary.file_version_ue5 == ue5
+        assert reader.exports[0].object_name == "Actor_12"
+
+
+def test_newer_version_with_unknown_layout(tmp_path):
+    builder = PackageBuilder(ue4=522, ue5=1100)
+    builder.add_export(builder.add_package_import("/Script/Engine"), "Foo")
+    data = builder.build()
+    summary = package_reader.read_summary(data)
+    # field added by newer version shifts name table offset
+    names = struct.pack("<ii", summary.name_count, summary.name_offset)
+    data = data.replace(
+        names, struct.pack("<ii", summary.name_count, len(data) + 1), 1)
+
+    with pytest.raises(package_reader.PackageReadError, match="1100"):
+        package_reader.read_summary(data)
+
+
+def test_invalid_packages(tmp_path):
+    empty = tmp_path / "empty.uasset"
+    empty.write_bytes(b"")
+    garbage = tmp_path / "garbage.uasset"
+    garbage.write_bytes(b"not a package")
+    truncated = tmp_path / "truncated.uasset"
+    with open(_sample("hero_modelMain.uasset"), "rb") as stream:
+        truncated.write_bytes(stream.read()[:40])
+
+    for path in (empty, garbage, truncated):
+        info = package_reader.read_package(str(path))
+        assert info.error, path
+
+
+def test_read_packages_in_processes():
+    paths = sorted(package_reader.iter_package_files(PACKAGES_DIR))
+    infos = package_reader.read_packages(
+        paths, content_dir=CONTENT_DIR, dependency_root="/Game/",
+        max_workers=2
+    )
+    assert [info.path for info in infos] == paths
+    assert not any(info.error for info in infos)
+    by_name = {info.package_name: info for info in infos}
+    level = by_name["/Game/packages/shot010_layout"]
+    assert level.dependencies == [
+        "/Game/Ayon/hero/modelMain_v001/hero_modelMain"]
+    container = by_name["/Game/packages/modelMain_CON"]
+    assert container.get_entries_by_class("AyonAssetContainer")
+
+
+@pytest.mark.parametrize("path", ENGINE_PACKAGES, ids=os.path.basename)
+def test_engine_saved_package(path):
+    with open(f"{path}.json", "r") as stream:
+        expected = json.load(stream)
+
+    info = package_reader.read_package(
+        path, expected["package_name"], dependency_root="/Game/")
+
+    assert info.error is None
+    version = info.summary.saved_by_engine_version
+    assert f"{version.major}.{version.minor}.{version.patch}" == (
+        expected["engine_version"])
+    assert (expected["asset_name"], expected["class_name"]) in info.exports
+    assert sorted(info.dependencies) == expected["dependencies"]
+    (entry,) = [
+        entry for entry in info.asset_registry
+        if entry.object_path.endswith(f".{expected['asset_name']}")
+    ]
+    assert entry.class_name == expected["class_name"]
+    for key, value in expected["tags"].items():
+        assert entry.tags[key] == value
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""Pipeline functions against simulated editor."""
+import pytest
+
+
+def _add_containers(unreal, count):
+    paths = []
+    for i in range(count):
+        path = f"/Game/Ayon/model{i}_v001/model{i}_CON"
+        unreal.state.add_asset(path, unreal.AyonAssetContainer, saved=True)
+        paths.append(path)
+    unreal.calls.clear()
+    return paths
+
+
+def test_imprint_session_saves_once(unreal, pipeline):
+    paths = _add_containers(unreal, 3)
+
+    with pipeline.imprint_session():
+        for path in paths:
+            pipeline.imprint(path, {"representation": "new"})
+        assert set(paths) <= unreal.state.dirty
+
+    assert not unreal.state.dirty
+    assert unreal.calls["EditorAssetLibrary.save_loaded_assets"] == 1
+    assert not unreal.calls["EditorAssetLibrary.save_asset"]
+
+
+def test_imprint_session_does_not_save_on_error(unreal, pipeline):
+    paths = _add_containers(unreal, 2)
+
+    with pytest.raises(RuntimeError):
+        with pipeline.imprint_session():
+            pipeline.imprint(paths[0], {"representation": "new"})
+            raise RuntimeError("load failed")
+
+    assert paths[0] in unreal.state.dirty
+    assert not unreal.calls["EditorAssetLibrary.save_loaded_assets"]
+    # next imprint outside of session saves right away again
+    pipeline.imprint(paths[1], {"representation": "new"})
+    assert paths[1] not in unreal.state.dirty
+
+
+def _add_container(unreal, pipeline, path, data):
+    container = unreal.state.add_asset(path, unreal.AyonAssetContainer)
+    pipeline.imprint(path, data)
+    return container
+
+
+def test_container_cache_skips_unsaved_changes(unreal, pipeline):
+    path = "/Game/Ayon/model_v001/model_CON"
+    container = _add_container(unreal, pipeline, path, {
+        "id": "ayon.load.container",
+        "namespace": "/Game/Ayon/model_v001",
+        "representation": "old",
+    })
+    assert [c["representation"] for c in pipeline.ls()] == ["old"]
+
+    with pipeline.imprint_session():
+        pipeline.imprint(path, {"representation": "new"})
+        assert [c["representation"] for c in pipeline.ls()] == ["new"]
+
+    # changed in memory by other tool, file on disk is unchanged
+    container._metadata["representation"] = "unsaved"
+    unreal.state.dirty.add(path)
+    assert [c["representation"] for c in pipeline.ls()] == ["unsaved"]
+
+
+def test_ls_loads_containers_with_unregistered_tags(unreal, pipeline):
+    path = "/Game/Ayon/model_v001/model_CON"
+    _add_container(unreal, pipeline, path, {
+        "id": "ayon.load.container",
+        "namespace": "/Game/Ayon/model_v001",
+        "custom_key": "value",
+    })
+    unreal.state.loaded.clear()
+
+    containers = list(pipeline.ls(use_cache=False))
+
+    assert containers[0]["custom_key"] == "value"
+    assert "ayon_metadata_keys" not in containers[0]
+    assert path in unreal.state.loaded
+
+
+def test_ls_from_registered_tags(unreal, pipeline):
+    path = "/Game/Ayon/model_v001/model_CON"
+    _add_container(unreal, pipeline, path, {
+        "id": "ayon.load.container",
+        "namespace": "/Game/Ayon/model_v001",
+    })
+    unreal.state.loaded.clear()
+
+    containers = list(pipeline.ls(use_cache=False))
+
+    assert containers[0]["namespace"] == "/Game/Ayon/model_v001"
+    assert "ayon_metadata_keys" not in containers[0]
+    assert not unreal.state.loaded
+
+
+def test_container_index_add(unreal, pipeline):
+    index = pipeline.ContainerIndex([])
+    container = {
+        "representation": "repre",
+        "family": "model",
+        "loaded_assets": ["/Game/Ayon/model_v001/model.model"],
+    }
+
+    index.add(container)
+
+    assert list(index) == [container]
+    assert index.by_representation("repre") == [container]
+    assert index.by_family("model") == [container]
+    assert index.referencing_asset(
+        "/Game/Ayon/model_v001/model.model") == [container]
+
+
+def test_host_containers_are_dicts(unreal, pipeline):
+    _add_container(unreal, pipeline, "/Game/Ayon/model_v001/model_CON", {
+        "id": "ayon.load.container",
+        "namespace": "/Game/Ayon/model_v001",
+    })
+
+    containers = list(pipeline.UnrealHost().get_containers())
+
+    assert [type(container) for container in containers] == [dict]
+    assert containers[0]["objectName"] == "model_CON"
+
+
+def _add_loaded(unreal, pipeline, name, representation, parent):
+    path = f"/Game/Ayon/{name}/{name}_CON"
+    _add_container(unreal, pipeline, path, {
+        "id": "ayon.load.container",
+        "namespace": f"/Game/Ayon/{name}",
+        "representation": representation,
+        "parent": parent,
+    })
+    return path
+
+
+@pytest.fixture
+def ayon_server(pipeline, monkeypatch):
+    """Versions of one product on server, v002 is the latest one."""
+    queries = []
+    versions = {
+        "v001": {"id": "v001", "productId": "p", "version": 1},
+        "v002": {"id": "v002", "productId": "p", "version": 2},
+        "hero": {"id": "hero", "productId": "p", "version": -2},
+    }
+
+    def get_representations(project_name, representation_ids, fields):
+        queries.append("representations")
+        return [{"id": "r001", "versionId": "v001"}]
+
+    def get_versions(project_name, version_ids, fields):
+        queries.append("versions")
+        return [versions[version_id] for version_id in version_ids]
+
+    def get_last_versions(project_name, product_ids, fields):
+        queries.append("last_versions")
+        return {"p": versions["v002"]}
+
+    monkeypatch.setattr(pipeline, "get_current_project_name", lambda: "p")
+    monkeypatch.setattr(
+        pipeline.ayon_api, "get_representations", get_representations,
+        raising=False)
+    monkeypatch.setattr(
+        pipeline.ayon_api, "get_versions", get_versions, raising=False)
+    monkeypatch.setattr(
+        pipeline.ayon_api, "get_last_versions", get_last_versions,
+        raising=False)
+    return queries
+
+
+def test_containers_latest_state(unreal, pipeline, ayon_server):
+    old = _add_loaded(unreal, pipeline, "old", "r001", "")
+    latest = _add_loaded(unreal, pipeline, "latest", "r002", "v002")
+    hero = _add_loaded(unreal, pipeline, "hero", "r003", "hero")
+    pipeline._register_callbacks()
+    host = pipeline.UnrealHost()
+
+    assert host.get_containers_latest_state() == {
+        old: False, latest: True, hero: True}
+    assert ayon_server == ["representations", "versions", "last_versions"]
+
+    # cached until containers change
+    host.get_containers_latest_state()
+    assert len(ayon_server) == 3
+    pipeline.imprint(old, {"parent": "v002"})
+    pipeline.get_event_bus().flush()
+    assert host.get_containers_latest_state()[old]
+    assert ayon_server[3:] == ["versions", "last_versions"]
+
+
+def test_asset_name_index_adds_imported_assets(unreal, pipeline):
+    from ayon_unreal.api import importing, session
+
+    unreal.state.add_asset("/Game/Ayon/rock/v001/rock", unreal.StaticMesh)
+    importing.register_import_callback(pipeline._on_assets_imported)
+    task = unreal.AssetImportTask()
+    task.set_editor_property("filename", "/publish/rock_v002.fbx")
+    task.set_editor_property("destination_path", "/Game/Ayon/rock/v002")
+    task.set_editor_property("destination_name", "rock")
+
+    with session.load_session():
+        index = pipeline.get_asset_name_index()
+        assert index.get_package_names("rock") == [
+            "/Game/Ayon/rock/v001/rock"]
+        importing.import_tasks([task])
+        assert pipeline.get_asset_name_index().get_package_names("rock") == [
+            "/Game/Ayon/rock/v001/rock", "/Game/Ayon/rock/v002/rock"]
+    assert unreal.calls["AssetRegistry.get_assets_by_path"] == 1
+
+
+def test_event_bus_without_delegates(unreal, pipeline, monkeypatch):
+    monkeypatch.delattr(unreal.AssetRegistry, "on_asset_renamed")
+    event_bus = pipeline.get_event_bus()
+
+    assert not event_bus.register_delegates()
+    assert not event_bus.is_active
+    assert not unreal.state.on_asset_added._callables
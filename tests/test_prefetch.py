@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""Prefetch of representation files to local cache."""
+import os
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+from ayon_unreal.api import prefetch  # noqa: E402
+from ayon_unreal.api.session import load_session  # noqa: E402
+
+
+def _publish(directory, name, size=1024, frames=None):
+    """Write representation files, returns representation entity."""
+    os.makedirs(directory, exist_ok=True)
+    names = [name] if frames is None else [
+        name.replace("####", f"{frame:04d}") for frame in frames]
+    for filename in names:
+        with open(os.path.join(directory, filename), "wb") as stream:
+            stream.write(os.urandom(size))
+    return {
+        "id": f"{name}_repre",
+        "attrib": {"path": os.path.join(directory, names[0])},
+        "files": [{"name": filename} for filename in names],
+    }
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return prefetch.RepresentationCache(
+        str(tmp_path / "cache"), max_size=10 * 1024)
+
+
+def test_fetch_sequence(tmp_path, cache):
+    repre = _publish(
+        str(tmp_path / "publish"), "tex.####.png", frames=range(1001, 1004))
+    paths = prefetch.get_representation_files(
+        repre, repre["attrib"]["path"])
+    key = cache.get_key(repre["id"], paths)
+    assert cache.get(key) is None
+
+    entry_dir = cache.fetch(key, paths)
+
+    assert cache.get(key) == entry_dir
+    for path in paths:
+        with open(path, "rb") as source:
+            local = os.path.join(entry_dir, os.path.basename(path))
+            with open(local, "rb") as copy:
+                assert copy.read() == source.read()
+
+
+def test_republished_file_changes_key(tmp_path, cache):
+    repre = _publish(str(tmp_path / "publish"), "hero.fbx")
+    paths = [repre["attrib"]["path"]]
+    key = cache.get_key(repre["id"], paths)
+    with open(paths[0], "ab") as stream:
+        stream.write(b"republished")
+    assert cache.get_key(repre["id"], paths) != key
+
+
+@pytest.mark.parametrize("file_info", [
+    {"size": 1023},
+    {"hash": "0" * 64, "hash_type": "sha256"},
+])
+def test_corrupted_copy(tmp_path, cache, file_info):
+    repre = _publish(str(tmp_path / "publish"), "hero.fbx")
+    paths = [repre["attrib"]["path"]]
+    key = cache.get_key(repre["id"], paths)
+
+    with pytest.raises(prefetch.PrefetchError):
+        cache.fetch(key, paths, {"hero.fbx": file_info})
+    assert os.listdir(cache.root) == []
+
+
+def test_copy_matches_published_file(tmp_path, cache):
+    repre = _publish(str(tmp_path / "publish"), "hero.fbx")
+    paths = [repre["attrib"]["path"]]
+    file_info = {
+        "size": 1024,
+        "hash": prefetch.hash_file(paths[0]),
+        "hash_type": "sha256",
+    }
+
+    assert cache.fetch(
+        cache.get_key(repre["id"], paths), paths, {"hero.fbx": file_info})
+
+
+def test_evict_least_recently_used(tmp_path, cache):
+    keys = []
+    for i in range(4):
+        repre = _publish(
+            str(tmp_path / "publish"), f"model{i}.abc", size=4 * 1024)
+        paths = [repre["attrib"]["path"]]
+        key = cache.get_key(repre["id"], paths)
+        cache.fetch(key, paths)
+        keys.append(key)
+
+    removed = cache.evict(keep={keys[0]})
+
+    assert removed == keys[1:3]
+    assert sorted(os.listdir(cache.root)) == sorted([keys[0], keys[3]])
+
+
+def test_evict_reserves_room_for_copies(tmp_path, cache):
+    for i in range(2):
+        repre = _publish(
+            str(tmp_path / "publish"), f"model{i}.abc", size=4 * 1024)
+        paths = [repre["attrib"]["path"]]
+        cache.fetch(cache.get_key(repre["id"], paths), paths)
+
+    assert len(cache.evict()) == 0
+    assert len(cache.evict(reserve=4 * 1024)) == 1
+
+
+def test_evict_scans_cache_once(tmp_path, cache, monkeypatch):
+    keys = []
+    for i in range(2):
+        repre = _publish(
+            str(tmp_path / "publish"), f"model{i}.abc", size=4 * 1024)
+        paths = [repre["attrib"]["path"]]
+        keys.append(cache.get_key(repre["id"], paths))
+        os.utime(cache.fetch(keys[-1], paths), (i, i))
+    scans = []
+    scandir = os.scandir
+    monkeypatch.setattr(
+        prefetch.os, "scandir",
+        lambda path=".": scans.append(path) or scandir(path))
+
+    # entries written by previous process are ordered by use time
+    cache = prefetch.RepresentationCache(cache.root, cache.max_size)
+    assert cache.evict(reserve=4 * 1024) == keys[:1]
+    assert cache.evict(reserve=8 * 1024) == keys[1:]
+    assert scans.count(cache.root) == 1
+
+
+def test_local_path_in_session(tmp_path, monkeypatch):
+    monkeypatch.setenv(prefetch.PREFETCH_DIR_ENV, str(tmp_path / "cache"))
+    monkeypatch.setattr(prefetch, "_prefetcher", None)
+    monkeypatch.setattr(
+        prefetch, "get_representation_path",
+        lambda repre_entity: repre_entity["attrib"]["path"])
+    repres = [
+        _publish(str(tmp_path / "publish"), f"model{i}.fbx")
+        for i in range(8)
+    ]
+    source = repres[0]["attrib"]["path"]
+
+    assert prefetch.get_local_path(repres[0], source) == source
+    with load_session():
+        assert prefetch.prefetch(repres + repres) == len(repres)
+        local = prefetch.get_local_path(repres[0], source)
+        assert prefetch.get_source_path(local) == source
+    assert local != source
+    assert local.startswith(str(tmp_path / "cache"))
+    assert os.path.isfile(local)
+
+
+def test_cancelled_copy_falls_back_to_source(tmp_path):
+    repre = _publish(str(tmp_path / "publish"), "hero.fbx")
+    source = repre["attrib"]["path"]
+    future = Future()
+    future.cancel()
+
+    with load_session() as session:
+        session.memoize(("prefetch", repre["id"]), lambda: ("key", future))
+        assert prefetch.get_local_path(repre, source) == source
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Implicit batch session of loads started outside of explicit session."""
+import pytest
+
+pytest.importorskip("ayon_core")
+
+MODEL = "/Game/Ayon/model_v001/model"
+
+
+@pytest.fixture
+def loader(unreal, pipeline):
+    from ayon_unreal.api.session import (
+        defer_save,
+        get_load_session,
+        session_method,
+    )
+
+    class Loader:
+        sessions = []
+
+        @session_method
+        def load(self, context, name=None, namespace=None, options=None):
+            self.sessions.append(get_load_session())
+            unreal.state.dirty.add(MODEL)
+            defer_save(MODEL.rpartition("/")[0])
+            if context.get("nested"):
+                self.load({})
+                # saved only when the outermost call returns
+                assert MODEL in unreal.state.dirty
+
+    unreal.state.add_asset(MODEL, unreal.StaticMesh, saved=True)
+    return Loader()
+
+
+def _tick(unreal):
+    for callback in list(unreal.state.tick_callbacks.values()):
+        callback(0.0)
+
+
+def test_batch_session_ends_on_tick(unreal, loader):
+    from ayon_unreal.api import session
+
+    loader.load({"nested": True})
+    assert not unreal.state.dirty
+    loader.load({})
+    assert not unreal.state.dirty
+
+    assert unreal.calls["EditorLoadingAndSavingUtils.save_packages"] == 2
+    assert len(set(loader.sessions)) == 1
+    assert session._batch_session is loader.sessions[0]
+    _tick(unreal)
+    assert session._batch_session is None
+    assert not loader.sessions[0].is_valid
+
+
+def test_batch_session_ends_without_tick(unreal, loader):
+    from ayon_unreal.api import session
+
+    unreal.state.command_line = "Project.uproject -run=pythonscript"
+
+    loader.load({"nested": True})
+    assert not unreal.state.dirty
+    loader.load({})
+    assert not unreal.state.dirty
+
+    assert session._batch_session is None
+    assert not unreal.state.tick_callbacks
+    assert len(set(loader.sessions)) == 2
+    assert not any(load_session.is_valid for load_session in loader.sessions)
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Tracing of `unreal` calls made by AYON modules."""
+import sys
+
+import pytest
+
+pytest.importorskip("ayon_core")
+
+
+@pytest.fixture
+def tracing(unreal, pipeline, monkeypatch):
+    from ayon_unreal.api import tracing
+
+    monkeypatch.setenv(tracing.TRACE_CALLS_ENV, "1")
+    assert tracing.install_tracing()
+    yield tracing
+    tracing.uninstall_tracing()
+
+
+def test_tracing_is_scoped_to_ayon_modules(unreal, pipeline, tracing):
+    assert sys.modules["unreal"] is unreal
+    assert pipeline.unreal is not unreal
+
+    with tracing.trace_calls("test"):
+        pipeline.create_folder("/Game", "Ayon")
+        stats = tracing.get_call_tracer().snapshot()
+
+    assert stats[(
+        "EditorAssetLibrary.make_directory",
+        "ayon_unreal.api.pipeline.create_folder"
+    )][0] == 1
+
+    tracing.uninstall_tracing()
+    assert pipeline.unreal is unreal
+    assert tracing.get_call_tracer() is None
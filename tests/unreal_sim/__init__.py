@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""In-memory simulator of the `unreal` Python module.
+
+Simulator implements parts of the editor API used by AYON pipeline hot
+paths: Asset Registry with tags, `EditorAssetLibrary` with metadata,
+level actors, `LevelSequence` tracks and sections, recording of
+`AssetImportTask` imports and of Movie Render Queue jobs sent to executor.
+Any other attribute of the module resolves to a permissive generic class,
+so plugin modules can be imported.
+
+Call counts of the API are available in `unreal.calls` to tell how many
+times hot paths hit the editor.
+
+Example:
+    >>> from tests import unreal_sim
+    >>> unreal = unreal_sim.install("/tmp/project")
+    >>> unreal.EditorAssetLibrary.make_directory("/Game/Foo")
+    True
+
+"""
+import collections
+import os
+import sys
+import types
+
+from . import core
+from .core import (  # noqa: F401
+    Name,
+    Object,
+    Class,
+    AssetData,
+    ARFilter,
+    TopLevelAssetPath,
+)
+
+
+def install(project_dir, registered_tags=None, ue_version="5.3"):
+    """Install simulator as `unreal` module.
+
+    Args:
+        project_dir (str): Directory of simulated Unreal project. `Content`
+            and `Saved` directories are created in it.
+        registered_tags (Optional[Iterable[str]]): Metadata keys registered
+            as Asset Registry tags.
+        ue_version (str): Simulated engine version, set to
+            `AYON_UNREAL_VERSION` environment variable.
+
+    Returns:
+        types.ModuleType: Simulated `unreal` module.
+
+    """
+    os.environ["AYON_UNREAL_VERSION"] = ue_version
+    module = sys.modules.get("unreal")
+    if not isinstance(module, SimulatedUnrealModule):
+        module = SimulatedUnrealModule("unreal")
+        sys.modules["unreal"] = module
+    module.reset(project_dir, registered_tags)
+    return module
+
+
+class SimulatedUnrealModule(types.ModuleType):
+    """Module object exposing simulated editor API."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.__dict__.update(core.build_namespace(self))
+        self.calls = collections.Counter()
+
+    def reset(self, project_dir, registered_tags=None):
+        """Reset state of simulated editor.
+
+        Args:
+            project_dir (str): Directory of simulated Unreal project.
+            registered_tags (Optional[Iterable[str]]): Metadata keys
+                registered as Asset Registry tags.
+
+        """
+        self.state = core.EditorState(project_dir, registered_tags)
+        self.calls.clear()
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        cls = core.generic_class(name)
+        setattr(self, name, cls)
+        return cls
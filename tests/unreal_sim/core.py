@@ -0,0 +1,1346 @@
+# -*- coding: utf-8 -*-
+"""Implementation of simulated editor API."""
+import contextlib
+import functools
+import os
+import posixpath
+import time
+
+
+class Name(str):
+    """Simulated `unreal.Name`."""
+
+
+class Class:
+    """Simulated `unreal.Class` describing Python class of object."""
+
+    def __init__(self, py_class):
+        self.py_class = py_class
+
+    def get_name(self):
+        return self.py_class.__name__
+
+    def __eq__(self, other):
+        return isinstance(other, Class) and other.py_class is self.py_class
+
+    def __hash__(self):
+        return hash(self.py_class)
+
+    def __repr__(self):
+        return f"<Class {self.get_name()}>"
+
+
+class Object:
+    """Simulated `unreal.Object`.
+
+    Editor properties are stored in a dictionary, unknown `set_*` methods
+    store properties and unknown `get_*` methods read them back, so code
+    using parts of API that are not simulated explicitly still runs.
+
+    """
+
+    _static_class = None
+
+    def __init__(self, *args, **kwargs):
+        self._name = kwargs.pop("name", type(self).__name__)
+        self._package = kwargs.pop("package", None)
+        self._outer = kwargs.pop("outer", None)
+        self._props = dict(kwargs)
+        self._metadata = {}
+        self._args = args
+
+    @classmethod
+    def static_class(cls):
+        if cls.__dict__.get("_static_class") is None:
+            cls._static_class = Class(cls)
+        return cls._static_class
+
+    def get_class(self):
+        return type(self).static_class()
+
+    def get_name(self):
+        return self._name
+
+    def get_fname(self):
+        return Name(self._name)
+
+    def get_path_name(self):
+        if self._package:
+            return f"{self._package}.{self._name}"
+        if self._outer is not None:
+            return f"{self._outer.get_path_name()}:{self._name}"
+        return f"/Temp/{self._name}"
+
+    def get_outer(self):
+        return self._outer
+
+    def get_editor_property(self, name):
+        return self._props.get(name)
+
+    def set_editor_property(self, name, value, *_args):
+        self._props[name] = value
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        props = self.__dict__.get("_props", {})
+        if name in props:
+            return props[name]
+        if name.startswith("set_"):
+            key = name[4:]
+
+            def _setter(*args, **_kwargs):
+                props[key] = args[0] if len(args) == 1 else args
+            return _setter
+        if name.startswith("get_"):
+            key = name[4:]
+            return lambda *_args, **_kwargs: props.get(key)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __repr__(self):
+        return f"<{type(self).__name__} '{self.get_path_name()}'>"
+
+
+class Set(set):
+    """Simulated `unreal.Set`, type of elements is not enforced."""
+
+    def __init__(self, element_type, iterable=()):
+        super().__init__(iterable)
+        self.element_type = element_type
+
+
+# Math -----------------------------------------------------------------------
+
+class Vector:
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        if isinstance(x, (list, tuple)):
+            x, y, z = x
+        self.x, self.y, self.z = float(x), float(y), float(z)
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+
+class Vector4:
+    def __init__(self, x=0.0, y=0.0, z=0.0, w=0.0):
+        self.x, self.y, self.z, self.w = x, y, z, w
+
+
+class Rotator:
+    def __init__(self, roll=0.0, pitch=0.0, yaw=0.0):
+        self.roll, self.pitch, self.yaw = roll, pitch, yaw
+
+    def quaternion(self):
+        return Quat(Vector(self.roll, self.pitch, self.yaw))
+
+
+class Quat:
+    def __init__(self, euler=None):
+        self._euler = euler or Vector()
+
+    def euler(self):
+        return Vector(self._euler.x, self._euler.y, self._euler.z)
+
+    def rotator(self):
+        return Rotator(self._euler.x, self._euler.y, self._euler.z)
+
+
+class Transform:
+    def __init__(self, location=None, rotation=None, scale=None):
+        self.translation = Vector(*(location or (0.0, 0.0, 0.0)))
+        if isinstance(rotation, Rotator):
+            rotation = rotation.quaternion()
+        elif not isinstance(rotation, Quat):
+            rotation = Quat(Vector(*(rotation or (0.0, 0.0, 0.0))))
+        self.rotation = rotation
+        self.scale3d = Vector(*(scale or (1.0, 1.0, 1.0)))
+
+    def to_matrix(self):
+        t = self.translation
+        return Matrix(
+            [self.scale3d.x, 0.0, 0.0, 0.0],
+            [0.0, self.scale3d.y, 0.0, 0.0],
+            [0.0, 0.0, self.scale3d.z, 0.0],
+            [t.x, t.y, t.z, 1.0],
+        )
+
+
+class Matrix:
+    """Row-major 4x4 matrix, only translation and scale are simulated."""
+
+    def __init__(self, x_plane=None, y_plane=None, z_plane=None,
+                 w_plane=None):
+        rows = [x_plane, y_plane, z_plane, w_plane]
+        identity = [[1.0 if i == j else 0.0 for j in range(4)]
+                    for i in range(4)]
+        self.rows = [
+            [float(v) for v in _plane_values(row)] if row is not None
+            else identity[i]
+            for i, row in enumerate(rows)
+        ]
+
+    @property
+    def x_plane(self):
+        return Vector4(*self.rows[0])
+
+    @property
+    def y_plane(self):
+        return Vector4(*self.rows[1])
+
+    @property
+    def z_plane(self):
+        return Vector4(*self.rows[2])
+
+    @property
+    def w_plane(self):
+        return Vector4(*self.rows[3])
+
+    def __mul__(self, other):
+        rows = [
+            [
+                sum(self.rows[i][k] * other.rows[k][j] for k in range(4))
+                for j in range(4)
+            ]
+            for i in range(4)
+        ]
+        return Matrix(*rows)
+
+    def get_inverse(self):
+        rows = [list(row) for row in self.rows]
+        for i in range(3):
+            rows[i][i] = 1.0 / rows[i][i] if rows[i][i] else 0.0
+        rows[3] = [
+            -self.rows[3][j] * rows[j][j] for j in range(3)] + [1.0]
+        return Matrix(*rows)
+
+    def transform(self):
+        return Transform(
+            location=self.rows[3][:3],
+            scale=[self.rows[i][i] for i in range(3)],
+        )
+
+
+Matrix.IDENTITY = Matrix()
+
+
+def _plane_values(plane):
+    if isinstance(plane, Vector4):
+        return [plane.x, plane.y, plane.z, plane.w]
+    return list(plane)
+
+
+# Assets ---------------------------------------------------------------------
+
+class TopLevelAssetPath:
+    def __init__(self, package_name="", asset_name=""):
+        self.package_name = Name(package_name)
+        self.asset_name = Name(asset_name)
+
+
+class ARFilter:
+    def __init__(self, class_names=None, package_paths=None,
+                 recursive_paths=False, class_paths=None,
+                 package_names=None, object_paths=None,
+                 recursive_classes=False, **_kwargs):
+        self.class_names = list(class_names or [])
+        self.class_paths = list(class_paths or [])
+        self.package_paths = list(package_paths or [])
+        self.package_names = list(package_names or [])
+        self.object_paths = list(object_paths or [])
+        self.recursive_paths = recursive_paths
+        self.recursive_classes = recursive_classes
+
+
+class AssetData:
+    """Simulated `unreal.AssetData`."""
+
+    def __init__(self, state, package_name):
+        self._state = state
+        asset = state.assets.get(package_name)
+        self._valid = asset is not None
+        self.package_name = Name(package_name)
+        self.package_path = Name(posixpath.dirname(package_name))
+        self.asset_name = Name(posixpath.basename(package_name))
+        self.object_path = Name(f"{package_name}.{self.asset_name}")
+        class_name = type(asset).__name__ if asset is not None else ""
+        self.asset_class = Name(class_name)
+        self.asset_class_path = TopLevelAssetPath(
+            _script_package(class_name), class_name)
+        self.tags = dict(state.saved_tags.get(package_name, {}))
+
+    def is_valid(self):
+        return self._valid
+
+    def get_asset(self):
+        if not self._valid:
+            return None
+        return self._state.load(str(self.package_name))
+
+    def get_class(self):
+        asset = self._state.assets.get(str(self.package_name))
+        return asset.get_class() if asset is not None else None
+
+    def get_full_name(self):
+        return f"{self.asset_class} {self.object_path}"
+
+    def get_editor_property(self, name):
+        return getattr(self, name)
+
+    def __repr__(self):
+        return f"<AssetData '{self.object_path}'>"
+
+
+def _script_package(class_name):
+    if class_name.startswith("Ayon"):
+        return "/Script/Ayon"
+    return "/Script/Engine"
+
+
+def to_package_name(path):
+    """Convert object path or package name to package name."""
+    path = str(path).rstrip("/")
+    return path.split(".")[0]
+
+
+class Delegate:
+    """Simulated multicast delegate."""
+
+    def __init__(self):
+        self._callables = []
+
+    def add_callable(self, fn):
+        self._callables.append(fn)
+
+    def add_callable_unique(self, fn):
+        if fn not in self._callables:
+            self._callables.append(fn)
+
+    def remove_callable(self, fn):
+        if fn in self._callables:
+            self._callables.remove(fn)
+
+    def broadcast(self, *args):
+        for fn in list(self._callables):
+            fn(*args)
+
+
+class EditorState:
+    """State of simulated editor.
+
+    Args:
+        project_dir (str): Directory of simulated Unreal project.
+        registered_tags (Optional[Iterable[str]]): Metadata keys registered
+            as Asset Registry tags.
+
+    """
+
+    def __init__(self, project_dir, registered_tags=None):
+        self.project_dir = os.path.abspath(project_dir)
+        self.content_dir = os.path.join(self.project_dir, "Content")
+        self.saved_dir = os.path.join(self.project_dir, "Saved")
+        os.makedirs(self.content_dir, exist_ok=True)
+        os.makedirs(self.saved_dir, exist_ok=True)
+        self.registered_tags = set(registered_tags or [])
+
+        self.assets = {}
+        self.loaded = set()
+        self.dirty = set()
+        self.saved_tags = {}
+        self.directories = {"/Game"}
+        self.dependencies = {}
+        self.actors = []
+        self.selected_actors = []
+        self.selected_assets = []
+        self.current_level = None
+        self.render_queues = []
+        self.imports = []
+        self.log = []
+        self.tick_callbacks = {}
+        self.command_line = ""
+        self._mtime_ns = time.time_ns()
+
+        self.on_asset_added = Delegate()
+        self.on_asset_removed = Delegate()
+        self.on_asset_renamed = Delegate()
+        self.on_asset_updated = Delegate()
+
+    def package_file(self, package_name):
+        rel_path = package_name[len("/Game/"):]
+        return os.path.join(self.content_dir, f"{rel_path}.uasset")
+
+    def _make_dirs(self, package_path):
+        parts = package_path.strip("/").split("/")
+        for i in range(1, len(parts) + 1):
+            self.directories.add("/" + "/".join(parts[:i]))
+
+    def add_asset(self, package_name, asset_class, saved=False, **props):
+        """Create asset in the project.
+
+        Args:
+            package_name (str): Package name, like `/Game/Foo/Bar`.
+            asset_class (type): Simulated class of the asset.
+            saved (bool): Save the asset right away.
+            **props: Editor properties of the asset.
+
+        Returns:
+            Object: Created asset.
+
+        """
+        package_name = to_package_name(package_name)
+        asset = asset_class(
+            name=posixpath.basename(package_name),
+            package=package_name,
+            **props
+        )
+        self.assets[package_name] = asset
+        self.loaded.add(package_name)
+        self.dirty.add(package_name)
+        self._make_dirs(posixpath.dirname(package_name))
+        self.on_asset_added.broadcast(AssetData(self, package_name))
+        if saved:
+            self.save(package_name)
+        return asset
+
+    def load(self, package_name):
+        asset = self.assets.get(package_name)
+        if asset is not None:
+            self.loaded.add(package_name)
+        return asset
+
+    def save(self, package_name):
+        asset = self.assets.get(package_name)
+        if asset is None:
+            return False
+        self.saved_tags[package_name] = {
+            key: value for key, value in asset._metadata.items()
+            if key in self.registered_tags
+        }
+        path = self.package_file(package_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as fp:
+            fp.write(repr(sorted(asset._metadata.items())))
+        # make sure every save changes modification time
+        self._mtime_ns += 1_000_000
+        os.utime(path, ns=(self._mtime_ns, self._mtime_ns))
+        self.dirty.discard(package_name)
+        self.on_asset_updated.broadcast(AssetData(self, package_name))
+        return True
+
+    def delete(self, package_name):
+        if package_name not in self.assets:
+            return False
+        asset_data = AssetData(self, package_name)
+        del self.assets[package_name]
+        self.loaded.discard(package_name)
+        self.dirty.discard(package_name)
+        self.saved_tags.pop(package_name, None)
+        self.dependencies.pop(package_name, None)
+        path = self.package_file(package_name)
+        if os.path.isfile(path):
+            os.remove(path)
+        self.on_asset_removed.broadcast(asset_data)
+        return True
+
+    def rename(self, source, destination):
+        source = to_package_name(source)
+        destination = to_package_name(destination)
+        asset = self.assets.pop(source, None)
+        if asset is None:
+            return False
+        asset._package = destination
+        asset._name = posixpath.basename(destination)
+        self.assets[destination] = asset
+        for collection in (self.loaded, self.dirty):
+            if source in collection:
+                collection.discard(source)
+                collection.add(destination)
+        if source in self.saved_tags:
+            self.saved_tags[destination] = self.saved_tags.pop(source)
+        self._make_dirs(posixpath.dirname(destination))
+        self.on_asset_renamed.broadcast(
+            AssetData(self, destination), f"{source}.{posixpath.basename(source)}")
+        return True
+
+    def packages_in(self, package_path, recursive=True):
+        package_path = package_path.rstrip("/")
+        prefix = f"{package_path}/"
+        for package_name in list(self.assets):
+            if not package_name.startswith(prefix):
+                continue
+            if recursive or "/" not in package_name[len(prefix):]:
+                yield package_name
+
+    def get_referencers(self, package_name):
+        return [
+            referencer
+            for referencer, dependencies in self.dependencies.items()
+            if package_name in dependencies
+        ]
+
+
+# Actors, levels and sequences ------------------------------------------------
+
+class ActorComponent(Object):
+    pass
+
+
+class Actor(Object):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._label = self._name
+        self._transform = Transform()
+        self._components = []
+
+    def get_actor_label(self):
+        return self._label
+
+    def set_actor_label(self, label, *_args):
+        self._label = label
+
+    def get_actor_transform(self):
+        return self._transform
+
+    def set_actor_transform(self, transform, *_args):
+        self._transform = transform
+
+    def set_actor_location(self, location, *_args):
+        self._transform.translation = location
+
+    def set_actor_rotation(self, rotation, *_args):
+        self._transform.rotation = rotation.quaternion()
+
+    def set_actor_scale3d(self, scale):
+        self._transform.scale3d = scale
+
+    def get_components_by_class(self, component_class):
+        return [c for c in self._components if isinstance(c, component_class)]
+
+    def get_component_by_class(self, component_class):
+        return next(iter(self.get_components_by_class(component_class)), None)
+
+
+class MovieSceneSection(Object):
+    def set_range(self, start, end):
+        self._props["start_frame"] = start
+        self._props["end_frame"] = end
+
+    def get_start_frame(self):
+        return self._props.get("start_frame", 0)
+
+    def get_end_frame(self):
+        return self._props.get("end_frame", 0)
+
+
+class MovieSceneTrack(Object):
+    section_class = MovieSceneSection
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sections = []
+
+    def add_section(self):
+        section = self.section_class(outer=self)
+        self._sections.append(section)
+        return section
+
+    def get_sections(self):
+        return list(self._sections)
+
+    def remove_section(self, section):
+        if section in self._sections:
+            self._sections.remove(section)
+
+
+class MovieSceneBinding(Object):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tracks = []
+
+    def get_display_name(self):
+        return self._name
+
+    def get_tracks(self):
+        return list(self._tracks)
+
+    def add_track(self, track_class):
+        track = track_class(outer=self)
+        self._tracks.append(track)
+        return track
+
+    def get_possessed_object_class(self):
+        return self._props.get("possessed_class")
+
+    def remove(self):
+        sequence = self._outer
+        if sequence is not None and self in sequence._possessables:
+            sequence._possessables.remove(self)
+
+
+class LevelSequence(Object):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._possessables = []
+        self._master_tracks = []
+
+    def get_possessables(self):
+        return list(self._possessables)
+
+    def get_bindings(self):
+        return list(self._possessables)
+
+    def add_possessable(self, obj):
+        binding = MovieSceneBinding(
+            name=obj.get_name(), outer=self,
+            possessed_class=obj.get_class())
+        self._possessables.append(binding)
+        return binding
+
+    def get_master_tracks(self):
+        return list(self._master_tracks)
+
+    get_tracks = get_master_tracks
+
+    def add_master_track(self, track_class):
+        track = track_class(outer=self)
+        self._master_tracks.append(track)
+        return track
+
+    add_track = add_master_track
+
+
+class MoviePipelineConfig(Object):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._settings = []
+
+    def get_all_settings(self):
+        return list(self._settings)
+
+    def find_setting_by_class(self, setting_class):
+        return next(
+            (s for s in self._settings if isinstance(s, setting_class)), None)
+
+    def find_or_add_setting_by_class(self, setting_class):
+        setting = self.find_setting_by_class(setting_class)
+        if setting is None:
+            setting = setting_class(outer=self)
+            self._settings.append(setting)
+        return setting
+
+    def remove_setting(self, setting):
+        if setting in self._settings:
+            self._settings.remove(setting)
+
+    def copy_from(self, other):
+        self._settings = list(other._settings)
+
+
+class MoviePipelineOutputSetting(Object):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._props.setdefault(
+            "output_directory", generic_class("DirectoryPath")())
+
+
+class MoviePipelineExecutorJob(Object):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._configuration = MoviePipelineConfig(outer=self)
+
+    def get_configuration(self):
+        return self._configuration
+
+
+class MoviePipelineQueue(Object):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._jobs = []
+
+    def allocate_new_job(self, job_class):
+        job = job_class(outer=self)
+        self._jobs.append(job)
+        return job
+
+    def get_jobs(self):
+        return list(self._jobs)
+
+
+# Module namespace -------------------------------------------------------------
+
+_ASSET_CLASSES = (
+    "StaticMesh",
+    "SkeletalMesh",
+    "Skeleton",
+    "PhysicsAsset",
+    "AnimSequence",
+    "GeometryCache",
+    "Texture2D",
+    "Material",
+    "MaterialInstanceConstant",
+    "World",
+    "AyonAssetContainer",
+    "AyonPublishInstance",
+)
+_FACTORY_CLASSES = {
+    "AyonAssetContainerFactory": "AyonAssetContainer",
+    "AyonPublishInstanceFactory": "AyonPublishInstance",
+    "LevelSequenceFactoryNew": "LevelSequence",
+}
+
+_generic_classes = {}
+
+
+def generic_class(name):
+    """Get permissive simulated class of given name."""
+    cls = _generic_classes.get(name)
+    if cls is None:
+        base = Object
+        if name.endswith("Track"):
+            base = MovieSceneTrack
+        elif name.endswith("Section"):
+            base = MovieSceneSection
+        elif name.endswith("Component"):
+            base = ActorComponent
+        elif name.endswith("Actor"):
+            base = Actor
+        cls = type(name, (base,), {})
+        _generic_classes[name] = cls
+    return cls
+
+
+def build_namespace(module):
+    """Build attributes of simulated `unreal` module.
+
+    Args:
+        module (SimulatedUnrealModule): Module the API is bound to.
+
+    Returns:
+        dict[str, Any]: Attributes of the module.
+
+    """
+    ns = {}
+
+    def state():
+        return module.state
+
+    def api(name):
+        """Count calls of API function."""
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                module.calls[name] += 1
+                return fn(*args, **kwargs)
+            return staticmethod(wrapper)
+        return decorator
+
+    for class_name in _ASSET_CLASSES:
+        ns[class_name] = generic_class(class_name)
+    ns["LevelSequence"] = _generic_classes["LevelSequence"] = LevelSequence
+    for cls in (
+        MoviePipelineConfig,
+        MoviePipelineOutputSetting,
+        MoviePipelineExecutorJob,
+        MoviePipelineQueue,
+    ):
+        ns[cls.__name__] = _generic_classes[cls.__name__] = cls
+    for class_name in (
+        "StaticMeshComponent",
+        "SkeletalMeshComponent",
+        "GeometryCacheComponent",
+        "StaticMeshActor",
+        "SkeletalMeshActor",
+        "CameraActor",
+        "MovieSceneSubTrack",
+        "MovieSceneLevelVisibilityTrack",
+        "MovieSceneCameraCutTrack",
+        "MovieSceneSkeletalAnimationTrack",
+        "MovieSceneSkeletalAnimationSection",
+    ):
+        ns[class_name] = generic_class(class_name)
+
+    ns.update({
+        "Name": Name,
+        "Object": Object,
+        "Class": Class,
+        "Actor": Actor,
+        "ActorComponent": ActorComponent,
+        "Vector": Vector,
+        "Rotator": Rotator,
+        "Quat": Quat,
+        "Transform": Transform,
+        "Matrix": Matrix,
+        "AssetData": AssetData,
+        "ARFilter": ARFilter,
+        "TopLevelAssetPath": TopLevelAssetPath,
+        "Set": Set,
+    })
+
+    class ScopedEditorTransaction(contextlib.AbstractContextManager):
+        def __init__(self, description=""):
+            self.description = description
+
+        def __exit__(self, *_args):
+            return False
+
+    ns["ScopedEditorTransaction"] = ScopedEditorTransaction
+
+    # Logging and module functions
+    def log(message):
+        state().log.append(("log", str(message)))
+
+    def log_warning(message):
+        state().log.append(("warning", str(message)))
+
+    def log_error(message):
+        state().log.append(("error", str(message)))
+
+    def register_slate_post_tick_callback(fn):
+        handle = len(state().tick_callbacks) + 1
+        state().tick_callbacks[handle] = fn
+        return handle
+
+    def unregister_slate_post_tick_callback(handle):
+        state().tick_callbacks.pop(handle, None)
+
+    def get_editor_subsystem(subsystem_class):
+        return subsystem_class()
+
+    def uclass(*_args, **_kwargs):
+        return lambda cls: cls
+
+    def ufunction(*_args, **_kwargs):
+        return lambda fn: fn
+
+    ns.update({
+        "log": log,
+        "log_warning": log_warning,
+        "log_error": log_error,
+        "register_slate_post_tick_callback": (
+            register_slate_post_tick_callback),
+        "unregister_slate_post_tick_callback": (
+            unregister_slate_post_tick_callback),
+        "get_editor_subsystem": get_editor_subsystem,
+        "uclass": uclass,
+        "ufunction": ufunction,
+    })
+
+    # Asset Registry
+    class AssetRegistry:
+        @property
+        def on_asset_added(self):
+            return state().on_asset_added
+
+        @property
+        def on_asset_removed(self):
+            return state().on_asset_removed
+
+        @property
+        def on_asset_renamed(self):
+            return state().on_asset_renamed
+
+        @property
+        def on_asset_updated(self):
+            return state().on_asset_updated
+
+        @api("AssetRegistry.get_assets_by_class")
+        def get_assets_by_class(class_name, search_sub_classes=False):
+            if isinstance(class_name, (list, tuple)):
+                class_name = class_name[-1]
+            elif isinstance(class_name, TopLevelAssetPath):
+                class_name = class_name.asset_name
+            s = state()
+            return [
+                AssetData(s, package_name)
+                for package_name, asset in s.assets.items()
+                if type(asset).__name__ == class_name
+            ]
+
+        @api("AssetRegistry.get_assets_by_path")
+        def get_assets_by_path(package_path, recursive=False, **_kwargs):
+            s = state()
+            return [
+                AssetData(s, package_name)
+                for package_name in s.packages_in(package_path, recursive)
+            ]
+
+        @api("AssetRegistry.get_assets")
+        def get_assets(ar_filter):
+            s = state()
+            class_names = set(ar_filter.class_names)
+            class_names.update(
+                str(path.asset_name) for path in ar_filter.class_paths)
+            if ar_filter.package_paths:
+                packages = set()
+                for package_path in ar_filter.package_paths:
+                    packages.update(s.packages_in(
+                        package_path, ar_filter.recursive_paths))
+            else:
+                packages = set(s.assets)
+            if ar_filter.package_names:
+                packages &= {str(p) for p in ar_filter.package_names}
+            if ar_filter.object_paths:
+                packages &= {
+                    to_package_name(p) for p in ar_filter.object_paths}
+            return [
+                AssetData(s, package_name)
+                for package_name in sorted(packages)
+                if not class_names
+                or type(s.assets[package_name]).__name__ in class_names
+            ]
+
+        @api("AssetRegistry.get_asset_by_object_path")
+        def get_asset_by_object_path(object_path, *_args):
+            return AssetData(state(), to_package_name(object_path))
+
+        @api("AssetRegistry.get_referencers")
+        def get_referencers(package_name, *_args):
+            return [
+                Name(ref) for ref in state().get_referencers(
+                    str(package_name))
+            ]
+
+        @api("AssetRegistry.get_dependencies")
+        def get_dependencies(package_name, *_args):
+            return [
+                Name(dep) for dep in sorted(
+                    state().dependencies.get(str(package_name), ()))
+            ]
+
+        @api("AssetRegistry.is_loading_assets")
+        def is_loading_assets():
+            return False
+
+    asset_registry = AssetRegistry()
+
+    class AssetRegistryHelpers:
+        @api("AssetRegistryHelpers.get_asset_registry")
+        def get_asset_registry():
+            return asset_registry
+
+        @api("AssetRegistryHelpers.get_tag_value")
+        def get_tag_value(asset_data, tag_name):
+            return asset_data.tags.get(str(tag_name))
+
+        @api("AssetRegistryHelpers.get_asset")
+        def get_asset(asset_data):
+            return asset_data.get_asset()
+
+    class AssetRegistryDependencyOptions(Object):
+        pass
+
+    ns.update({
+        "AssetRegistry": AssetRegistry,
+        "AssetRegistryHelpers": AssetRegistryHelpers,
+        "AssetRegistryDependencyOptions": AssetRegistryDependencyOptions,
+    })
+
+    # Asset libraries
+    class EditorAssetLibrary:
+        @api("EditorAssetLibrary.load_asset")
+        def load_asset(path):
+            return state().load(to_package_name(path))
+
+        @api("EditorAssetLibrary.find_asset_data")
+        def find_asset_data(path):
+            return AssetData(state(), to_package_name(path))
+
+        @api("EditorAssetLibrary.does_asset_exist")
+        def does_asset_exist(path):
+            return to_package_name(path) in state().assets
+
+        @api("EditorAssetLibrary.does_directory_exist")
+        def does_directory_exist(path):
+            return path.rstrip("/") in state().directories
+
+        @api("EditorAssetLibrary.make_directory")
+        def make_directory(path):
+            state()._make_dirs(path.rstrip("/"))
+            return True
+
+        @api("EditorAssetLibrary.delete_directory")
+        def delete_directory(path):
+            s = state()
+            path = path.rstrip("/")
+            for package_name in list(s.packages_in(path, True)):
+                s.delete(package_name)
+            s.directories = {
+                d for d in s.directories
+                if d != path and not d.startswith(f"{path}/")
+            }
+            return True
+
+        @api("EditorAssetLibrary.delete_asset")
+        def delete_asset(path):
+            return state().delete(to_package_name(path))
+
+        @api("EditorAssetLibrary.rename_asset")
+        def rename_asset(source, destination):
+            return state().rename(source, destination)
+
+        @api("EditorAssetLibrary.list_assets")
+        def list_assets(path, recursive=True, include_folder=False):
+            s = state()
+            path = path.rstrip("/")
+            output = [
+                f"{p}.{posixpath.basename(p)}"
+                for p in sorted(s.packages_in(path, recursive))
+            ]
+            if include_folder:
+                prefix = f"{path}/"
+                output.extend(
+                    f"{d}/" for d in sorted(s.directories)
+                    if d.startswith(prefix) and (
+                        recursive or "/" not in d[len(prefix):])
+                )
+            return output
+
+        @api("EditorAssetLibrary.save_asset")
+        def save_asset(path, only_if_is_dirty=True):
+            s = state()
+            package_name = to_package_name(path)
+            if only_if_is_dirty and package_name not in s.dirty:
+                return True
+            return s.save(package_name)
+
+        @api("EditorAssetLibrary.save_loaded_assets")
+        def save_loaded_assets(assets, only_if_is_dirty=True):
+            s = state()
+            for asset in assets:
+                package_name = asset._package
+                if only_if_is_dirty and package_name not in s.dirty:
+                    continue
+                s.save(package_name)
+            return True
+
+        @api("EditorAssetLibrary.save_directory")
+        def save_directory(path, only_if_is_dirty=True, recursive=True):
+            s = state()
+            for package_name in list(s.packages_in(path, recursive)):
+                if only_if_is_dirty and package_name not in s.dirty:
+                    continue
+                s.save(package_name)
+            return True
+
+        @api("EditorAssetLibrary.set_metadata_tag")
+        def set_metadata_tag(obj, tag, value):
+            obj._metadata[str(tag)] = str(value)
+            if obj._package:
+                state().dirty.add(obj._package)
+
+        @api("EditorAssetLibrary.get_metadata_tag")
+        def get_metadata_tag(obj, tag):
+            return obj._metadata.get(str(tag), "")
+
+        @api("EditorAssetLibrary.get_metadata_tag_values")
+        def get_metadata_tag_values(obj):
+            return {Name(k): v for k, v in obj._metadata.items()}
+
+        @api("EditorAssetLibrary.remove_metadata_tag")
+        def remove_metadata_tag(obj, tag):
+            obj._metadata.pop(str(tag), None)
+
+    ns["EditorAssetLibrary"] = EditorAssetLibrary
+    ns["load_asset"] = EditorAssetLibrary.load_asset
+
+    class Package(Object):
+        """Simulated `unreal.Package`, its name is the package name."""
+
+    class EditorLoadingAndSavingUtils:
+        @api("EditorLoadingAndSavingUtils.get_dirty_content_packages")
+        def get_dirty_content_packages():
+            return [
+                Package(name=package_name)
+                for package_name in sorted(state().dirty)
+            ]
+
+        @api("EditorLoadingAndSavingUtils.save_packages")
+        def save_packages(packages, only_dirty):
+            s = state()
+            for package in packages:
+                package_name = package.get_name()
+                if only_dirty and package_name not in s.dirty:
+                    continue
+                s.save(package_name)
+            return True
+
+    ns["Package"] = Package
+    ns["EditorLoadingAndSavingUtils"] = EditorLoadingAndSavingUtils
+
+    class Paths:
+        @api("Paths.project_content_dir")
+        def project_content_dir():
+            return state().content_dir + "/"
+
+        @api("Paths.project_saved_dir")
+        def project_saved_dir():
+            return state().saved_dir + "/"
+
+        @api("Paths.project_dir")
+        def project_dir():
+            return state().project_dir + "/"
+
+        @api("Paths.convert_relative_path_to_full")
+        def convert_relative_path_to_full(path):
+            return os.path.abspath(path) + ("/" if path.endswith("/") else "")
+
+        @api("Paths.split")
+        def split(path):
+            directory, filename = posixpath.split(path)
+            name, _, extension = filename.partition(".")
+            return directory, name, extension
+
+        @api("Paths.get_path")
+        def get_path(path):
+            return posixpath.dirname(path)
+
+        @api("Paths.get_base_filename")
+        def get_base_filename(path):
+            return posixpath.basename(path).split(".")[0]
+
+    class SystemLibrary:
+        @api("SystemLibrary.get_system_path")
+        def get_system_path(obj):
+            return state().package_file(obj._package)
+
+        @api("SystemLibrary.execute_console_command")
+        def execute_console_command(*_args):
+            return None
+
+        @api("SystemLibrary.get_command_line")
+        def get_command_line():
+            return state().command_line
+
+    ns.update({"Paths": Paths, "SystemLibrary": SystemLibrary})
+
+    # Asset tools and import
+    class AssetImportTask(Object):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.options = None
+            self._props.setdefault("imported_object_paths", [])
+
+    def _resolve_import_class(task):
+        options = task.options
+        if options is not None:
+            mesh_type = options.get_editor_property("mesh_type_to_import")
+            if mesh_type is not None and "ANIMATION" in str(mesh_type):
+                return ns["AnimSequence"]
+            if options.get_editor_property("import_as_skeletal"):
+                return ns["SkeletalMesh"]
+            if "Abc" in type(options).__name__:
+                return ns["GeometryCache"]
+        filename = str(task.get_editor_property("filename") or "")
+        if filename.lower().endswith((".png", ".jpg", ".exr", ".tga")):
+            return ns["Texture2D"]
+        return ns["StaticMesh"]
+
+    class AssetTools:
+        @api("AssetTools.import_asset_tasks")
+        def import_asset_tasks(tasks):
+            s = state()
+            for task in tasks:
+                if task is None:
+                    continue
+                s.imports.append(task)
+                filename = str(task.get_editor_property("filename") or "")
+                name = task.get_editor_property("destination_name") or (
+                    posixpath.splitext(posixpath.basename(filename))[0])
+                package_name = (
+                    f"{task.get_editor_property('destination_path')}/{name}")
+                asset = s.add_asset(
+                    package_name, _resolve_import_class(task),
+                    saved=bool(task.get_editor_property("save")))
+                asset._props["asset_import_data"] = ns[
+                    "AssetImportData"](filename=filename)
+                task.set_editor_property(
+                    "imported_object_paths", [asset.get_path_name()])
+
+        @api("AssetTools.create_asset")
+        def create_asset(asset_name, package_path, asset_class=None,
+                         factory=None):
+            cls = asset_class
+            if cls is None and factory is not None:
+                cls = ns[_FACTORY_CLASSES.get(
+                    type(factory).__name__, "Object")]
+            return state().add_asset(
+                f"{package_path}/{asset_name}", cls or Object)
+
+        @api("AssetTools.create_unique_asset_name")
+        def create_unique_asset_name(base_package_name, suffix=""):
+            s = state()
+            candidate = f"{base_package_name}{suffix}"
+            index = 1
+            while candidate in s.assets or candidate in s.directories:
+                candidate = f"{base_package_name}{suffix}_{index}"
+                index += 1
+            return candidate, posixpath.basename(candidate)
+
+    asset_tools = AssetTools()
+
+    class AssetToolsHelpers:
+        def __init__(self):
+            pass
+
+        @api("AssetToolsHelpers.get_asset_tools")
+        def get_asset_tools():
+            return asset_tools
+
+    class AssetImportData(Object):
+        def get_first_filename(self):
+            return self._props.get("filename", "")
+
+        def scripted_add_filename(self, filename, index, source_file_label):
+            self._props["filename"] = filename
+
+    ns.update({
+        "AssetImportTask": AssetImportTask,
+        "AssetImportData": AssetImportData,
+        "AssetTools": AssetTools,
+        "AssetToolsHelpers": AssetToolsHelpers,
+    })
+
+    # Levels and actors
+    def _actor_for(obj):
+        class_name = type(obj).__name__
+        if class_name == "SkeletalMesh":
+            actor = ns["SkeletalMeshActor"](name=obj.get_name())
+            component = ns["SkeletalMeshComponent"](
+                skeletal_mesh=obj, outer=actor)
+            actor._props["skeletal_mesh_component"] = component
+        elif class_name == "GeometryCache":
+            actor = generic_class("GeometryCacheActor")(name=obj.get_name())
+            component = ns["GeometryCacheComponent"](
+                geometry_cache=obj, outer=actor)
+            actor._props["geometry_cache_component"] = component
+        else:
+            actor = ns["StaticMeshActor"](name=obj.get_name())
+            component = ns["StaticMeshComponent"](
+                static_mesh=obj, outer=actor)
+            actor._props["static_mesh_component"] = component
+        actor._components.append(component)
+        return actor
+
+    class EditorLevelLibrary:
+        @api("EditorLevelLibrary.get_all_level_actors")
+        def get_all_level_actors():
+            return list(state().actors)
+
+        @api("EditorLevelLibrary.spawn_actor_from_object")
+        def spawn_actor_from_object(obj, location=None, *_args):
+            s = state()
+            actor = _actor_for(obj)
+            base_name = actor._name
+            actor._name = f"{base_name}_{len(s.actors)}"
+            actor._label = actor._name
+            actor._outer = s.current_level
+            if location is not None:
+                actor._transform.translation = location
+            s.actors.append(actor)
+            return actor
+
+        @api("EditorLevelLibrary.destroy_actor")
+        def destroy_actor(actor):
+            s = state()
+            if actor in s.actors:
+                s.actors.remove(actor)
+            return True
+
+        @api("EditorLevelLibrary.get_editor_world")
+        def get_editor_world():
+            s = state()
+            if s.current_level is None:
+                s.current_level = ns["World"](name="Untitled")
+            return s.current_level
+
+        @api("EditorLevelLibrary.new_level")
+        def new_level(path):
+            s = state()
+            s.current_level = s.add_asset(path, ns["World"], saved=True)
+            s.actors = []
+            return True
+
+        @api("EditorLevelLibrary.load_level")
+        def load_level(path):
+            s = state()
+            s.current_level = s.load(to_package_name(path))
+            return s.current_level is not None
+
+        @api("EditorLevelLibrary.save_current_level")
+        def save_current_level():
+            s = state()
+            if s.current_level is not None and s.current_level._package:
+                s.save(s.current_level._package)
+            return True
+
+        @api("EditorLevelLibrary.save_all_dirty_levels")
+        def save_all_dirty_levels():
+            return EditorLevelLibrary.save_current_level()
+
+        @api("EditorLevelLibrary.get_actor_reference")
+        def get_actor_reference(path):
+            name = path.split(".")[-1]
+            return next(
+                (a for a in state().actors if a.get_name() == name), None)
+
+    class EditorActorSubsystem:
+        @api("EditorActorSubsystem.get_all_level_actors")
+        def get_all_level_actors():
+            return list(state().actors)
+
+        @api("EditorActorSubsystem.get_all_level_actors_components")
+        def get_all_level_actors_components():
+            return [c for a in state().actors for c in a._components]
+
+        @api("EditorActorSubsystem.get_selected_level_actors")
+        def get_selected_level_actors():
+            return list(state().selected_actors)
+
+        @api("EditorActorSubsystem.select_nothing")
+        def select_nothing():
+            state().selected_actors = []
+
+        @api("EditorActorSubsystem.set_actor_selection_state")
+        def set_actor_selection_state(actor, selected):
+            s = state()
+            if selected and actor not in s.selected_actors:
+                s.selected_actors.append(actor)
+            elif not selected and actor in s.selected_actors:
+                s.selected_actors.remove(actor)
+
+    class LevelEditorSubsystem:
+        @api("LevelEditorSubsystem.get_current_level")
+        def get_current_level():
+            # persistent level, its outer is the world
+            world = EditorLevelLibrary.get_editor_world()
+            return generic_class("Level")(name="PersistentLevel", outer=world)
+
+    class UnrealEditorSubsystem:
+        @api("UnrealEditorSubsystem.get_editor_world")
+        def get_editor_world():
+            return EditorLevelLibrary.get_editor_world()
+
+    class EditorUtilityLibrary:
+        @api("EditorUtilityLibrary.get_selected_assets")
+        def get_selected_assets():
+            return list(state().selected_assets)
+
+    class MoviePipelinePIEExecutor(Object):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.on_executor_finished_delegate = Delegate()
+            self.on_individual_job_finished_delegate = Delegate()
+
+        def execute(self, queue):
+            module.calls["MoviePipelinePIEExecutor.execute"] += 1
+            state().render_queues.append(queue)
+
+    ns.update({
+        "EditorUtilityLibrary": EditorUtilityLibrary,
+        "MoviePipelinePIEExecutor": MoviePipelinePIEExecutor,
+        "EditorLevelLibrary": EditorLevelLibrary,
+        "EditorActorSubsystem": EditorActorSubsystem,
+        "LevelEditorSubsystem": LevelEditorSubsystem,
+        "UnrealEditorSubsystem": UnrealEditorSubsystem,
+    })
+    return ns